@@ -0,0 +1,62 @@
+"""
+Бенчмарк валидации ответов /objects/{id} через ObjectSchema.
+
+Сравнивает прежний путь (response.json() и ObjectSchema(**dict)) с валидацией
+напрямую из байтов через models.validation.validate_json.
+
+Запуск: python -m benchmarks.bench_object_validation
+"""
+import json
+import time
+
+from models.object import ObjectSchema
+from models.validation import validate_json
+from benchmarks.payloads import object_payloads
+
+
+PAYLOADS_COUNT = 10_000
+
+
+def legacy_path(payloads: list[bytes]):
+    """Разбор JSON в словарь и распаковка в именованные аргументы."""
+    for raw in payloads:
+        ObjectSchema(**json.loads(raw))
+
+
+def current_path(payloads: list[bytes]):
+    """Валидация из байтов без промежуточного словаря."""
+    for raw in payloads:
+        validate_json(ObjectSchema, raw)
+
+
+def measure(func, payloads: list[bytes], repeat: int = 3) -> float:
+    """Возвращает лучшее время обработки всех payloads в миллисекундах."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(payloads)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def run(count: int = PAYLOADS_COUNT) -> dict:
+    """Измеряет время валидации count ответов обоими способами."""
+    payloads = object_payloads(count)
+    return {
+        "payloads": count,
+        "legacy_ms": measure(legacy_path, payloads),
+        "current_ms": measure(current_path, payloads)
+    }
+
+
+def main():
+    result = run()
+    speedup = result["legacy_ms"] / result["current_ms"]
+    print(f"Ответов: {result['payloads']}")
+    print(f"  json + ObjectSchema(**dict): {result['legacy_ms']:.1f} мс")
+    print(f"  validate_json(ObjectSchema): {result['current_ms']:.1f} мс")
+    print(f"  ускорение: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Бенчмарк валидации ObjectsSchema.objectIDs в зависимости от длины списка.
+
+Сравнивает прежний путь (цикл isinstance в валидаторе mode="before" и повторная
+проверка list[int] средствами pydantic) с текущими ObjectsSchema и
+CompactObjectsSchema. Ускорение считается относительно прежнего пути как есть.
+Текущие валидаторы дополнительно проверяют уникальность ID: для упорядоченных
+ответов /objects - проверкой строгого возрастания без построения множества,
+поэтому они не медленнее прежнего пути и на 500 тыс. ID. Столбец unsorted -
+тот же список в обратном порядке (как у неупорядоченных ответов /search), для
+него уникальность проверяется множеством; для сравнения с той же проверкой
+приведен вариант legacy+uniq. CompactObjectsSchema дополнительно выигрывает
+в памяти (4 байта на ID вместо объекта int в списке) - последние столбцы.
+
+Запуск: python -m benchmarks.bench_objectids_validation
+"""
+import timeit
+
+from typing_extensions import Annotated
+from pydantic import BaseModel, Field, field_validator
+
+from models.objects import ObjectsSchema, CompactObjectsSchema
+
+
+SIZES = (1_000, 10_000, 100_000, 500_000)
+
+
+class LegacyObjectsSchema(BaseModel):
+    """ObjectsSchema в исходном виде: каждый ID проверяется дважды."""
+
+    total: Annotated[int, Field(ge=0)]
+    objectIDs: Annotated[list[int], Field()]
+
+    @field_validator("objectIDs", mode="before")
+    def check_objectids(cls, value):
+        if not isinstance(value, list):
+            raise TypeError("objectIDs должно быть списком")
+
+        for el in value:
+            if not isinstance(el, int):
+                raise TypeError("Все элементы в objectIDs должны быть целочисленными")
+
+        return value
+
+
+class LegacyUniqueObjectsSchema(LegacyObjectsSchema):
+    """Прежний путь с добавленной проверкой уникальности ID."""
+
+    @field_validator("objectIDs", mode="after")
+    def check_unique(cls, value):
+        if len(set(value)) != len(value):
+            raise ValueError("Элементы objectIDs не должны повторяться")
+        return value
+
+
+def make_payload(size: int) -> dict:
+    """Формирует ответ /objects с упорядоченными уникальными ID, как у реального API."""
+    return {"total": size, "objectIDs": list(range(1, size + 1))}
+
+
+def measure(model, payload: dict, repeat: int = 5) -> float:
+    """Возвращает лучшее время валидации payload в миллисекундах."""
+    number = max(1, 100_000 // len(payload["objectIDs"]))
+    timer = timeit.Timer(lambda: model(**payload))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1000
+
+
+def run(sizes=SIZES) -> list[dict]:
+    """Измеряет время валидации и память objectIDs для каждой длины списка."""
+    results = []
+
+    for size in sizes:
+        payload = make_payload(size)
+        results.append({
+            "size": size,
+            "legacy_ms": measure(LegacyObjectsSchema, payload),
+            "legacy_unique_ms": measure(LegacyUniqueObjectsSchema, payload),
+            "current_ms": measure(ObjectsSchema, payload),
+            "compact_ms": measure(CompactObjectsSchema, payload),
+            "unsorted_ms": measure(ObjectsSchema, {**payload, "objectIDs": payload["objectIDs"][::-1]}),
+            "list_kb": ObjectsSchema(**payload).memory_usage() / 1024,
+            "compact_kb": CompactObjectsSchema(**payload).memory_usage() / 1024
+        })
+
+    return results
+
+
+def main():
+    header = ("ID", "legacy, мс", "legacy+uniq, мс", "current, мс", "compact, мс", "unsorted, мс",
+              "current/legacy", "compact/legacy", "list, КБ", "compact, КБ")
+    print("".join(f"{title:>16}" for title in header))
+
+    for row in run():
+        # Больше 1 - быстрее прежнего пути, меньше 1 - медленнее
+        current_speedup = row["legacy_ms"] / row["current_ms"]
+        compact_speedup = row["legacy_ms"] / row["compact_ms"]
+        print(f"{row['size']:>16} {row['legacy_ms']:>15.3f} {row['legacy_unique_ms']:>15.3f} "
+              f"{row['current_ms']:>15.3f} {row['compact_ms']:>15.3f} {row['unsorted_ms']:>15.3f} "
+              f"{current_speedup:>15.2f}x {compact_speedup:>15.2f}x {row['list_kb']:>15.0f} {row['compact_kb']:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Наборы данных для бенчмарков без обращения к API.
+
+Ответы берутся из кассет, записанных в режиме pytest --api-mode=record.
+Если записанных ответов не хватает, набор дополняется вариациями
+образца benchmarks/data/object_sample.json.
+"""
+import json
+
+from pathlib import Path
+
+from config import settings
+from client.cassette import CassetteStore
+
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def load_recorded(path_fragment: str, cassette_dir: str = settings.CASSETTE_DIR) -> list[bytes]:
+    """
+    Возвращает тела записанных ответов со статусом 200, путь которых содержит фрагмент.
+
+    Args:
+        path_fragment: Фрагмент пути URL (например, "/objects/")
+        cassette_dir: Директория с кассетами
+    """
+    store = CassetteStore(cassette_dir).load()
+    return [cassette.body for key, cassette in store.items()
+            if path_fragment in key and cassette.status == 200]
+
+
+def object_payloads(count: int) -> list[bytes]:
+    """
+    Возвращает count тел ответов /objects/{id}.
+
+    Args:
+        count: Требуемое количество ответов
+    """
+    recorded = [body for body in load_recorded("/objects/") if body.startswith(b"{")]
+    sample = json.loads((DATA_DIR / "object_sample.json").read_text(encoding="utf-8"))
+
+    payloads = recorded[:count]
+    for index in range(count - len(payloads)):
+        record = dict(sample)
+        record["objectID"] = sample["objectID"] + index
+        record["objectBeginDate"] = 1800 + index % 200
+        record["objectEndDate"] = record["objectBeginDate"] + index % 5
+        record["title"] = f"{sample['title']} #{index}"
+        payloads.append(json.dumps(record).encode("utf-8"))
+
+    return payloads
+
+
+def objects_payload(size: int) -> bytes:
+    """
+    Возвращает тело ответа /objects со списком из size ID.
+
+    Если записан полный ответ /objects, используется префикс его списка
+    (реальное распределение ID), иначе - упорядоченные ID подряд.
+
+    Args:
+        size: Количество ID в списке
+    """
+    recorded = [json.loads(body) for body in load_recorded("/objects") if body.startswith(b'{"total"')]
+    object_ids = max((data.get("objectIDs") or [] for data in recorded), key=len, default=[])
+
+    if len(object_ids) < size:
+        object_ids = list(range(1, size + 1))
+
+    return json.dumps({"total": size, "objectIDs": object_ids[:size]}).encode("utf-8")
+
+
+def departments_payload() -> bytes:
+    """Возвращает тело ответа /departments (записанное или образец из benchmarks/data)."""
+    recorded = [body for body in load_recorded("/departments") if body.startswith(b"{")]
+    if recorded:
+        return recorded[0]
+    return (DATA_DIR / "departments_sample.json").read_bytes()
@@ -0,0 +1,272 @@
+"""
+Набор бенчмарков моделей и построителя URL без обращения к API.
+
+Результаты сохраняются в JSON и сравниваются с сохраненным базовым прогоном:
+
+    python -m benchmarks.suite                  # прогон и сравнение с базовым
+    python -m benchmarks.suite --save-baseline  # сохранить результаты как базовые
+    python -m benchmarks.suite --only objects   # только бенчмарки с подстрокой в имени
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+import pydantic
+import requests
+
+from models.departments import DepartmentsSchema
+from models.lazy import LazyObjectSchema
+from models.object import ObjectSchema
+from models.objects import ObjectsSchema
+from models.validation import validate_json
+from benchmarks.payloads import departments_payload, object_payloads, objects_payload
+from client import urls
+from client.payload import APIResponse
+from tests.src.API_param_builder import APIBuilder
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Размер пачки записей ObjectSchema
+BATCH_SIZE = 1_000
+
+# Наборы параметров, характерные для параметризованных тестов
+URL_PARAMS = (
+    ("https://collectionapi.metmuseum.org/public/collection/v1/search", {"q": "sunflowers"}),
+    ("https://collectionapi.metmuseum.org/public/collection/v1/search", {"q": "art", "isHighlight": True}),
+    ("https://collectionapi.metmuseum.org/public/collection/v1/search",
+     {"q": "renaissance", "dateBegin": 1400, "dateEnd": 1600}),
+    ("https://collectionapi.metmuseum.org/public/collection/v1/search", {"q": "paris", "geoLocation": "France"}),
+    ("https://collectionapi.metmuseum.org/public/collection/v1/objects",
+     {"metadataDate": "2018-10-22", "departmentIds": "3|9|12"}),
+    ("https://collectionapi.metmuseum.org/public/collection/v1/objects", {"departmentIds": 1, "metadataDate": None}),
+)
+
+
+@dataclass
+class Benchmark:
+    """Бенчмарк: подготовка данных и измеряемая функция."""
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    # Количество элементов, обрабатываемых одним вызовом (для расчета пропускной способности)
+    items: int = 1
+
+
+def _objects_schema(size: int) -> Callable[[], Callable[[], object]]:
+    def setup():
+        data = json.loads(objects_payload(size))
+        return lambda: ObjectsSchema(**data)
+    return setup
+
+
+def _object_single():
+    raw = object_payloads(1)[0]
+    return lambda: validate_json(ObjectSchema, raw)
+
+
+def _object_batch():
+    raw = b"[" + b",".join(object_payloads(BATCH_SIZE)) + b"]"
+    return lambda: validate_json(list[ObjectSchema], raw)
+
+
+def _object_lazy_projection():
+    records = object_payloads(BATCH_SIZE)
+    view = LazyObjectSchema.project("objectID", "department", "isPublicDomain")
+
+    def run():
+        for raw in records:
+            obj = view(raw)
+            obj.objectID, obj.department, obj.isPublicDomain
+    return run
+
+
+def _response_json(response_class: type) -> Callable[[], Callable[[], object]]:
+    def setup():
+        raw = objects_payload(100_000)
+
+        def run():
+            # Ответ используется тремя тестами, каждый вызывает json()
+            response = response_class()
+            response._content = raw
+            response.encoding = "utf-8"
+            for _ in range(3):
+                response.json()
+        return run
+    return setup
+
+
+def _departments():
+    data = json.loads(departments_payload())
+    return lambda: DepartmentsSchema(**data)
+
+
+def _build_url():
+    def run():
+        # Построенные URL кэшируются: без сброса кэша замерялся бы только поиск в словаре
+        urls._build_url.cache_clear()
+        for endpoint, params in URL_PARAMS:
+            APIBuilder.build_url(endpoint, **params)
+    return run
+
+
+def _build_url_cached():
+    def run():
+        for endpoint, params in URL_PARAMS:
+            APIBuilder.build_url(endpoint, **params)
+    return run
+
+
+BENCHMARKS = (
+    Benchmark("objects_schema_1k", _objects_schema(1_000), 1_000),
+    Benchmark("objects_schema_100k", _objects_schema(100_000), 100_000),
+    Benchmark("objects_schema_500k", _objects_schema(500_000), 500_000),
+    Benchmark("object_schema_single", _object_single),
+    Benchmark("object_schema_batch", _object_batch, BATCH_SIZE),
+    Benchmark("object_lazy_projection", _object_lazy_projection, BATCH_SIZE),
+    Benchmark("response_json_100k_x3", _response_json(requests.Response)),
+    Benchmark("api_response_json_100k_x3", _response_json(APIResponse)),
+    Benchmark("departments_schema", _departments),
+    Benchmark("build_url", _build_url, len(URL_PARAMS)),
+    Benchmark("build_url_cached", _build_url_cached, len(URL_PARAMS)),
+)
+
+
+def measure(func: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> dict:
+    """
+    Измеряет время вызова функции.
+
+    Количество вызовов в серии подбирается так, чтобы серия длилась не менее
+    min_time секунд; из repeat серий берутся минимум и медиана.
+
+    Returns:
+        Словарь min_ms, median_ms (время одного вызова) и number (вызовов в серии)
+    """
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(int(number * min_time / max(elapsed, 1e-9)), 1)
+
+    timings = [t / number * 1000 for t in timer.repeat(repeat=repeat, number=number)]
+    return {"min_ms": min(timings), "median_ms": statistics.median(timings), "number": number}
+
+
+def run(benchmarks=BENCHMARKS, only: Optional[str] = None, repeat: int = 5) -> dict:
+    """
+    Выполняет бенчмарки.
+
+    Args:
+        benchmarks: Набор бенчмарков
+        only: Выполнять только бенчмарки, имя которых содержит подстроку
+        repeat: Количество серий измерений
+
+    Returns:
+        Результаты с описанием окружения
+    """
+    results = {}
+
+    for benchmark in benchmarks:
+        if only and only not in benchmark.name:
+            continue
+
+        stats = measure(benchmark.setup(), repeat=repeat)
+        stats["items_per_sec"] = benchmark.items / stats["min_ms"] * 1000
+        results[benchmark.name] = stats
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pydantic": pydantic.VERSION,
+        "machine": platform.machine(),
+        "results": results
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """
+    Сравнивает результаты с базовыми по минимальному времени вызова.
+
+    Args:
+        current: Результаты текущего прогона
+        baseline: Базовые результаты
+        tolerance: Допустимое замедление (0.1 - на 10%)
+
+    Returns:
+        Строки сравнения: name, baseline_ms, current_ms, ratio, regression
+    """
+    rows = []
+
+    for name, stats in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = stats["min_ms"] / base["min_ms"]
+        rows.append({
+            "name": name,
+            "baseline_ms": base["min_ms"],
+            "current_ms": stats["min_ms"],
+            "ratio": ratio,
+            "regression": ratio > 1 + tolerance
+        })
+
+    return rows
+
+
+def save(results: dict, path: Path):
+    """Сохраняет результаты в JSON файл."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки моделей и построителя URL")
+    parser.add_argument("--only", help="выполнять только бенчмарки, имя которых содержит подстроку")
+    parser.add_argument("--repeat", type=int, default=5, help="количество серий измерений")
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR / "latest.json", help="файл результатов")
+    parser.add_argument("--baseline", type=Path, default=RESULTS_DIR / "baseline.json", help="файл базовых результатов")
+    parser.add_argument("--save-baseline", action="store_true", help="сохранить результаты как базовые")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="допустимое замедление относительно базовых")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = run(only=args.only, repeat=args.repeat)
+    save(results, args.output)
+
+    print(f"Python {results['python']}, pydantic {results['pydantic']}, "
+          f"время прогона: {time.perf_counter() - started:.1f} сек.")
+    print(f"{'бенчмарк':<24}{'min, мс':>12}{'median, мс':>12}{'элементов/сек':>16}")
+    for name, stats in results["results"].items():
+        print(f"{name:<24}{stats['min_ms']:>12.4f}{stats['median_ms']:>12.4f}{stats['items_per_sec']:>16.0f}")
+
+    if args.save_baseline:
+        save(results, args.baseline)
+        print(f"Базовые результаты сохранены: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"Базовые результаты не найдены: {args.baseline} (сохраняются опцией --save-baseline)")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    rows = compare(results, baseline, args.tolerance)
+
+    print(f"\nСравнение с базовыми (pydantic {baseline.get('pydantic')}, допуск {args.tolerance:.0%}):")
+    print(f"{'бенчмарк':<24}{'базовый, мс':>12}{'текущий, мс':>12}{'отношение':>11}")
+    for row in rows:
+        mark = "  РЕГРЕССИЯ" if row["regression"] else ""
+        print(f"{row['name']:<24}{row['baseline_ms']:>12.4f}{row['current_ms']:>12.4f}{row['ratio']:>10.2f}x{mark}")
+
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
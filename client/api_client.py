@@ -0,0 +1,255 @@
+import time
+import requests
+
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from config import settings
+from config.logger import TelemetryLogger
+from client.cache import ResponseCache
+from client.cassette import CassetteStore
+from client.disk_cache import DiskCache
+from client.rate_limit import AdaptiveRateLimiter, CircuitOpenError, EndpointCircuitBreakers, parse_retry_after
+from client.session import APISession
+from client.shared import SharedResponseStore
+from client.singleflight import SingleFlight
+from client.telemetry import build_event, endpoint_of, pop_connect_timings, reset_connect_timings
+
+
+class APIClient:
+    """
+    Клиент для выполнения GET запросов к API с кэшированием ответов.
+
+    Один экземпляр используется всеми тестовыми классами, поэтому каждый
+    уникальный URL запрашивается из сети один раз за прогон, а соединения
+    с API переиспользуются через общий пул. Одновременные запросы одного
+    URL объединяются в один сетевой запрос, а при параллельном запуске -
+    и запросы разных процессов-исполнителей.
+    """
+
+    def __init__(self, cache: Optional[ResponseCache] = None, session: Optional[APISession] = None,
+                 telemetry: Optional[TelemetryLogger] = None, disk_cache: Optional[DiskCache] = None,
+                 shared: Optional[SharedResponseStore] = None, limiter: Optional[AdaptiveRateLimiter] = None,
+                 breakers: Optional[EndpointCircuitBreakers] = None):
+        """
+        Инициализирует клиент.
+
+        Args:
+            cache: Кэш ответов (по умолчанию создается по настройкам из config.settings)
+            session: HTTP-сессия с пулом соединений (по умолчанию создается по настройкам)
+            telemetry: Канал телеметрии запросов (по умолчанию создается, если включен в настройках)
+            disk_cache: Постоянный кэш ответов (по умолчанию создается, если включен в настройках)
+            shared: Общие ответы процессов-исполнителей (по умолчанию создаются,
+                если задана директория METAPI_SHARED_DIR)
+            limiter: Адаптивное ограничение частоты запросов (по умолчанию создается по настройкам)
+            breakers: Автоматы выключения эндпоинтов (по умолчанию создаются по настройкам)
+        """
+        if cache is None:
+            cache = ResponseCache(
+                ttl=settings.CACHE_TTL,
+                max_entries=settings.CACHE_MAX_ENTRIES,
+                max_bytes=settings.CACHE_MAX_BYTES
+            )
+        self.cache = cache
+
+        if session is None:
+            session = APISession(
+                pool_connections=settings.POOL_CONNECTIONS,
+                pool_maxsize=settings.POOL_MAXSIZE,
+                retry_total=settings.RETRY_TOTAL,
+                retry_backoff=settings.RETRY_BACKOFF
+            )
+        self.session = session
+
+        if telemetry is None and settings.TELEMETRY_ENABLED:
+            telemetry = TelemetryLogger(
+                max_bytes=settings.TELEMETRY_MAX_BYTES,
+                backup_count=settings.TELEMETRY_BACKUP_COUNT
+            )
+        self.telemetry = telemetry
+
+        if disk_cache is None and settings.DISK_CACHE_ENABLED:
+            disk_cache = DiskCache(settings.DISK_CACHE_DIR, settings.DISK_CACHE_MAX_BYTES)
+        self.disk_cache = disk_cache
+
+        if shared is None and settings.SHARED_DIR:
+            shared = SharedResponseStore(settings.SHARED_DIR, ttl=settings.CACHE_TTL)
+        self.shared = shared
+
+        if limiter is None and settings.RATE_LIMIT > 0:
+            limiter = AdaptiveRateLimiter(settings.RATE_LIMIT, min_rate=settings.RATE_LIMIT_MIN)
+        self.limiter = limiter
+
+        if breakers is None and settings.BREAKER_THRESHOLD > 0:
+            breakers = EndpointCircuitBreakers(settings.BREAKER_THRESHOLD, settings.BREAKER_RESET_TIMEOUT)
+        self.breakers = breakers
+
+        # Объединение одновременных запросов с одинаковым ключом
+        self.single_flight = SingleFlight()
+
+        # Хранилище для записи ответов (режим record)
+        self.recorder: Optional[CassetteStore] = None
+        # Базовый URL локального сервера-заглушки (режим replay)
+        self.replay_base_url: Optional[str] = None
+
+    def get(self, api_url: str, timeout: float = 10, use_cache: bool = True) -> requests.Response:
+        """
+        Выполняет GET запрос, возвращая ответ из кэша при его наличии.
+
+        Args:
+            api_url: URL API для запроса
+            timeout: Таймаут в секундах
+            use_cache: Использовать кэш ответов (False для массовых однократных запросов)
+
+        Returns:
+            requests.Response: Объект ответа от API
+
+        Raises:
+            requests.exceptions.RequestException: При ошибках запроса
+        """
+        if not use_cache:
+            return self._fetch(api_url, timeout, cache_status="bypass")
+
+        key = self.cache.make_key(api_url)
+
+        started = time.perf_counter()
+        response = self.cache.get(key)
+        if response is not None:
+            if self.telemetry is not None:
+                self.telemetry.event(**build_event(
+                    api_url, response.status_code, time.perf_counter() - started,
+                    size=len(response.content), cache="hit"
+                ))
+            return response
+
+        # Остальные потоки, запросившие тот же URL, дожидаются этого запроса
+        return self.single_flight.do(key, lambda: self._fetch_and_store(key, api_url, timeout))
+
+    def stream(self, api_url: str, timeout: float = 10) -> requests.Response:
+        """
+        Выполняет GET запрос в обход кэшей, не читая тело ответа.
+
+        Тело читается потребителем фрагментами через iter_content и не хранится
+        в памяти целиком, поэтому ответ не кэшируется и не записывается в кассеты.
+        После чтения ответ нужно закрыть.
+
+        Args:
+            api_url: URL API для запроса
+            timeout: Таймаут в секундах
+
+        Returns:
+            requests.Response: Ответ с непрочитанным телом
+
+        Raises:
+            requests.exceptions.RequestException: При ошибках запроса
+        """
+        return self._fetch(api_url, timeout, cache_status="stream", stream=True)
+
+    def _fetch_and_store(self, key: str, api_url: str, timeout: float) -> requests.Response:
+        """Выполняет сетевой запрос и сохраняет ответ в кэш."""
+        # В режиме replay ответы отдает локальный сервер процесса, общие ответы не нужны
+        if self.shared is not None and not self.replay_base_url:
+            response = self.shared.do(key, api_url, lambda: self._fetch_revalidated(key, api_url, timeout))
+        else:
+            response = self._fetch_revalidated(key, api_url, timeout)
+
+        self.cache.put(key, response, size=len(response.content))
+        return response
+
+    def _fetch_revalidated(self, key: str, api_url: str, timeout: float) -> requests.Response:
+        """Выполняет сетевой запрос, перепроверяя ответ из постоянного кэша."""
+        # Постоянный кэш используется только при запросах к API: в режиме record
+        # нужны полные ответы, в режиме replay ответы и так берутся с диска
+        disk_cache = self.disk_cache if self.recorder is None and not self.replay_base_url else None
+        entry = disk_cache.get(key) if disk_cache is not None else None
+
+        if entry is None:
+            response = self._fetch(api_url, timeout)
+            if disk_cache is not None:
+                disk_cache.put(key, response)
+        else:
+            response = self._fetch(api_url, timeout, cache_status="revalidate", headers=entry.conditional_headers())
+            if response.status_code == 304:
+                disk_cache.revalidated(entry, response)
+                response = entry.to_response(response)
+            else:
+                disk_cache.put(key, response)
+
+        return response
+
+    def _fetch(self, api_url: str, timeout: float, cache_status: str = "miss",
+               headers: Optional[dict] = None, stream: bool = False) -> requests.Response:
+        """Выполняет сетевой запрос с учетом режимов record и replay."""
+        request_url = self._replay_url(api_url) if self.replay_base_url else api_url
+
+        # Ограничение частоты и автоматы выключения защищают API, в режиме replay они не нужны
+        limiter = self.limiter if not self.replay_base_url else None
+        breaker = None
+        if self.breakers is not None and not self.replay_base_url:
+            breaker = self.breakers.get(endpoint_of(api_url))
+
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(
+                f"Запросы к {endpoint_of(api_url)} приостановлены после серии ошибок API "
+                f"(повтор через {breaker.retry_after():.0f} сек.)"
+            )
+        sent_at = limiter.acquire() if limiter is not None else None
+
+        reset_connect_timings()
+        started = time.perf_counter()
+        try:
+            response = self.session.get(request_url, timeout=timeout, headers=headers, stream=stream)
+        except requests.RequestException as e:
+            if breaker is not None:
+                breaker.record(None)
+            if self.telemetry is not None:
+                self.telemetry.event(**build_event(
+                    api_url, None, time.perf_counter() - started, cache=cache_status,
+                    timings=pop_connect_timings(), error=type(e).__name__
+                ))
+            raise
+        latency = time.perf_counter() - started
+        response.latency = latency
+
+        if limiter is not None:
+            limiter.on_response(response.status_code, parse_retry_after(response.headers.get("Retry-After")), sent_at)
+        if breaker is not None:
+            breaker.record(response.status_code)
+
+        # Тело потокового ответа еще не прочитано: размер неизвестен, записывать в кассету нечего
+        if stream:
+            if self.telemetry is not None:
+                self.telemetry.event(**build_event(
+                    api_url, response.status_code, latency, ttfb=response.elapsed.total_seconds(),
+                    cache=cache_status, timings=pop_connect_timings()
+                ))
+            return response
+
+        if self.telemetry is not None:
+            self.telemetry.event(**build_event(
+                api_url, response.status_code, latency, ttfb=response.elapsed.total_seconds(),
+                size=len(response.content), cache=cache_status, timings=pop_connect_timings(),
+                wire_size=response.raw.tell() if response.raw is not None else None
+            ))
+
+        if self.recorder is not None:
+            self.recorder.record(api_url, response, latency)
+
+        return response
+
+    def _replay_url(self, api_url: str) -> str:
+        """Заменяет схему и хост URL на адрес локального сервера-заглушки."""
+        base = urlsplit(self.replay_base_url)
+        parts = urlsplit(api_url)
+        return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, ""))
+
+
+_client: Optional[APIClient] = None
+
+
+def get_client() -> APIClient:
+    """Возвращает общий для всего прогона экземпляр APIClient."""
+    global _client
+    if _client is None:
+        _client = APIClient()
+    return _client
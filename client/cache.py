@@ -0,0 +1,129 @@
+import threading
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+from client.urls import request_key
+
+
+@dataclass
+class CacheStats:
+    """Счётчики работы кэша ответов."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля запросов, обслуженных из кэша."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """
+    Потокобезопасный LRU-кэш ответов API в памяти.
+
+    Записи вытесняются по времени жизни (TTL), по количеству записей
+    и по суммарному размеру тел ответов.
+    """
+
+    def __init__(self, ttl: float = 600.0, max_entries: int = 256, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Инициализирует кэш.
+
+        Args:
+            ttl: Время жизни записи в секундах (0 - без ограничения)
+            max_entries: Максимальное количество записей
+            max_bytes: Максимальный суммарный размер тел ответов в байтах
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+        self._entries: "OrderedDict[Hashable, tuple[float, int, Any]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        """
+        Формирует ключ кэша из канонического вида URL.
+
+        Args:
+            url: URL запроса
+        """
+        return request_key(url)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Возвращает значение из кэша или None, если записи нет или она устарела.
+
+        Args:
+            key: Ключ записи
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            stored_at, size, value = entry
+            if self.ttl and time.monotonic() - stored_at > self.ttl:
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, size: int = 0):
+        """
+        Сохраняет значение в кэш, вытесняя самые старые записи при переполнении.
+
+        Args:
+            key: Ключ записи
+            value: Сохраняемое значение
+            size: Размер значения в байтах
+        """
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic(), size, value)
+            self._size += size
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.stats.evictions += 1
+
+    def clear(self):
+        """Удаляет все записи из кэша."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: Hashable):
+        """Удаляет запись из кэша без блокировки."""
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Суммарный размер тел ответов в кэше."""
+        return self._size
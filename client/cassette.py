@@ -0,0 +1,153 @@
+import base64
+import gzip
+import json
+import threading
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from client.shared import FileLock
+from client.urls import request_key
+
+
+# Заголовки, которые теряют смысл после декодирования и сохранения тела
+_SKIP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+@dataclass
+class Cassette:
+    """Записанный ответ API."""
+
+    url: str
+    status: int
+    body: bytes
+    headers: dict = field(default_factory=dict)
+    latency: float = 0.0
+
+    def to_record(self) -> dict:
+        """Преобразует кассету в запись для сохранения на диск."""
+        record = {
+            "url": self.url,
+            "status": self.status,
+            "headers": self.headers,
+            "latency": round(self.latency, 4)
+        }
+        try:
+            record["body"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            record["body_b64"] = base64.b64encode(self.body).decode("ascii")
+        return record
+
+    @classmethod
+    def from_record(cls, record: dict) -> "Cassette":
+        """Восстанавливает кассету из записи на диске."""
+        if "body_b64" in record:
+            body = base64.b64decode(record["body_b64"])
+        else:
+            body = record.get("body", "").encode("utf-8")
+
+        return cls(
+            url=record["url"],
+            status=record["status"],
+            body=body,
+            headers=record.get("headers", {}),
+            latency=record.get("latency", 0.0)
+        )
+
+
+class CassetteStore:
+    """
+    Хранилище записанных ответов API.
+
+    Кассеты хранятся в одном сжатом gzip файле формата JSON Lines
+    и индексируются по пути и упорядоченным query-параметрам URL.
+    """
+
+    FILE_NAME = "metapi.jsonl.gz"
+
+    def __init__(self, cassette_dir: str):
+        """
+        Инициализирует хранилище.
+
+        Args:
+            cassette_dir: Директория с файлом кассет
+        """
+        self.cassette_dir = Path(cassette_dir)
+        self._cassettes: dict[str, Cassette] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Путь к файлу кассет."""
+        return self.cassette_dir / self.FILE_NAME
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        """
+        Формирует ключ кассеты из пути и query-параметров URL без учета хоста.
+
+        Args:
+            url: URL запроса
+        """
+        return request_key(url, with_host=False)
+
+    def record(self, url: str, response: requests.Response, latency: float):
+        """
+        Сохраняет ответ API в хранилище.
+
+        Args:
+            url: Исходный URL запроса
+            response: Ответ API
+            latency: Время выполнения запроса в секундах
+        """
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS}
+        cassette = Cassette(url, response.status_code, response.content, headers, latency)
+
+        with self._lock:
+            self._cassettes[self.make_key(url)] = cassette
+
+    def find(self, url: str) -> Optional[Cassette]:
+        """
+        Возвращает кассету для URL или None, если ответ не записан.
+
+        Args:
+            url: URL или путь запроса
+        """
+        return self._cassettes.get(self.make_key(url))
+
+    def items(self):
+        """Возвращает пары (ключ, кассета), упорядоченные по ключу."""
+        return sorted(self._cassettes.items())
+
+    def load(self) -> "CassetteStore":
+        """Загружает кассеты из файла, если он существует."""
+        if self.path.exists():
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    cassette = Cassette.from_record(json.loads(line))
+                    self._cassettes[self.make_key(cassette.url)] = cassette
+        return self
+
+    def save(self):
+        """Сохраняет все кассеты в файл, объединяя их с ранее записанными."""
+        self.cassette_dir.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            recorded = dict(self._cassettes)
+
+        # Процессы-исполнители параллельного прогона дописывают файл по очереди
+        with FileLock(self.cassette_dir / "metapi.lock"):
+            merged = CassetteStore(str(self.cassette_dir)).load()._cassettes
+            merged.update(recorded)
+
+            tmp_path = self.path.with_suffix(".tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                for key in sorted(merged):
+                    f.write(json.dumps(merged[key].to_record(), ensure_ascii=False) + "\n")
+            tmp_path.replace(self.path)
+
+    def __len__(self) -> int:
+        return len(self._cassettes)
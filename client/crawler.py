@@ -0,0 +1,311 @@
+"""
+Массовый обход объектов коллекции с валидацией через ObjectSchema.
+
+Запуск: python -m client.crawler --department-ids 1 3 --checkpoint crawl.jsonl
+"""
+import argparse
+import json
+import threading
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+from pydantic import ValidationError
+from requests.exceptions import RequestException
+
+from config import settings
+from client.api_client import APIClient, get_client
+from client.rate_limit import AdaptiveRateLimiter
+from client.streaming import ObjectIDsStreamParser, CHUNK_SIZE
+from client.urls import build_url
+from models.object import ObjectSchema
+from models.objects import ObjectIDArray
+from models.validation import validate_json
+
+
+# Статусы проверки объекта
+STATUS_OK = "ok"
+STATUS_INVALID = "invalid"
+STATUS_NOT_FOUND = "not_found"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class CrawlResult:
+    """Результат проверки одного объекта."""
+
+    object_id: int
+    status: str
+    http_status: Optional[int] = None
+    errors: list[str] = field(default_factory=list)
+    metadata_date: Optional[str] = None
+    # Тело ответа прошедшего проверку объекта (если обходчик сохраняет ответы)
+    payload: Optional[bytes] = field(default=None, repr=False)
+
+    def to_record(self) -> dict:
+        """Преобразует результат в запись контрольной точки."""
+        return {
+            "id": self.object_id,
+            "status": self.status,
+            "http_status": self.http_status,
+            "errors": self.errors,
+            "metadataDate": self.metadata_date
+        }
+
+    @classmethod
+    def from_record(cls, record: dict) -> "CrawlResult":
+        """Восстанавливает результат из записи контрольной точки."""
+        return cls(
+            object_id=record["id"],
+            status=record["status"],
+            http_status=record.get("http_status"),
+            errors=record.get("errors", []),
+            metadata_date=record.get("metadataDate")
+        )
+
+
+@dataclass
+class CrawlReport:
+    """Сводка по обходу."""
+
+    total: int = 0
+    skipped: int = 0
+    counts: dict = field(default_factory=dict)
+
+    def add(self, result: CrawlResult):
+        """Учитывает результат проверки объекта."""
+        self.counts[result.status] = self.counts.get(result.status, 0) + 1
+
+
+class Checkpoint:
+    """
+    Контрольная точка обхода в формате JSON Lines.
+
+    Каждый проверенный объект дописывается отдельной строкой, поэтому после
+    прерывания обход продолжается с непроверенных объектов. Объекты со статусом
+    error (сетевые ошибки, 5xx) при возобновлении проверяются повторно.
+    """
+
+    def __init__(self, path: str, flush_every: int = 100):
+        """
+        Инициализирует контрольную точку.
+
+        Args:
+            path: Путь к файлу контрольной точки
+            flush_every: Количество записей между сбросами буфера на диск
+        """
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self._file = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[int, CrawlResult]:
+        """Возвращает последние результаты по каждому объекту из файла."""
+        results = {}
+        if not self.path.exists():
+            return results
+
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    result = CrawlResult.from_record(json.loads(line))
+                except (ValueError, KeyError):
+                    # Последняя строка могла быть записана не полностью
+                    continue
+                results[result.object_id] = result
+
+        return results
+
+    def append(self, result: CrawlResult):
+        """Дописывает результат проверки объекта."""
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+
+            self._file.write(json.dumps(result.to_record(), ensure_ascii=False) + "\n")
+            self._pending += 1
+
+            if self._pending >= self.flush_every:
+                self._file.flush()
+                self._pending = 0
+
+    def close(self):
+        """Сбрасывает буфер и закрывает файл."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ObjectCrawler:
+    """
+    Обходчик объектов коллекции.
+
+    Получает список objectIDs из /objects (с фильтрами departmentIds и metadataDate),
+    параллельно запрашивает /objects/{id} пулом потоков и проверяет каждую
+    запись через ObjectSchema. Частота запросов ограничивается адаптивным
+    ограничителем клиента, максимальная частота которого задается rate.
+    """
+
+    def __init__(self, client: Optional[APIClient] = None, base_url: str = settings.API_BASE_URL,
+                 workers: int = settings.CRAWL_WORKERS, rate: float = settings.CRAWL_RATE,
+                 timeout: float = 10, keep_payload: bool = False):
+        """
+        Инициализирует обходчик.
+
+        Args:
+            client: Клиент API (по умолчанию общий экземпляр)
+            base_url: Базовый URL API коллекции
+            workers: Количество потоков
+            rate: Максимальное количество запросов в секунду (0 - ограничение клиента не меняется)
+            timeout: Таймаут одного запроса в секундах
+            keep_payload: Сохранять тело ответа в результатах успешной проверки
+        """
+        self.client = client or get_client()
+        self.base_url = base_url.rstrip("/")
+        self.workers = workers
+        self.timeout = timeout
+        self.keep_payload = keep_payload
+
+        if rate > 0:
+            if self.client.limiter is None:
+                self.client.limiter = AdaptiveRateLimiter(rate, min_rate=settings.RATE_LIMIT_MIN)
+            else:
+                self.client.limiter.set_rate(rate)
+
+    def collect_ids(self, department_ids: Optional[Iterable[int]] = None,
+                    metadata_date: Optional[str] = None) -> ObjectIDArray:
+        """
+        Получает ID объектов из /objects.
+
+        Args:
+            department_ids: ID отделов для фильтрации
+            metadata_date: Дата в формате YYYY-MM-DD, начиная с которой обновлялись объекты
+
+        Returns:
+            ObjectIDArray: Компактный массив ID
+        """
+        url = build_url(
+            f"{self.base_url}/objects",
+            departmentIds=list(department_ids) if department_ids else None,
+            metadataDate=metadata_date or None
+        )
+
+        # Список ID читается из сети фрагментами и сразу упаковывается в массив
+        with self.client.stream(url, timeout=max(self.timeout, 60)) as response:
+            response.raise_for_status()
+            parser = ObjectIDsStreamParser()
+            return ObjectIDArray(parser.iter_object_ids(response.iter_content(chunk_size=CHUNK_SIZE)))
+
+    def check_object(self, object_id: int) -> CrawlResult:
+        """
+        Запрашивает объект и проверяет его через ObjectSchema.
+
+        Args:
+            object_id: ID объекта
+        """
+        try:
+            response = self.client.get(f"{self.base_url}/objects/{object_id}", timeout=self.timeout, use_cache=False)
+        except RequestException as e:
+            return CrawlResult(object_id, STATUS_ERROR, errors=[str(e)])
+
+        if response.status_code == 404:
+            return CrawlResult(object_id, STATUS_NOT_FOUND, response.status_code)
+        if response.status_code != 200:
+            return CrawlResult(object_id, STATUS_ERROR, response.status_code)
+
+        try:
+            validated = validate_json(ObjectSchema, response.content)
+        except ValidationError as e:
+            errors = [f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()]
+            return CrawlResult(object_id, STATUS_INVALID, response.status_code, errors)
+        except (ValueError, TypeError) as e:
+            return CrawlResult(object_id, STATUS_INVALID, response.status_code, [str(e)])
+
+        metadata_date = validated.metadataDate.isoformat() if validated.metadataDate else None
+        payload = response.content if self.keep_payload else None
+        return CrawlResult(object_id, STATUS_OK, response.status_code, metadata_date=metadata_date, payload=payload)
+
+    def crawl(self, object_ids: Iterable[int], checkpoint: Optional[Checkpoint] = None,
+              on_result=None) -> CrawlReport:
+        """
+        Проверяет объекты, пропуская уже проверенные по контрольной точке.
+
+        Args:
+            object_ids: ID объектов для проверки
+            checkpoint: Контрольная точка для сохранения прогресса
+            on_result: Функция, вызываемая для каждого результата
+
+        Returns:
+            CrawlReport: Сводка по обходу
+        """
+        done = checkpoint.load() if checkpoint is not None else {}
+        report = CrawlReport()
+
+        def handle(result: CrawlResult):
+            report.add(result)
+            if checkpoint is not None:
+                checkpoint.append(result)
+            if on_result is not None:
+                on_result(result)
+
+        # Ограничиваем число задач в очереди, чтобы не создавать сотни тысяч futures
+        max_in_flight = self.workers * 4
+        in_flight = set()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for object_id in object_ids:
+                    report.total += 1
+                    previous = done.get(object_id)
+                    if previous is not None and previous.status != STATUS_ERROR:
+                        report.skipped += 1
+                        continue
+
+                    if len(in_flight) >= max_in_flight:
+                        completed, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in completed:
+                            handle(future.result())
+
+                    in_flight.add(executor.submit(self.check_object, object_id))
+
+                for future in wait(in_flight).done:
+                    handle(future.result())
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Обход объектов коллекции с валидацией через ObjectSchema")
+    parser.add_argument("--department-ids", type=int, nargs="*", help="ID отделов для фильтрации")
+    parser.add_argument("--metadata-date", help="обходить объекты, обновленные начиная с даты YYYY-MM-DD")
+    parser.add_argument("--checkpoint", default="crawl_checkpoint.jsonl", help="файл контрольной точки")
+    parser.add_argument("--workers", type=int, default=settings.CRAWL_WORKERS, help="количество потоков")
+    parser.add_argument("--rate", type=float, default=settings.CRAWL_RATE, help="запросов в секунду")
+    parser.add_argument("--limit", type=int, help="проверить не более N объектов")
+    args = parser.parse_args(argv)
+
+    crawler = ObjectCrawler(workers=args.workers, rate=args.rate)
+    object_ids = crawler.collect_ids(args.department_ids, args.metadata_date)
+    if args.limit is not None:
+        object_ids = object_ids[:args.limit]
+
+    report = crawler.crawl(object_ids, Checkpoint(args.checkpoint))
+
+    print(f"Объектов: {report.total}, пропущено по контрольной точке: {report.skipped}")
+    for status, count in sorted(report.counts.items()):
+        print(f"  {status}: {count}")
+
+
+if __name__ == "__main__":
+    main()
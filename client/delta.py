@@ -0,0 +1,156 @@
+"""
+Инкрементальная валидация объектов, изменившихся с прошлой синхронизации.
+
+Первый запуск проверяет всю коллекцию, последующие - только объекты,
+которые /objects?metadataDate=... вернул как обновленные с даты прошлого
+успешного запуска, и объекты, проверка которых ранее завершилась ошибкой.
+
+Запуск: python -m client.delta --state-dir .delta_state
+"""
+import argparse
+import json
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from config import settings
+from client.crawler import Checkpoint, CrawlReport, ObjectCrawler, STATUS_ERROR, STATUS_INVALID
+
+
+@dataclass
+class SyncState:
+    """Состояние инкрементальной валидации."""
+
+    last_sync: Optional[str] = None
+    department_ids: Optional[list[int]] = None
+    history: list[dict] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: Path) -> "SyncState":
+        """Загружает состояние из файла или возвращает пустое."""
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(data.get("last_sync"), data.get("department_ids"), data.get("history", []))
+
+    def save(self, path: Path):
+        """Атомарно сохраняет состояние в файл."""
+        data = {"last_sync": self.last_sync, "department_ids": self.department_ids, "history": self.history}
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp_path.replace(path)
+
+
+class DeltaValidator:
+    """
+    Инкрементальная валидация коллекции через ObjectSchema.
+
+    В директории состояния хранятся:
+    - state.json: дата последней успешной синхронизации и история запусков
+    - results.jsonl: последний результат проверки каждого объекта
+    - pending.jsonl: контрольная точка текущего запуска (для возобновления)
+    """
+
+    # Сколько последних запусков хранить в истории
+    HISTORY_SIZE = 30
+
+    def __init__(self, crawler: Optional[ObjectCrawler] = None, state_dir: str = settings.DELTA_STATE_DIR):
+        """
+        Инициализирует валидатор.
+
+        Args:
+            crawler: Обходчик объектов (по умолчанию с настройками из config.settings)
+            state_dir: Директория состояния
+        """
+        self.crawler = crawler or ObjectCrawler()
+        self.state_dir = Path(state_dir)
+        self.state_path = self.state_dir / "state.json"
+        self.results = Checkpoint(str(self.state_dir / "results.jsonl"))
+        self.pending = Checkpoint(str(self.state_dir / "pending.jsonl"))
+
+    def run(self, department_ids: Optional[Iterable[int]] = None, full: bool = False) -> CrawlReport:
+        """
+        Проверяет объекты, изменившиеся с последней синхронизации.
+
+        Args:
+            department_ids: ID отделов для фильтрации
+            full: Проверить всю коллекцию независимо от даты синхронизации
+
+        Returns:
+            CrawlReport: Сводка по проверенным объектам
+        """
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        state = SyncState.load(self.state_path)
+        department_ids = sorted(department_ids) if department_ids else None
+
+        # Смена фильтра отделов делает прошлую дату синхронизации неприменимой
+        since = None if full or department_ids != state.department_ids else state.last_sync
+        started = datetime.now(timezone.utc)
+
+        previous = self.results.load()
+        retry_ids = [object_id for object_id, result in previous.items() if result.status == STATUS_ERROR]
+
+        changed_ids = self.crawler.collect_ids(department_ids, since)
+        object_ids = list(dict.fromkeys([*changed_ids, *retry_ids]))
+
+        report = self.crawler.crawl(object_ids, self.pending)
+
+        # Переносим результаты запуска в общее хранилище и сдвигаем дату синхронизации
+        previous.update(self.pending.load())
+        self._rewrite_results(previous)
+        self.pending.path.unlink(missing_ok=True)
+
+        state.last_sync = started.date().isoformat()
+        state.department_ids = department_ids
+        state.history.append({
+            "started": started.isoformat(timespec="seconds"),
+            "since": since,
+            "changed": len(changed_ids),
+            "retried": len(retry_ids),
+            "counts": report.counts
+        })
+        state.history = state.history[-self.HISTORY_SIZE:]
+        state.save(self.state_path)
+
+        return report
+
+    def invalid_objects(self) -> list[int]:
+        """Возвращает ID объектов, которые по последней проверке не прошли валидацию."""
+        return sorted(object_id for object_id, result in self.results.load().items()
+                      if result.status == STATUS_INVALID)
+
+    def _rewrite_results(self, results: dict):
+        """Атомарно перезаписывает хранилище результатов без устаревших записей."""
+        tmp_path = self.results.path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for object_id in sorted(results):
+                f.write(json.dumps(results[object_id].to_record(), ensure_ascii=False) + "\n")
+        tmp_path.replace(self.results.path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Инкрементальная валидация объектов по metadataDate")
+    parser.add_argument("--state-dir", default=settings.DELTA_STATE_DIR, help="директория состояния")
+    parser.add_argument("--department-ids", type=int, nargs="*", help="ID отделов для фильтрации")
+    parser.add_argument("--full", action="store_true", help="проверить всю коллекцию")
+    parser.add_argument("--workers", type=int, default=settings.CRAWL_WORKERS, help="количество потоков")
+    parser.add_argument("--rate", type=float, default=settings.CRAWL_RATE, help="запросов в секунду")
+    args = parser.parse_args(argv)
+
+    validator = DeltaValidator(ObjectCrawler(workers=args.workers, rate=args.rate), args.state_dir)
+    report = validator.run(args.department_ids, full=args.full)
+
+    print(f"Проверено объектов: {report.total - report.skipped}")
+    for status, count in sorted(report.counts.items()):
+        print(f"  {status}: {count}")
+
+    invalid = validator.invalid_objects()
+    print(f"Невалидных объектов в коллекции: {len(invalid)}")
+
+    return 1 if report.counts.get(STATUS_INVALID) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,320 @@
+"""
+Постоянный кэш ответов API на диске.
+
+Просмотр и очистка: python -m client.disk_cache {stats,list,prune,clear}
+"""
+import argparse
+import gzip
+import json
+import sqlite3
+import threading
+import time
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from config import settings
+from client.payload import APIResponse
+
+
+# Заголовки, которые теряют смысл после декодирования и сохранения тела
+_SKIP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+@dataclass
+class DiskCacheStats:
+    """Счётчики работы постоянного кэша."""
+
+    revalidated: int = 0
+    stored: int = 0
+    evictions: int = 0
+    saved_bytes: int = 0
+
+
+@dataclass
+class DiskCacheEntry:
+    """Сохраненный ответ API с валидаторами для условного запроса."""
+
+    key: str
+    status: int
+    body: bytes
+    headers: dict = field(default_factory=dict)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> dict:
+        """Возвращает заголовки If-None-Match/If-Modified-Since для перепроверки."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, revalidation: requests.Response) -> requests.Response:
+        """
+        Восстанавливает ответ из кэша по ответу 304 Not Modified.
+
+        Args:
+            revalidation: Ответ на условный запрос (источник url, request и elapsed)
+        """
+        response = APIResponse()
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = revalidation.url
+        response.request = revalidation.request
+        response.elapsed = revalidation.elapsed
+        response.reason = "OK"
+        return response
+
+
+class DiskCache:
+    """
+    Постоянный кэш ответов API между прогонами.
+
+    Ответы хранятся сжатыми gzip в SQLite файле и индексируются каноническим
+    ключом запроса. Сохраняются только ответы 200 с ETag или Last-Modified:
+    перед использованием запись перепроверяется условным запросом, поэтому
+    неизменившиеся данные возвращаются дешевым ответом 304 без тела.
+    При превышении лимита размера вытесняются давно не использованные записи.
+    """
+
+    FILE_NAME = "cache.sqlite"
+
+    def __init__(self, cache_dir: str = settings.DISK_CACHE_DIR, max_bytes: int = settings.DISK_CACHE_MAX_BYTES):
+        """
+        Инициализирует кэш.
+
+        Args:
+            cache_dir: Директория файла кэша
+            max_bytes: Максимальный суммарный размер сжатых тел ответов
+        """
+        self.path = Path(cache_dir) / self.FILE_NAME
+        self.max_bytes = max_bytes
+        self.stats = DiskCacheStats()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def get(self, key: str) -> Optional[DiskCacheEntry]:
+        """
+        Возвращает запись кэша или None.
+
+        Args:
+            key: Канонический ключ запроса
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT status, headers, body, etag, last_modified FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status, headers, body, etag, last_modified = row
+        return DiskCacheEntry(key, status, gzip.decompress(body), json.loads(headers), etag, last_modified)
+
+    def put(self, key: str, response: requests.Response) -> bool:
+        """
+        Сохраняет ответ, если его можно перепроверить условным запросом.
+
+        Args:
+            key: Канонический ключ запроса
+            response: Ответ API
+
+        Returns:
+            bool: True, если ответ сохранен
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return False
+
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS}
+        body = gzip.compress(response.content, compresslevel=6)
+        now = time.time()
+
+        with self._lock:
+            db = self._connect()
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, response.status_code, json.dumps(headers), body, len(body), etag, last_modified, now, now)
+                )
+                self.stats.evictions += self._evict(db, self.max_bytes)
+            self.stats.stored += 1
+
+        return True
+
+    def revalidated(self, entry: DiskCacheEntry, response: requests.Response):
+        """
+        Отмечает успешную перепроверку записи ответом 304.
+
+        Args:
+            entry: Запись кэша
+            response: Ответ 304 (может содержать обновленные валидаторы)
+        """
+        etag = response.headers.get("ETag") or entry.etag
+        last_modified = response.headers.get("Last-Modified") or entry.last_modified
+
+        with self._lock:
+            db = self._connect()
+            with db:
+                db.execute(
+                    "UPDATE entries SET accessed_at = ?, etag = ?, last_modified = ? WHERE key = ?",
+                    (time.time(), etag, last_modified, entry.key)
+                )
+            self.stats.revalidated += 1
+            self.stats.saved_bytes += len(entry.body)
+
+    def entries(self) -> list[dict]:
+        """Возвращает описание записей, от давно использованных к недавним."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT key, status, size, etag, last_modified, stored_at, accessed_at "
+                "FROM entries ORDER BY accessed_at"
+            ).fetchall()
+
+        columns = ("key", "status", "size", "etag", "last_modified", "stored_at", "accessed_at")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def size_bytes(self) -> int:
+        """Суммарный размер сжатых тел ответов."""
+        with self._lock:
+            return self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def prune(self, max_bytes: Optional[int] = None, older_than: Optional[float] = None) -> int:
+        """
+        Удаляет записи по размеру кэша и времени последнего использования.
+
+        Args:
+            max_bytes: Оставить не более max_bytes, вытесняя давно использованные записи
+            older_than: Удалить записи, не использовавшиеся дольше older_than секунд
+
+        Returns:
+            int: Количество удаленных записей
+        """
+        removed = 0
+
+        with self._lock:
+            db = self._connect()
+            with db:
+                if older_than is not None:
+                    removed += db.execute(
+                        "DELETE FROM entries WHERE accessed_at < ?", (time.time() - older_than,)
+                    ).rowcount
+                if max_bytes is not None:
+                    removed += self._evict(db, max_bytes)
+            db.execute("VACUUM")
+
+        return removed
+
+    def clear(self):
+        """Удаляет все записи."""
+        with self._lock:
+            db = self._connect()
+            with db:
+                db.execute("DELETE FROM entries")
+            db.execute("VACUUM")
+
+    def close(self):
+        """Закрывает файл кэша."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Открывает файл кэша при первом обращении."""
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Файл может использоваться несколькими процессами-исполнителями одновременно
+            self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    @staticmethod
+    def _evict(db: sqlite3.Connection, max_bytes: int) -> int:
+        """Вытесняет давно использованные записи, пока размер кэша больше max_bytes."""
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= max_bytes:
+            return 0
+
+        evicted = []
+        for key, size in db.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if total <= max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+
+        db.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        return len(evicted)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Просмотр и очистка постоянного кэша ответов API")
+    parser.add_argument("--cache-dir", default=settings.DISK_CACHE_DIR, help="директория кэша")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="количество и размер записей")
+    commands.add_parser("list", help="записи от давно использованных к недавним")
+    prune = commands.add_parser("prune", help="удалить записи по размеру или возрасту")
+    prune.add_argument("--max-mb", type=float, help="оставить не более N МБ")
+    prune.add_argument("--older-than-days", type=float, help="удалить записи, не использовавшиеся N дней")
+    commands.add_parser("clear", help="удалить все записи")
+    args = parser.parse_args(argv)
+
+    cache = DiskCache(args.cache_dir)
+
+    if args.command == "stats":
+        print(f"Файл: {cache.path}")
+        print(f"Записей: {len(cache)}, размер: {cache.size_bytes() / 1024 / 1024:.2f} МБ")
+
+    elif args.command == "list":
+        now = time.time()
+        for entry in cache.entries():
+            age = (now - entry["accessed_at"]) / 3600
+            validator = "ETag" if entry["etag"] else "Last-Modified"
+            print(f"{entry['size'] / 1024:>10.1f} КБ {age:>8.1f} ч  {validator:<13} {entry['key']}")
+
+    elif args.command == "prune":
+        max_bytes = int(args.max_mb * 1024 * 1024) if args.max_mb is not None else None
+        older_than = args.older_than_days * 86400 if args.older_than_days is not None else None
+        removed = cache.prune(max_bytes, older_than)
+        print(f"Удалено записей: {removed}, осталось: {len(cache)}")
+
+    elif args.command == "clear":
+        cache.clear()
+        print("Кэш очищен")
+
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
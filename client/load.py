@@ -0,0 +1,384 @@
+"""
+Нагрузочный прогон по матрицам URL из тестовых классов.
+
+Запуск: python -m client.load --rate 50 --duration 60 [--target http://localhost:8080]
+"""
+import argparse
+import importlib
+import itertools
+import json
+import os
+import threading
+import time
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from requests.exceptions import RequestException
+
+from client.session import APISession
+
+
+# Тестовые модули, матрицы VALID_APIS/INVALID_APIS которых образуют нагрузку
+WORKLOAD_MODULES = {
+    "search": ("tests.Search.test_search_valid_params", "tests.Search.test_search_invalid_params"),
+    "objects": ("tests.Objects.test_objects_valid_params", "tests.Objects.test_objects_invalid_params"),
+    "object": ("tests.Object.test_object_valid_params", "tests.Object.test_object_invalid_params"),
+}
+
+# Перцентили, выводимые в отчете
+REPORT_PERCENTILES = (50, 75, 90, 95, 99, 99.9)
+
+
+@dataclass(frozen=True)
+class WorkloadItem:
+    """URL нагрузки и ожидаемый статус-код (None, если матрица его не задает)."""
+
+    url: str
+    expected_status: Optional[int] = None
+
+
+def load_workload(groups: Iterable[str] = tuple(WORKLOAD_MODULES), kinds: Iterable[str] = ("valid", "invalid")
+                  ) -> list[WorkloadItem]:
+    """
+    Собирает URL из матриц VALID_APIS/INVALID_APIS тестовых классов.
+
+    Args:
+        groups: Группы тестов (search, objects, object)
+        kinds: Матрицы для включения (valid, invalid)
+
+    Returns:
+        list[WorkloadItem]: Элементы нагрузки в порядке объявления в тестах
+    """
+    # Логгеры тестовых классов создаются при импорте; отдельный идентификатор
+    # процесса направляет их в файлы-шарды, не затирая логи последнего прогона
+    os.environ.setdefault("METAPI_WORKER_ID", "load")
+
+    attributes = {"valid": "VALID_APIS", "invalid": "INVALID_APIS"}
+    items = []
+
+    for group in groups:
+        for module_name in WORKLOAD_MODULES[group]:
+            module = importlib.import_module(module_name)
+            for test_class in vars(module).values():
+                for kind in kinds:
+                    for entry in getattr(test_class, attributes[kind], None) or ():
+                        if isinstance(entry, tuple):
+                            items.append(WorkloadItem(*entry))
+                        else:
+                            items.append(WorkloadItem(entry))
+
+    return items
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек с логарифмически-линейными корзинами в духе HdrHistogram.
+
+    Значения хранятся в микросекундах: кроме старшего бита сохраняются
+    significant_bits следующих бит, поэтому относительная погрешность не более
+    1 / 2**significant_bits. Память зависит от диапазона значений, а не от их числа.
+    """
+
+    def __init__(self, significant_bits: int = 7):
+        """
+        Инициализирует гистограмму.
+
+        Args:
+            significant_bits: Количество сохраняемых бит значения после старшего
+        """
+        self.significant_bits = significant_bits
+        self.counts: Counter = Counter()
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def record(self, seconds: float):
+        """Добавляет значение задержки в секундах."""
+        value = max(int(seconds * 1_000_000), 0)
+        shift = self._shift(value)
+        self.counts[(value >> shift) << shift] += 1
+
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Добавляет значения другой гистограммы."""
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def value_at_percentile(self, percent: float) -> float:
+        """Возвращает верхнюю границу корзины перцентиля в миллисекундах."""
+        if not self.count:
+            return 0.0
+
+        rank = max(int(percent / 100 * self.count + 0.5), 1)
+        seen = 0
+        for low in sorted(self.counts):
+            seen += self.counts[low]
+            if seen >= rank:
+                return min(low + (1 << self._shift(low)) - 1, self.max) / 1000
+        return self.max / 1000
+
+    def _shift(self, value: int) -> int:
+        """Количество младших бит значения, отбрасываемых при выборе корзины."""
+        return max(value.bit_length() - 1 - self.significant_bits, 0)
+
+    @property
+    def mean(self) -> float:
+        """Среднее значение в миллисекундах."""
+        return self.total / self.count / 1000 if self.count else 0.0
+
+
+@dataclass
+class LoadReport:
+    """Результаты нагрузочного прогона."""
+
+    mode: str
+    duration: float = 0.0
+    sent: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    unexpected: int = 0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def completed(self) -> int:
+        """Количество запросов, получивших ответ."""
+        return sum(self.statuses.values())
+
+    @property
+    def throughput(self) -> float:
+        """Количество ответов в секунду."""
+        return self.completed / self.duration if self.duration else 0.0
+
+    def error_rate(self, status: int) -> float:
+        """Доля запросов, завершившихся заданным статус-кодом."""
+        return self.statuses[status] / self.sent if self.sent else 0.0
+
+    def to_dict(self) -> dict:
+        """Возвращает отчет в виде словаря для сохранения в JSON."""
+        return {
+            "mode": self.mode,
+            "duration": round(self.duration, 3),
+            "sent": self.sent,
+            "completed": self.completed,
+            "throughput": round(self.throughput, 2),
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "errors": dict(self.errors),
+            "unexpected": self.unexpected,
+            "latency_ms": {
+                "min": (self.histogram.min or 0) / 1000,
+                "mean": round(self.histogram.mean, 3),
+                "max": (self.histogram.max or 0) / 1000,
+                **{f"p{p:g}": self.histogram.value_at_percentile(p) for p in REPORT_PERCENTILES}
+            }
+        }
+
+
+class LoadRunner:
+    """
+    Генератор нагрузки по списку URL.
+
+    Режим rate (открытый цикл): запросы отправляются по расписанию с заданной
+    частотой независимо от того, ответил ли сервер на предыдущие. Задержка
+    отсчитывается от запланированного момента отправки, поэтому время ожидания
+    в очереди при перегрузке попадает в статистику (без coordinated omission).
+
+    Режим concurrency (замкнутый цикл): заданное число потоков отправляет
+    запросы друг за другом.
+    """
+
+    def __init__(self, workload: list[WorkloadItem], target: Optional[str] = None,
+                 max_workers: int = 64, timeout: float = 10):
+        """
+        Инициализирует генератор.
+
+        Args:
+            workload: Элементы нагрузки, перебираемые по кругу
+            target: Базовый URL, на который заменяются схема и хост (например, кэширующий прокси)
+            max_workers: Максимальное количество одновременных запросов
+            timeout: Таймаут одного запроса в секундах
+        """
+        if not workload:
+            raise ValueError("Нагрузка не содержит URL")
+
+        self.workload = workload
+        self.target = urlsplit(target) if target else None
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        # Повторы при 502 отключены: каждый ответ учитывается как есть
+        self.session = APISession(pool_connections=4, pool_maxsize=max_workers, retry_total=0)
+
+        self._items = itertools.cycle(workload)
+        self._lock = threading.Lock()
+        self._report: Optional[LoadReport] = None
+
+    def run_rate(self, rate: float, duration: float) -> LoadReport:
+        """
+        Отправляет запросы с постоянной частотой в течение заданного времени.
+
+        Args:
+            rate: Запросов в секунду
+            duration: Длительность прогона в секундах
+        """
+        self._report = LoadReport(mode=f"rate={rate:g}/s")
+        interval = 1.0 / rate
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for index in itertools.count():
+                scheduled = started + index * interval
+                if scheduled - started >= duration:
+                    break
+
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                executor.submit(self._send, self._next_item(), scheduled)
+
+        return self._finish(started)
+
+    def run_concurrency(self, concurrency: int, duration: float) -> LoadReport:
+        """
+        Отправляет запросы заданным числом потоков в течение заданного времени.
+
+        Args:
+            concurrency: Количество одновременных запросов
+            duration: Длительность прогона в секундах
+        """
+        self._report = LoadReport(mode=f"concurrency={concurrency}")
+
+        started = time.perf_counter()
+        deadline = started + duration
+
+        def worker():
+            while time.perf_counter() < deadline:
+                self._send(self._next_item(), time.perf_counter())
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return self._finish(started)
+
+    def close(self):
+        """Закрывает соединения пула."""
+        self.session.close()
+
+    def _next_item(self) -> WorkloadItem:
+        """Возвращает очередной элемент нагрузки."""
+        with self._lock:
+            return next(self._items)
+
+    def _request_url(self, url: str) -> str:
+        """Заменяет схему и хост URL на целевой адрес."""
+        if self.target is None:
+            return url
+        parts = urlsplit(url)
+        return urlunsplit((self.target.scheme, self.target.netloc, parts.path, parts.query, ""))
+
+    def _send(self, item: WorkloadItem, scheduled: float):
+        """Выполняет запрос и учитывает результат, отсчитывая задержку от момента scheduled."""
+        status, error = None, None
+        try:
+            response = self.session.get(self._request_url(item.url), timeout=self.timeout)
+            status = response.status_code
+        except RequestException as e:
+            error = type(e).__name__
+        latency = time.perf_counter() - scheduled
+
+        report = self._report
+        with self._lock:
+            report.sent += 1
+            if error is not None:
+                report.errors[error] += 1
+                return
+            report.statuses[status] += 1
+            report.histogram.record(latency)
+            if item.expected_status is not None and status != item.expected_status:
+                report.unexpected += 1
+
+    def _finish(self, started: float) -> LoadReport:
+        """Завершает прогон и возвращает отчет."""
+        report = self._report
+        report.duration = time.perf_counter() - started
+        return report
+
+
+def format_report(report: LoadReport) -> list[str]:
+    """Форматирует отчет для вывода в консоль."""
+    lines = [
+        f"Режим: {report.mode}, длительность: {report.duration:.1f} сек.",
+        f"Отправлено: {report.sent}, получено ответов: {report.completed}, "
+        f"пропускная способность: {report.throughput:.1f} ответов/сек.",
+        f"Ответов с неожиданным статусом: {report.unexpected}",
+        "Статус-коды:"
+    ]
+    for status, count in sorted(report.statuses.items()):
+        lines.append(f"  {status}: {count} ({report.error_rate(status):.1%})")
+    for error, count in sorted(report.errors.items()):
+        lines.append(f"  {error}: {count} ({count / report.sent:.1%})")
+
+    histogram = report.histogram
+    lines.append("Задержка, мс:")
+    lines.append(f"  min: {(histogram.min or 0) / 1000:.1f}, mean: {histogram.mean:.1f}, "
+                 f"max: {(histogram.max or 0) / 1000:.1f}")
+    for percent in REPORT_PERCENTILES:
+        lines.append(f"  p{percent:g}: {histogram.value_at_percentile(percent):.1f}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон по матрицам URL из тестов")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--rate", type=float, help="запросов в секунду (открытый цикл)")
+    mode.add_argument("--concurrency", type=int, help="одновременных запросов (замкнутый цикл)")
+    parser.add_argument("--duration", type=float, default=30, help="длительность прогона в секундах")
+    parser.add_argument("--groups", nargs="*", choices=tuple(WORKLOAD_MODULES), default=tuple(WORKLOAD_MODULES),
+                        help="группы тестов, матрицы которых используются")
+    parser.add_argument("--kinds", nargs="*", choices=("valid", "invalid"), default=("valid", "invalid"),
+                        help="включаемые матрицы")
+    parser.add_argument("--target", help="базовый URL, на который отправляются запросы (например, прокси)")
+    parser.add_argument("--max-workers", type=int, default=64, help="максимум одновременных запросов в режиме rate")
+    parser.add_argument("--timeout", type=float, default=10, help="таймаут запроса в секундах")
+    parser.add_argument("--json", help="сохранить отчет в JSON файл")
+    args = parser.parse_args(argv)
+
+    workload = load_workload(args.groups, args.kinds)
+    runner = LoadRunner(workload, args.target, max_workers=args.concurrency or args.max_workers,
+                        timeout=args.timeout)
+    try:
+        if args.rate is not None:
+            report = runner.run_rate(args.rate, args.duration)
+        else:
+            report = runner.run_concurrency(args.concurrency, args.duration)
+    finally:
+        runner.close()
+
+    print(f"URL в нагрузке: {len(workload)}")
+    for line in format_report(report):
+        print(line)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
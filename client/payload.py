@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+
+from pydantic_core import from_json
+
+
+@dataclass(frozen=True)
+class Payload:
+    """
+    Тело ответа API, разобранное один раз.
+
+    Хранит исходные байты и разобранный JSON. Экземпляр общий для всех
+    потребителей ответа (ответ лежит в кэше клиента). Заморожены только поля
+    экземпляра, сами данные data изменяемы, и их изменение видно всем
+    потребителям, поэтому data и вложенные в нее значения не изменяются.
+    """
+
+    raw: bytes
+    data: Any
+
+    @classmethod
+    def parse(cls, raw: bytes) -> "Payload":
+        """
+        Разбирает тело ответа.
+
+        Args:
+            raw: Тело ответа
+
+        Raises:
+            ValueError: Если тело не является корректным JSON
+        """
+        # Повторяющиеся ключи объектов (например, имена полей записей) создаются один раз
+        return cls(raw, from_json(raw, cache_strings="keys"))
+
+    def json(self) -> Any:
+        """
+        Возвращает разобранный JSON с копией верхнего уровня.
+
+        Копируется только верхний уровень: ключи и элементы верхнего уровня
+        можно заменять, не затрагивая общие данные, а вложенные списки и
+        словари остаются общими для всех вызовов. Для изменения вложенных
+        данных нужна глубокая копия (copy.deepcopy).
+        """
+        if isinstance(self.data, dict):
+            return dict(self.data)
+        if isinstance(self.data, list):
+            return list(self.data)
+        return self.data
+
+
+class APIResponse(requests.Response):
+    """
+    Ответ API с однократным разбором тела.
+
+    json() разбирает тело при первом вызове и затем возвращает копию
+    верхнего уровня сохраненного результата, поэтому повторные вызовы
+    в тестах одного URL не разбирают тело заново. Вложенные значения
+    результата общие для всех вызовов (см. Payload.json).
+    """
+
+    _payload = None
+    # Время сетевого запроса в секундах без ожидания ограничителя частоты (задает клиент API)
+    latency = None
+
+    @property
+    def payload(self) -> Payload:
+        """
+        Разобранное тело ответа.
+
+        Raises:
+            ValueError: Если тело не является корректным JSON
+        """
+        payload = self._payload
+        if payload is None:
+            payload = self._payload = Payload.parse(self.content)
+        return payload
+
+    def json(self, **kwargs) -> Any:
+        """
+        Возвращает JSON ответа.
+
+        Raises:
+            requests.JSONDecodeError: Если тело не является корректным JSON
+        """
+        if kwargs:
+            return super().json(**kwargs)
+        try:
+            return self.payload.json()
+        except ValueError:
+            # Ошибку и ее тип формирует requests, как для обычного ответа
+            return super().json()
+
+    @classmethod
+    def adopt(cls, response: requests.Response) -> "APIResponse":
+        """Преобразует ответ requests в APIResponse без копирования."""
+        if not isinstance(response, cls):
+            response.__class__ = cls
+        return response
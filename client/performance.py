@@ -0,0 +1,144 @@
+import json
+import statistics
+import time
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from client.api_client import APIClient
+from client.telemetry import percentile
+
+
+@dataclass
+class PerfStats:
+    """Статистика серии замеров эндпоинта."""
+
+    samples: int
+    p50: float
+    p95: float
+    p99: float
+    mean: float
+    min: float
+    max: float
+    bytes_mean: int
+    errors: int = 0
+
+
+@dataclass
+class PerfBudget:
+    """Бюджет производительности эндпоинта."""
+
+    p95_ms: float
+    max_bytes: Optional[int] = None
+
+    def check(self, stats: PerfStats, tolerance: float) -> list[str]:
+        """
+        Возвращает список нарушений бюджета с учетом допуска.
+
+        Args:
+            stats: Результаты замеров
+            tolerance: Допустимое превышение бюджета (0.25 - на 25%)
+        """
+        violations = []
+
+        limit = self.p95_ms * (1 + tolerance)
+        if stats.p95 > limit:
+            violations.append(f"p95 {stats.p95:.1f} мс превышает бюджет {self.p95_ms:.1f} мс (+{tolerance:.0%})")
+
+        if self.max_bytes is not None:
+            size_limit = self.max_bytes * (1 + tolerance)
+            if stats.bytes_mean > size_limit:
+                violations.append(f"размер ответа {stats.bytes_mean} байт превышает бюджет {self.max_bytes} байт "
+                                  f"(+{tolerance:.0%})")
+
+        if stats.errors:
+            violations.append(f"ошибок при замерах: {stats.errors} из {stats.samples}")
+
+        return violations
+
+
+class PerformanceBaseline:
+    """Бюджеты производительности эндпоинтов, хранящиеся в JSON файле."""
+
+    def __init__(self, path: str, budgets: Optional[dict[str, PerfBudget]] = None):
+        """
+        Инициализирует набор бюджетов.
+
+        Args:
+            path: Путь к файлу бюджетов
+            budgets: Бюджеты по ключам эндпоинтов
+        """
+        self.path = Path(path)
+        self.budgets = budgets or {}
+
+    @classmethod
+    def load(cls, path: str) -> "PerformanceBaseline":
+        """Загружает бюджеты из файла или возвращает пустой набор."""
+        baseline = cls(path)
+        if baseline.path.exists():
+            data = json.loads(baseline.path.read_text(encoding="utf-8"))
+            baseline.budgets = {key: PerfBudget(**value) for key, value in data.items()}
+        return baseline
+
+    def get(self, key: str) -> Optional[PerfBudget]:
+        """Возвращает бюджет эндпоинта или None."""
+        return self.budgets.get(key)
+
+    def update(self, key: str, stats: PerfStats):
+        """Устанавливает бюджет эндпоинта по результатам замеров."""
+        self.budgets[key] = PerfBudget(p95_ms=round(stats.p95, 1), max_bytes=stats.bytes_mean)
+
+    def save(self):
+        """Сохраняет бюджеты в файл."""
+        data = {key: asdict(budget) for key, budget in sorted(self.budgets.items())}
+        self.path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def measure_endpoint(client: APIClient, api_url: str, samples: int = 3, timeout: float = 30,
+                     warmup: int = 1) -> PerfStats:
+    """
+    Замеряет задержку и размер ответа эндпоинта серией запросов в обход кэша.
+
+    Задержка - время сетевого запроса без ожидания слота ограничителя частоты.
+
+    Args:
+        client: Клиент API
+        api_url: URL эндпоинта
+        samples: Количество замеров
+        timeout: Таймаут одного запроса в секундах
+        warmup: Количество прогревочных запросов (установка соединения не входит в замеры)
+
+    Raises:
+        requests.exceptions.RequestException: При ошибках запроса
+    """
+    for _ in range(warmup):
+        client.get(api_url, timeout=timeout, use_cache=False)
+
+    latencies = []
+    sizes = []
+    errors = 0
+
+    for _ in range(samples):
+        started = time.perf_counter()
+        response = client.get(api_url, timeout=timeout, use_cache=False)
+        latency = getattr(response, "latency", None)
+        if latency is None:
+            latency = time.perf_counter() - started
+        latencies.append(latency * 1000)
+        sizes.append(len(response.content))
+        if response.status_code >= 500:
+            errors += 1
+
+    latencies.sort()
+    return PerfStats(
+        samples=samples,
+        p50=percentile(latencies, 50),
+        p95=percentile(latencies, 95),
+        p99=percentile(latencies, 99),
+        mean=statistics.fmean(latencies),
+        min=latencies[0],
+        max=latencies[-1],
+        bytes_mean=int(statistics.fmean(sizes)),
+        errors=errors
+    )
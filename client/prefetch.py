@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+from urllib.parse import urlsplit
+
+from client.api_client import APIClient
+
+
+@dataclass
+class PrefetchStats:
+    """Результаты предзагрузки URL."""
+
+    urls: int = 0
+    fetched: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+
+class HostRateLimiter:
+    """Ограничивает частоту запусков запросов к одному хосту."""
+
+    def __init__(self, rate: float):
+        """
+        Инициализирует ограничитель.
+
+        Args:
+            rate: Максимальное количество запросов в секунду к одному хосту (0 - без ограничения)
+        """
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = defaultdict(float)
+        self._locks = defaultdict(asyncio.Lock)
+
+    async def acquire(self, host: str):
+        """
+        Ожидает, пока для хоста не освободится очередной слот.
+
+        Args:
+            host: Имя хоста
+        """
+        if not self.interval:
+            return
+
+        async with self._locks[host]:
+            now = time.monotonic()
+            slot = max(now, self._next_slot[host])
+            self._next_slot[host] = slot + self.interval
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class PrefetchEngine:
+    """
+    Параллельная предзагрузка ответов API в кэш клиента.
+
+    Запросы выполняются конкурентно с ограничением на количество одновременных
+    запросов и частоту обращений к одному хосту. Готовые ответы попадают в кэш
+    APIClient, откуда их забирают синхронные тесты через make_request.
+    """
+
+    def __init__(self, client: APIClient, concurrency: int = 8, host_rate: float = 20.0, timeout: float = 10):
+        """
+        Инициализирует движок предзагрузки.
+
+        Args:
+            client: Клиент API, в кэш которого загружаются ответы
+            concurrency: Максимальное количество одновременных запросов
+            host_rate: Максимальное количество запросов в секунду к одному хосту
+            timeout: Таймаут одного запроса в секундах
+        """
+        self.client = client
+        self.concurrency = concurrency
+        self.host_rate = host_rate
+        self.timeout = timeout
+        self.stats = PrefetchStats()
+
+    def prefetch(self, urls: Iterable[str]) -> PrefetchStats:
+        """
+        Загружает все URL и дожидается завершения.
+
+        Args:
+            urls: URL для предзагрузки (дубликаты отбрасываются)
+
+        Returns:
+            PrefetchStats: Статистика предзагрузки
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        self.stats = PrefetchStats(urls=len(unique_urls))
+
+        if unique_urls:
+            started = time.perf_counter()
+            asyncio.run(self._prefetch_all(unique_urls))
+            self.stats.elapsed = time.perf_counter() - started
+
+        return self.stats
+
+    async def _prefetch_all(self, urls: list[str]):
+        """Запускает загрузку всех URL конкурентно."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limiter = HostRateLimiter(self.host_rate)
+
+        await asyncio.gather(*(self._fetch(url, semaphore, limiter) for url in urls))
+
+    async def _fetch(self, url: str, semaphore: asyncio.Semaphore, limiter: HostRateLimiter):
+        """Загружает один URL; ошибки не прерывают остальные загрузки."""
+        async with semaphore:
+            await limiter.acquire(urlsplit(url).netloc)
+            try:
+                await asyncio.to_thread(self.client.get, url, self.timeout)
+                self.stats.fetched += 1
+            except Exception:
+                # Ошибку повторно получит и обработает сам тест через make_request
+                self.stats.failed += 1
@@ -0,0 +1,265 @@
+import threading
+import time
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+
+@dataclass
+class AdaptiveRateStats:
+    """Счётчики адаптивного ограничителя."""
+
+    throttled: int = 0
+    decreases: int = 0
+    retry_after: int = 0
+    waited: float = 0.0
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket с подстройкой частоты по ответам API.
+
+    Запросам выдаются слоты с интервалом 1/rate, до burst запросов могут
+    выполняться сразу (эквивалент ведра токенов емкостью burst). Частота
+    растет аддитивно после успешных ответов (примерно на increase запросов
+    в секунду за секунду работы) и уменьшается в decrease раз после ответов
+    429/503. Ответы на запросы, отправленные до предыдущего снижения,
+    частоту повторно не снижают, поэтому серия ошибок уже отправленных
+    запросов не обрушивает частоту каскадом. Заголовок Retry-After
+    приостанавливает выдачу слотов до указанного момента, после паузы
+    запросы возобновляются с интервалом 1/rate, а не пачкой.
+    """
+
+    # 502 не признак перегрузки: API стабильно отвечает 502 на некоторые невалидные параметры
+    THROTTLE_STATUSES = (429, 503)
+
+    def __init__(self, rate: float, min_rate: float = 1.0, burst: Optional[float] = None,
+                 decrease: float = 0.5, increase: Optional[float] = None):
+        """
+        Инициализирует ограничитель.
+
+        Args:
+            rate: Начальная и максимальная частота запросов в секунду
+            min_rate: Минимальная частота запросов в секунду
+            burst: Количество запросов, выполняемых без ожидания (по умолчанию 10% от rate)
+            decrease: Множитель частоты при ответе о перегрузке
+            increase: Прирост частоты в секунду при успешных ответах (по умолчанию 5% от rate)
+        """
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate / 10, 1.0)
+        self.decrease = decrease
+        self.increase = increase if increase is not None else rate / 20
+        self.stats = AdaptiveRateStats()
+
+        # Момент, к которому выданы все слоты при текущей частоте
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float):
+        """
+        Задает новую максимальную частоту запросов.
+
+        Текущая частота, запас на пачку запросов и прирост частоты
+        масштабируются пропорционально, поэтому уже выполненное снижение
+        частоты после ответов 429/503 сохраняется.
+
+        Args:
+            rate: Максимальная частота запросов в секунду
+        """
+        with self._lock:
+            scale = rate / self.max_rate
+            self.max_rate = rate
+            self.min_rate = min(self.min_rate, rate)
+            self.rate = max(self.rate * scale, self.min_rate)
+            self.burst = max(self.burst * scale, 1.0)
+            self.increase *= scale
+
+    def acquire(self) -> float:
+        """
+        Блокирует поток до наступления выделенного слота.
+
+        Если за время ожидания API попросил паузу (Retry-After), слот
+        выделяется заново после ее окончания.
+
+        Returns:
+            float: Момент слота (time.monotonic) для передачи в on_response
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                slot = max(now, self._blocked_until, self._next_slot - self.burst / self.rate)
+                self._next_slot = max(self._next_slot, slot) + 1.0 / self.rate
+                if slot > now:
+                    self.stats.waited += slot - now
+
+            if slot > now:
+                time.sleep(slot - now)
+            if self._blocked_until <= slot:
+                return slot
+
+    def on_response(self, status: int, retry_after: Optional[float] = None, sent_at: Optional[float] = None):
+        """
+        Подстраивает частоту по ответу API.
+
+        Args:
+            status: Код ответа
+            retry_after: Значение заголовка Retry-After в секундах
+            sent_at: Момент слота запроса (результат acquire)
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            if retry_after is not None and retry_after > 0:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+                self.stats.retry_after += 1
+
+            if status not in self.THROTTLE_STATUSES:
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+                return
+
+            self.stats.throttled += 1
+            if sent_at is None or sent_at >= self._last_decrease:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                # Запас на пачку запросов сбрасывается: следующие слоты идут с новым интервалом
+                self._next_slot = max(self._next_slot, max(now, self._blocked_until) + self.burst / self.rate)
+                self._last_decrease = now
+                self.stats.decreases += 1
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Возвращает задержку из заголовка Retry-After в секундах.
+
+    Args:
+        value: Значение заголовка (число секунд или HTTP-дата)
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Запрос не выполнен: автомат эндпоинта разомкнут после серии ошибок."""
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель запросов к одному эндпоинту.
+
+    После failure_threshold ошибок подряд (ответы 429 и 503, ошибки соединения)
+    автомат размыкается, и запросы отклоняются без обращения к API. Через
+    reset_timeout секунд пропускается один пробный запрос: при успехе автомат
+    замыкается, при ошибке снова размыкается.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    # Ответы, означающие недоступность эндпоинта. Остальные коды, включая 500 и 502,
+    # API возвращает детерминированно на конкретные URL, и тесты их проверяют
+    FAILURE_STATUSES = (429, 503)
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Инициализирует автомат.
+
+        Args:
+            failure_threshold: Количество ошибок подряд до размыкания
+            reset_timeout: Время до пробного запроса в секундах
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def is_failure(cls, status: int) -> bool:
+        """Проверяет, что код ответа считается ошибкой доступности эндпоинта."""
+        return status in cls.FAILURE_STATUSES
+
+    def allow(self) -> bool:
+        """Проверяет, можно ли выполнить запрос."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            now = time.monotonic()
+            if now < self._opened_at + self.reset_timeout:
+                return False
+
+            # Пробный запрос; следующий пробный - не раньше чем через reset_timeout
+            self.state = self.HALF_OPEN
+            self._opened_at = now
+            return True
+
+    def retry_after(self) -> float:
+        """Время до следующего пробного запроса в секундах."""
+        with self._lock:
+            return max(self._opened_at + self.reset_timeout - time.monotonic(), 0.0)
+
+    def record(self, status: Optional[int]):
+        """
+        Учитывает результат запроса.
+
+        Args:
+            status: Код ответа или None при ошибке соединения
+        """
+        with self._lock:
+            if status is not None and not self.is_failure(status):
+                self.state = self.CLOSED
+                self.failures = 0
+                return
+
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self.opened += 1
+
+
+class EndpointCircuitBreakers:
+    """Автоматы выключения, создаваемые для каждого эндпоинта при первом запросе."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: Количество ошибок подряд до размыкания
+            reset_timeout: Время до пробного запроса в секундах
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """Возвращает автомат эндпоинта."""
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return breaker
+
+    def items(self) -> list[tuple[str, CircuitBreaker]]:
+        """Возвращает пары (эндпоинт, автомат), упорядоченные по эндпоинту."""
+        with self._lock:
+            return sorted(self._breakers.items())
@@ -0,0 +1,126 @@
+import requests
+
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+from client.payload import APIResponse
+from client.telemetry import TIMED_POOL_CLASSES
+
+
+# Поддерживаемые сжатия ответов: gzip и deflate, br - при установленном пакете brotli
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+@dataclass
+class TransportStats:
+    """Статистика использования соединений пула."""
+
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        """Количество запросов, выполненных по уже открытому соединению."""
+        return max(self.requests - self.new_connections, 0)
+
+    @property
+    def reuse_rate(self) -> float:
+        """Доля запросов, выполненных без установки нового соединения."""
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+
+class APIAdapter(HTTPAdapter):
+    """Адаптер, возвращающий ответы APIResponse с однократным разбором тела."""
+
+    def build_response(self, req, resp) -> APIResponse:
+        return APIResponse.adopt(super().build_response(req, resp))
+
+
+class APISession:
+    """
+    HTTP-сессия с пулом keep-alive соединений.
+
+    Соединения с хостом переиспользуются между запросами, поэтому TCP и TLS
+    рукопожатие выполняется один раз на соединение, а не на каждый запрос.
+    Ответы 502 Bad Gateway повторяются с экспоненциальной задержкой.
+    Запрашиваются сжатые ответы, тело разбирается не более одного раза.
+    """
+
+    RETRY_STATUSES = (502,)
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 10,
+                 retry_total: int = 2, retry_backoff: float = 0.5):
+        """
+        Инициализирует сессию.
+
+        Args:
+            pool_connections: Количество хостов, для которых хранятся пулы соединений
+            pool_maxsize: Максимальное количество соединений с одним хостом
+            retry_total: Количество повторов запроса при ответе 502
+            retry_backoff: Базовая задержка между повторами в секундах
+        """
+        retry = Retry(
+            total=retry_total,
+            connect=0,
+            read=0,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            backoff_factor=retry_backoff,
+            raise_on_status=False
+        )
+        self.adapter = APIAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+            pool_block=False
+        )
+
+        # Пулы с соединениями, замеряющими DNS, TCP и TLS этапы для телеметрии
+        self.adapter.poolmanager.pool_classes_by_scheme = TIMED_POOL_CLASSES
+
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+        # Статистика пулов, закрытых при вытеснении из PoolManager
+        self._closed_stats = TransportStats()
+
+        self.adapter.poolmanager.pools.dispose_func = self._on_pool_dispose
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Выполняет GET запрос через пул соединений.
+
+        Args:
+            url: URL запроса
+            **kwargs: Дополнительные аргументы requests.Session.get
+        """
+        return self.session.get(url, **kwargs)
+
+    @property
+    def stats(self) -> TransportStats:
+        """Сводная статистика переиспользования соединений по всем хостам."""
+        stats = TransportStats(self._closed_stats.requests, self._closed_stats.new_connections)
+        pools = self.adapter.poolmanager.pools
+
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats.requests += pool.num_requests
+            stats.new_connections += pool.num_connections
+
+        return stats
+
+    def close(self):
+        """Закрывает все соединения сессии."""
+        self.session.close()
+
+    def _on_pool_dispose(self, pool):
+        """Сохраняет статистику пула перед его закрытием."""
+        self._closed_stats.requests += pool.num_requests
+        self._closed_stats.new_connections += pool.num_connections
+        pool.close()
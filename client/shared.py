@@ -0,0 +1,180 @@
+"""
+Общие для процессов-исполнителей ответы API.
+
+При параллельном запуске (pytest-xdist или несколько процессов с METAPI_WORKER_ID)
+каждый уникальный URL запрашивается из сети одним процессом: он захватывает
+файловую блокировку ключа, выполняет запрос и сохраняет ответ в общую директорию,
+остальные процессы дожидаются блокировки и читают сохраненный ответ.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from client.payload import APIResponse
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Заголовки, которые теряют смысл после декодирования и сохранения тела
+_SKIP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+class FileLock:
+    """
+    Межпроцессная блокировка на файле (flock, в Windows - msvcrt.locking).
+
+    Блокировка принадлежит открытому файлу, поэтому потоки одного процесса,
+    открывающие файл отдельно, тоже ждут друг друга.
+    """
+
+    # Интервал повторных попыток захвата в Windows
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Файл блокировки (создается при первом захвате)
+        """
+        self.path = path
+        self._file = None
+
+    def __enter__(self) -> "FileLock":
+        self._file = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(self.POLL_INTERVAL)
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+
+@dataclass
+class SharedStats:
+    """Счётчики общих ответов процесса."""
+
+    fetched: int = 0
+    shared: int = 0
+    saved_bytes: int = 0
+
+
+class SharedResponseStore:
+    """
+    Ответы API, общие для процессов одного прогона.
+
+    Каждый ответ хранится в отдельном файле: строка JSON с URL, статусом и
+    заголовками, затем тело ответа. Файл записывается во временный и
+    переименовывается, поэтому читатели не видят частично записанный ответ.
+    Ответы старше ttl запрашиваются заново.
+    """
+
+    def __init__(self, shared_dir: str, ttl: float):
+        """
+        Инициализирует хранилище.
+
+        Args:
+            shared_dir: Общая директория процессов прогона
+            ttl: Время жизни ответа в секундах
+        """
+        self.path = Path(shared_dir)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.stats = SharedStats()
+        self._lock = threading.Lock()
+
+    def do(self, key: str, api_url: str, fetch: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Возвращает ответ, сохраненный другим процессом, или выполняет запрос и сохраняет ответ.
+
+        Исключение fetch не сохраняется: следующий процесс, дождавшийся
+        блокировки, выполнит запрос сам.
+
+        Args:
+            key: Канонический ключ запроса
+            api_url: URL запроса (для восстановленного ответа)
+            fetch: Функция, выполняющая запрос
+        """
+        name = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        data_path = self.path / f"{name}.resp"
+
+        with FileLock(self.path / f"{name}.lock"):
+            response = self._load(data_path, api_url)
+            if response is not None:
+                with self._lock:
+                    self.stats.shared += 1
+                    self.stats.saved_bytes += len(response.content)
+                return response
+
+            response = fetch()
+            self._save(data_path, key, response)
+
+        with self._lock:
+            self.stats.fetched += 1
+        return response
+
+    def _load(self, data_path: Path, api_url: str) -> Optional[requests.Response]:
+        """Читает сохраненный ответ, если он есть и не устарел."""
+        try:
+            if time.time() - data_path.stat().st_mtime > self.ttl:
+                return None
+            with data_path.open("rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except FileNotFoundError:
+            return None
+
+        response = APIResponse()
+        response.status_code = meta["status"]
+        response.reason = meta["reason"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response._content = body
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = api_url
+        response.elapsed = timedelta(seconds=meta["elapsed"])
+        response.request = requests.Request("GET", api_url).prepare()
+        return response
+
+    def _save(self, data_path: Path, key: str, response: requests.Response):
+        """Сохраняет ответ атомарной заменой файла."""
+        meta = {
+            "key": key,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS},
+            "elapsed": response.elapsed.total_seconds()
+        }
+        tmp_path = data_path.with_name(f"{data_path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8") + b"\n")
+            f.write(response.content)
+        tmp_path.replace(data_path)
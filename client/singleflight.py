@@ -0,0 +1,85 @@
+import threading
+
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+
+@dataclass
+class SingleFlightStats:
+    """Счётчики объединения одновременных запросов."""
+
+    calls: int = 0
+    executions: int = 0
+
+    @property
+    def saved(self) -> int:
+        """Количество вызовов, получивших результат чужого запроса."""
+        return self.calls - self.executions
+
+
+class _Call:
+    """Выполняющийся вызов, результат которого ждут остальные потоки."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Объединение одновременных вызовов с одинаковым ключом.
+
+    Первый поток выполняет функцию, остальные потоки с тем же ключом ждут
+    его завершения и получают тот же результат или то же исключение.
+    После завершения ключ освобождается, следующий вызов выполняется заново.
+    """
+
+    def __init__(self):
+        self.stats = SingleFlightStats()
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Выполняет func или дожидается результата уже выполняющегося вызова с тем же ключом.
+
+        Args:
+            key: Ключ вызова
+            func: Функция без аргументов
+
+        Raises:
+            Exception: Исключение, выброшенное func
+        """
+        with self._lock:
+            self.stats.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats.executions += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def in_flight(self) -> int:
+        """Количество выполняющихся вызовов."""
+        with self._lock:
+            return len(self._calls)
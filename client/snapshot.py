@@ -0,0 +1,630 @@
+"""
+Снимки коллекции: списки objectIDs и записи объектов по отделам.
+
+Снимок хранится в колоночном формате: для каждого отдела отдельная директория
+с файлами-колонками фиксированной ширины (ID, хеш записи, смещения, поля записи)
+и файлом тел записей. Колонки читаются через mmap, поэтому поиск объекта по ID
+затрагивает только нужные страницы файлов.
+
+Запуск:
+    python -m client.snapshot build --records      # снимок с записями объектов
+    python -m client.snapshot get 437133           # запись объекта из последнего снимка
+    python -m client.snapshot diff                 # изменения относительно предыдущего снимка
+    python -m client.snapshot validate --workers 4 # пакетная проверка записей снимка
+"""
+import argparse
+import bisect
+import hashlib
+import heapq
+import json
+import mmap
+import shutil
+import sys
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import count, repeat
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from config import settings
+from client.crawler import CrawlResult, ObjectCrawler, STATUS_OK
+from client.urls import build_url
+from models.batch import BatchValidator, format_summary
+from models.lazy import LazyModel, lazy_model
+from models.object import ObjectSchema
+
+
+# Колонки фиксированной ширины, извлекаемые из записей: имя поля и код типа array
+COLUMNS = (
+    ("objectBeginDate", "i"),
+    ("objectEndDate", "i"),
+    ("isPublicDomain", "b"),
+    ("isHighlight", "b"),
+)
+
+# Представление записи объекта с разбором только полей колонок
+_ColumnsView = lazy_model(ObjectSchema, [name for name, _ in COLUMNS])
+
+# Значения колонок для отсутствующих полей и объектов без записи
+NULLS = {"i": -2 ** 31, "b": -1}
+
+
+def record_digest(raw: bytes) -> int:
+    """Возвращает 64-битный хеш тела записи для сравнения снимков."""
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "little")
+
+
+def _column_value(value, typecode: str) -> int:
+    """Приводит значение поля записи к значению колонки."""
+    if value is None or isinstance(value, (str, list, dict)):
+        return NULLS[typecode]
+    return int(value)
+
+
+def _column_field(record: Optional[LazyModel], name: str):
+    """Возвращает провалидированное значение поля записи или None для некорректной записи."""
+    if record is None:
+        return None
+    try:
+        return getattr(record, name)
+    except (ValueError, TypeError):
+        return None
+
+
+def _map_column(path: Path, typecode: str) -> tuple[Optional[mmap.mmap], memoryview]:
+    """Отображает файл колонки в память; возвращает (mmap или None, memoryview)."""
+    if not path.exists() or path.stat().st_size == 0:
+        return None, memoryview(array(typecode))
+
+    with path.open("rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return mapped, memoryview(mapped).cast(typecode)
+
+
+class Shard:
+    """Данные одного отдела в снимке, отображенные в память."""
+
+    def __init__(self, path: Path):
+        """
+        Открывает файлы колонок отдела.
+
+        Args:
+            path: Директория отдела в снимке
+        """
+        self.path = path
+        self._maps = []
+        self.ids = self._map("ids.bin", "I")
+        self.digests = self._map("digest.bin", "Q")
+        self.offsets = self._map("offsets.bin", "Q")
+        self.records = self._map("records.bin", "B")
+        self.columns = {name: self._map(f"col_{name}.bin", typecode) for name, typecode in COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def index_of(self, object_id: int) -> Optional[int]:
+        """Возвращает позицию объекта в колонках или None (двоичный поиск по ID)."""
+        index = bisect.bisect_left(self.ids, object_id)
+        if index < len(self.ids) and self.ids[index] == object_id:
+            return index
+        return None
+
+    def get_raw(self, object_id: int) -> Optional[bytes]:
+        """Возвращает тело записи объекта или None, если записи нет."""
+        index = self.index_of(object_id)
+        return self.record_at(index) if index is not None else None
+
+    def record_at(self, index: int) -> Optional[bytes]:
+        """Возвращает тело записи по позиции в колонках или None, если записи нет."""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return bytes(self.records[start:end]) if end > start else None
+
+    def close(self):
+        """Освобождает отображения файлов."""
+        for view in (self.ids, self.digests, self.offsets, self.records, *self.columns.values()):
+            view.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps.clear()
+
+    def _map(self, name: str, typecode: str) -> memoryview:
+        mapped, view = _map_column(self.path / name, typecode)
+        if mapped is not None:
+            self._maps.append(mapped)
+        return view
+
+
+class _ShardWriter:
+    """Накопление ID и записей одного отдела до записи колонок."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.mkdir(parents=True)
+        self.ids: set[int] = set()
+        # ID -> (смещение, длина) тела записи во временном файле
+        self.records: dict[int, tuple[int, int]] = {}
+        self._tmp_path = path / "records.tmp"
+        self._tmp = self._tmp_path.open("w+b")
+        self._tmp_size = 0
+
+    def add_record(self, object_id: int, raw: bytes):
+        self.ids.add(object_id)
+        self.records[object_id] = (self._tmp_size, len(raw))
+        self._tmp.write(raw)
+        self._tmp_size += len(raw)
+
+    def write(self) -> dict:
+        """Записывает колонки отдела и возвращает описание для манифеста."""
+        object_ids = array("I", sorted(self.ids))
+        digests = array("Q")
+        offsets = array("Q", [0])
+        columns = {name: array(typecode) for name, typecode in COLUMNS}
+
+        self._tmp.flush()
+        tmp = mmap.mmap(self._tmp.fileno(), 0, access=mmap.ACCESS_READ) if self._tmp_size else b""
+
+        with (self.path / "records.bin").open("wb") as records:
+            written = 0
+            for object_id in object_ids:
+                location = self.records.get(object_id)
+                record = None
+
+                if location is not None:
+                    start, length = location
+                    raw = tmp[start:start + length]
+                    records.write(raw)
+                    written += length
+                    digests.append(record_digest(raw))
+                    # Из тела записи разбираются только поля колонок
+                    record = _ColumnsView(raw)
+                else:
+                    # Колонка хешей выровнена с колонкой ID: 0 - записи нет
+                    digests.append(0)
+                offsets.append(written)
+
+                for name, typecode in COLUMNS:
+                    columns[name].append(_column_value(_column_field(record, name), typecode))
+
+        if self._tmp_size:
+            tmp.close()
+        self._tmp.close()
+        self._tmp_path.unlink()
+
+        for name, data in (("ids.bin", object_ids), ("digest.bin", digests), ("offsets.bin", offsets),
+                           *((f"col_{name}.bin", data) for name, data in columns.items())):
+            with (self.path / name).open("wb") as f:
+                data.tofile(f)
+
+        return {
+            "count": len(object_ids),
+            "records": len(self.records),
+            "min_id": object_ids[0] if object_ids else None,
+            "max_id": object_ids[-1] if object_ids else None
+        }
+
+
+class Snapshot:
+    """Снимок коллекции, открытый для чтения."""
+
+    def __init__(self, path: Path):
+        """
+        Открывает снимок.
+
+        Args:
+            path: Директория снимка
+
+        Raises:
+            ValueError: Если снимок записан с другим порядком байтов
+        """
+        self.path = path
+        self.manifest = json.loads((path / "manifest.json").read_text(encoding="utf-8"))
+        if self.manifest["byteorder"] != sys.byteorder:
+            raise ValueError(f"Снимок {path.name} записан с порядком байтов {self.manifest['byteorder']}")
+        self._shards: dict[int, Shard] = {}
+
+    @property
+    def id(self) -> str:
+        return self.manifest["id"]
+
+    @property
+    def created(self) -> datetime:
+        return datetime.fromisoformat(self.manifest["created"])
+
+    def department_ids(self) -> list[int]:
+        """Возвращает ID отделов в снимке."""
+        return sorted(int(dep_id) for dep_id in self.manifest["shards"])
+
+    def shard(self, department_id: int) -> Shard:
+        """Возвращает данные отдела, открывая файлы при первом обращении."""
+        shard = self._shards.get(department_id)
+        if shard is None:
+            if str(department_id) not in self.manifest["shards"]:
+                raise KeyError(f"Отдел {department_id} отсутствует в снимке {self.id}")
+            shard = self._shards[department_id] = Shard(self.path / f"dept_{department_id}")
+        return shard
+
+    def find(self, object_id: int) -> Optional[int]:
+        """Возвращает ID отдела, в котором находится объект, или None."""
+        for dep_id, meta in self.manifest["shards"].items():
+            if meta["count"] and meta["min_id"] <= object_id <= meta["max_id"]:
+                if self.shard(int(dep_id)).index_of(object_id) is not None:
+                    return int(dep_id)
+        return None
+
+    def get_raw(self, object_id: int) -> Optional[bytes]:
+        """Возвращает тело записи объекта или None."""
+        dep_id = self.find(object_id)
+        return self.shard(dep_id).get_raw(object_id) if dep_id is not None else None
+
+    def get(self, object_id: int) -> Optional[dict]:
+        """Возвращает запись объекта или None."""
+        raw = self.get_raw(object_id)
+        return json.loads(raw) if raw is not None else None
+
+    def __contains__(self, object_id: int) -> bool:
+        return self.find(object_id) is not None
+
+    def records(self) -> Iterator[bytes]:
+        """Отдает сохраненные тела записей объектов по возрастанию ID без повторов."""
+        shards = [self.shard(dep_id) for dep_id in self.department_ids()]
+        # Колонки ID отделов сливаются с позициями записей, поиск объекта по отделам не нужен
+        entries = heapq.merge(*(zip(shard.ids, repeat(number), count()) for number, shard in enumerate(shards)))
+        previous = None
+        for object_id, number, index in entries:
+            if object_id == previous:
+                continue
+            raw = shards[number].record_at(index)
+            if raw is not None:
+                previous = object_id
+                yield raw
+
+    def object_ids(self) -> Iterator[int]:
+        """Отдает ID объектов всех отделов по возрастанию без повторов."""
+        previous = None
+        for object_id in heapq.merge(*(self.shard(dep_id).ids for dep_id in self.department_ids())):
+            if object_id != previous:
+                yield object_id
+                previous = object_id
+
+    def close(self):
+        """Закрывает файлы отделов."""
+        for shard in self._shards.values():
+            shard.close()
+        self._shards.clear()
+
+
+class SnapshotWriter:
+    """Запись нового снимка; снимок появляется в хранилище после commit."""
+
+    def __init__(self, path: Path, snapshot_id: str, created: datetime):
+        self.path = path
+        self.snapshot_id = snapshot_id
+        self.created = created
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        if self._tmp_path.exists():
+            shutil.rmtree(self._tmp_path)
+        self._tmp_path.mkdir(parents=True)
+        self._shards: dict[int, _ShardWriter] = {}
+
+    def add_ids(self, department_id: int, object_ids: Iterable[int]):
+        """Добавляет ID объектов отдела."""
+        self._shard(department_id).ids.update(object_ids)
+
+    def add_record(self, department_id: int, object_id: int, raw: bytes):
+        """Добавляет тело записи объекта отдела."""
+        self._shard(department_id).add_record(object_id, raw)
+
+    def commit(self) -> Snapshot:
+        """Записывает колонки всех отделов и публикует снимок."""
+        shards = {str(dep_id): writer.write() for dep_id, writer in sorted(self._shards.items())}
+        manifest = {
+            "id": self.snapshot_id,
+            "created": self.created.isoformat(timespec="seconds"),
+            "byteorder": sys.byteorder,
+            "columns": dict(COLUMNS),
+            "shards": shards
+        }
+        (self._tmp_path / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        self._tmp_path.rename(self.path)
+        return Snapshot(self.path)
+
+    def _shard(self, department_id: int) -> _ShardWriter:
+        writer = self._shards.get(department_id)
+        if writer is None:
+            writer = self._shards[department_id] = _ShardWriter(self._tmp_path / f"dept_{department_id}")
+        return writer
+
+
+@dataclass
+class SnapshotDiff:
+    """Изменения между двумя снимками по отделам."""
+
+    base: str
+    target: str
+    departments: dict[int, dict[str, list[int]]] = field(default_factory=dict)
+
+    def totals(self) -> dict[str, int]:
+        """Суммарное количество добавленных, удаленных и измененных объектов."""
+        totals = {"added": 0, "removed": 0, "changed": 0}
+        for changes in self.departments.values():
+            for kind, object_ids in changes.items():
+                totals[kind] += len(object_ids)
+        return totals
+
+    def to_dict(self) -> dict:
+        return {
+            "base": self.base,
+            "target": self.target,
+            "totals": self.totals(),
+            "departments": {str(dep_id): changes for dep_id, changes in sorted(self.departments.items())}
+        }
+
+
+def diff_shards(old: Optional[Shard], new: Optional[Shard]) -> dict[str, list[int]]:
+    """
+    Сравнивает отдел в двух снимках слиянием упорядоченных колонок ID.
+
+    Объект считается измененным, если в обоих снимках есть его запись и хеши записей различаются.
+    """
+    old_ids = old.ids if old is not None else ()
+    new_ids = new.ids if new is not None else ()
+    added, removed, changed = [], [], []
+    i = j = 0
+
+    while i < len(old_ids) and j < len(new_ids):
+        old_id, new_id = old_ids[i], new_ids[j]
+        if old_id == new_id:
+            old_digest, new_digest = old.digests[i], new.digests[j]
+            if old_digest and new_digest and old_digest != new_digest:
+                changed.append(old_id)
+            i += 1
+            j += 1
+        elif old_id < new_id:
+            removed.append(old_id)
+            i += 1
+        else:
+            added.append(new_id)
+            j += 1
+
+    removed.extend(old_ids[i:])
+    added.extend(new_ids[j:])
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+class SnapshotStore:
+    """
+    Хранилище снимков коллекции.
+
+    Каждый снимок - директория с именем по времени создания. Для снимка,
+    у которого есть предыдущий, рядом с манифестом сохраняется diff.json.
+    """
+
+    def __init__(self, root: str = settings.SNAPSHOT_DIR):
+        """
+        Инициализирует хранилище.
+
+        Args:
+            root: Директория снимков
+        """
+        self.root = Path(root)
+
+    def list(self) -> list[str]:
+        """Возвращает ID опубликованных снимков от старых к новым."""
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if (p / "manifest.json").exists())
+
+    def open(self, snapshot_id: str) -> Snapshot:
+        """Открывает снимок по ID."""
+        return Snapshot(self.root / snapshot_id)
+
+    def latest(self) -> Optional[Snapshot]:
+        """Открывает последний снимок или возвращает None."""
+        snapshot_ids = self.list()
+        return self.open(snapshot_ids[-1]) if snapshot_ids else None
+
+    def writer(self) -> SnapshotWriter:
+        """Создает запись нового снимка."""
+        created = datetime.now(timezone.utc)
+        snapshot_id = created.strftime("%Y%m%dT%H%M%S%fZ")
+        return SnapshotWriter(self.root / snapshot_id, snapshot_id, created)
+
+    def diff(self, base: Snapshot, target: Snapshot, save: bool = True) -> SnapshotDiff:
+        """
+        Сравнивает два снимка по отделам.
+
+        Args:
+            base: Предыдущий снимок
+            target: Новый снимок
+            save: Сохранить результат в diff.json нового снимка
+        """
+        result = SnapshotDiff(base.id, target.id)
+
+        for dep_id in sorted(set(base.department_ids()) | set(target.department_ids())):
+            old = base.shard(dep_id) if dep_id in base.department_ids() else None
+            new = target.shard(dep_id) if dep_id in target.department_ids() else None
+            changes = diff_shards(old, new)
+            if any(changes.values()):
+                result.departments[dep_id] = changes
+
+        if save:
+            (target.path / "diff.json").write_text(json.dumps(result.to_dict()), encoding="utf-8")
+        return result
+
+
+class SnapshotBuilder:
+    """
+    Построение снимка по данным API.
+
+    Списки ID запрашиваются по отделам (/objects?departmentIds=...). Записи
+    объектов, не изменившиеся с предыдущего снимка по metadataDate, копируются
+    из него, остальные запрашиваются обходчиком с проверкой через ObjectSchema.
+    """
+
+    def __init__(self, crawler: Optional[ObjectCrawler] = None, store: Optional[SnapshotStore] = None):
+        """
+        Инициализирует построитель.
+
+        Args:
+            crawler: Обходчик объектов (по умолчанию с настройками из config.settings)
+            store: Хранилище снимков
+        """
+        self.crawler = crawler or ObjectCrawler()
+        self.crawler.keep_payload = True
+        self.store = store or SnapshotStore()
+
+    def department_ids(self) -> list[int]:
+        """Запрашивает ID отделов из /departments."""
+        response = self.crawler.client.get(build_url(f"{self.crawler.base_url}/departments"))
+        response.raise_for_status()
+        return [department["departmentId"] for department in response.json()["departments"]]
+
+    def build(self, department_ids: Optional[Iterable[int]] = None, records: bool = False,
+              incremental: bool = True) -> tuple[Snapshot, Optional[SnapshotDiff]]:
+        """
+        Строит новый снимок и сравнивает его с предыдущим.
+
+        Args:
+            department_ids: ID отделов (по умолчанию все отделы из /departments)
+            records: Сохранять записи объектов, а не только списки ID
+            incremental: Копировать неизменившиеся записи из предыдущего снимка
+
+        Returns:
+            Новый снимок и изменения относительно предыдущего (None для первого снимка)
+        """
+        department_ids = sorted(department_ids) if department_ids else self.department_ids()
+        previous = self.store.latest()
+        writer = self.store.writer()
+
+        changed_ids = None
+        if records and incremental and previous is not None:
+            since = previous.created.date().isoformat()
+            changed_ids = set(self.crawler.collect_ids(None, since))
+
+        for dep_id in department_ids:
+            object_ids = self.crawler.collect_ids([dep_id])
+            writer.add_ids(dep_id, object_ids)
+            if records:
+                self._add_records(writer, dep_id, object_ids, previous, changed_ids)
+
+        snapshot = writer.commit()
+        diff = self.store.diff(previous, snapshot) if previous is not None else None
+        if previous is not None:
+            previous.close()
+        return snapshot, diff
+
+    def _add_records(self, writer: SnapshotWriter, dep_id: int, object_ids, previous: Optional[Snapshot],
+                     changed_ids: Optional[set[int]]):
+        """Копирует неизменившиеся записи из предыдущего снимка и запрашивает остальные."""
+        shard = None
+        if changed_ids is not None:
+            try:
+                shard = previous.shard(dep_id)
+            except KeyError:
+                # Отдела не было в предыдущем снимке: все записи запрашиваются
+                pass
+
+        to_fetch = []
+        for object_id in object_ids:
+            raw = None
+            if shard is not None and object_id not in changed_ids:
+                raw = shard.get_raw(object_id)
+            if raw is not None:
+                writer.add_record(dep_id, object_id, raw)
+            else:
+                to_fetch.append(object_id)
+
+        def on_result(result: CrawlResult):
+            if result.status == STATUS_OK and result.payload is not None:
+                writer.add_record(dep_id, result.object_id, result.payload)
+
+        self.crawler.crawl(to_fetch, on_result=on_result)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Снимки коллекции по отделам")
+    parser.add_argument("--snapshot-dir", default=settings.SNAPSHOT_DIR, help="директория снимков")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="построить новый снимок")
+    build.add_argument("--department-ids", type=int, nargs="*", help="ID отделов (по умолчанию все)")
+    build.add_argument("--records", action="store_true", help="сохранять записи объектов")
+    build.add_argument("--full", action="store_true", help="запросить все записи заново")
+    build.add_argument("--workers", type=int, default=settings.CRAWL_WORKERS, help="количество потоков")
+    build.add_argument("--rate", type=float, default=settings.CRAWL_RATE, help="запросов в секунду")
+
+    commands.add_parser("list", help="список снимков")
+
+    get = commands.add_parser("get", help="запись объекта")
+    get.add_argument("object_id", type=int)
+    get.add_argument("--snapshot", help="ID снимка (по умолчанию последний)")
+
+    diff = commands.add_parser("diff", help="изменения между снимками")
+    diff.add_argument("base", nargs="?", help="предыдущий снимок (по умолчанию предпоследний)")
+    diff.add_argument("target", nargs="?", help="новый снимок (по умолчанию последний)")
+
+    validate = commands.add_parser("validate", help="пакетная проверка записей через ObjectSchema")
+    validate.add_argument("--snapshot", help="ID снимка (по умолчанию последний)")
+    validate.add_argument("--batch-size", type=int, default=settings.VALIDATION_BATCH_SIZE)
+    validate.add_argument("--workers", type=int, default=settings.VALIDATION_WORKERS,
+                          help="количество процессов (0 - без пула)")
+    validate.add_argument("--json", help="сохранить отчет в JSON файл")
+
+    args = parser.parse_args(argv)
+    store = SnapshotStore(args.snapshot_dir)
+
+    if args.command == "build":
+        builder = SnapshotBuilder(ObjectCrawler(workers=args.workers, rate=args.rate), store)
+        snapshot, changes = builder.build(args.department_ids, args.records, incremental=not args.full)
+        print(f"Снимок {snapshot.id}: отделов {len(snapshot.department_ids())}")
+        if changes is not None:
+            print(f"Изменения относительно {changes.base}: {changes.totals()}")
+
+    elif args.command == "list":
+        for snapshot_id in store.list():
+            snapshot = store.open(snapshot_id)
+            shards = snapshot.manifest["shards"].values()
+            print(f"{snapshot_id}  объектов: {sum(s['count'] for s in shards)}, "
+                  f"записей: {sum(s['records'] for s in shards)}")
+
+    elif args.command == "get":
+        snapshot = store.open(args.snapshot) if args.snapshot else store.latest()
+        if snapshot is None:
+            parser.error("снимков нет")
+        dep_id = snapshot.find(args.object_id)
+        if dep_id is None:
+            print(f"Объект {args.object_id} отсутствует в снимке {snapshot.id}")
+            return 1
+        raw = snapshot.get_raw(args.object_id)
+        print(f"Отдел: {dep_id}")
+        print(raw.decode("utf-8") if raw is not None else "Запись объекта не сохранена")
+
+    elif args.command == "diff":
+        snapshot_ids = store.list()
+        if args.base is None and len(snapshot_ids) < 2:
+            parser.error("для сравнения нужно не менее двух снимков")
+        base = store.open(args.base or snapshot_ids[-2])
+        target = store.open(args.target or snapshot_ids[-1])
+        changes = store.diff(base, target, save=False)
+        print(f"{base.id} -> {target.id}: {changes.totals()}")
+        for dep_id, kinds in sorted(changes.departments.items()):
+            print(f"  отдел {dep_id}: " + ", ".join(f"{kind} {len(ids)}" for kind, ids in kinds.items()))
+
+    elif args.command == "validate":
+        snapshot = store.open(args.snapshot) if args.snapshot else store.latest()
+        if snapshot is None:
+            parser.error("снимков нет")
+        summary = BatchValidator(args.batch_size, args.workers).validate(snapshot.records())
+        print(f"Снимок {snapshot.id}")
+        print(format_summary(summary))
+        if args.json:
+            Path(args.json).write_text(json.dumps(summary.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        return 0 if summary.ok else 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+import re
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+import requests
+
+
+# Размер фрагмента при чтении тела ответа
+CHUNK_SIZE = 64 * 1024
+
+# Наибольший ID, учитываемый битовой картой повторов (карта занимает не более 8 МБ)
+BITSET_MAX_ID = 2 ** 26 - 1
+
+_OBJECT_IDS_START = re.compile(rb'"objectIDs"\s*:\s*(\[|null)')
+_TOTAL = re.compile(rb'"total"\s*:\s*(-?\d+)')
+_INT = re.compile(rb'-?\d+')
+
+
+@dataclass
+class ObjectIDsStats:
+    """Агрегаты по списку objectIDs, посчитанные за один проход."""
+
+    total: Optional[int] = None
+    count: int = 0
+    min_id: Optional[int] = None
+    max_id: Optional[int] = None
+    duplicates: int = 0
+    non_int: int = 0
+    negative: int = 0
+    is_sorted: bool = True
+    is_null: bool = False
+
+
+class _IdBitset:
+    """
+    Растущая битовая карта для поиска повторов среди неотрицательных ID.
+
+    Карта растет до max_id; повторы ID больше max_id (ошибочных ответов API)
+    ищутся во множестве, поэтому один огромный ID не приводит к выделению
+    памяти под карту до него.
+    """
+
+    def __init__(self, max_id: int = BITSET_MAX_ID):
+        """
+        Args:
+            max_id: Наибольший ID, учитываемый битовой картой
+        """
+        self.max_id = max_id
+        self._bits = bytearray()
+        self._overflow: set[int] = set()
+
+    def add_all(self, values: list[int]) -> int:
+        """
+        Отмечает неотрицательные ID и возвращает количество уже встречавшихся.
+
+        Args:
+            values: Пачка ID
+        """
+        bits = self._bits
+        top = (min(max(values), self.max_id) >> 3) + 1
+        if top > len(bits):
+            limit = (self.max_id >> 3) + 1
+            bits.extend(bytes(min(max(top - len(bits), len(bits)), limit - len(bits))))
+
+        duplicates = 0
+        for value in values:
+            if value < 0:
+                continue
+            if value > self.max_id:
+                if value in self._overflow:
+                    duplicates += 1
+                else:
+                    self._overflow.add(value)
+                continue
+            index, mask = value >> 3, 1 << (value & 7)
+            if bits[index] & mask:
+                duplicates += 1
+            else:
+                bits[index] |= mask
+
+        return duplicates
+
+
+class ObjectIDsStreamParser:
+    """
+    Потоковый разбор ответа вида {"total": int, "objectIDs": [int, ...]}.
+
+    Тело ответа читается фрагментами, элементы objectIDs отдаются генератором
+    без построения списка, а статистика (количество, минимум, максимум, повторы,
+    нарушения типа) считается на лету. Потребление памяти не зависит от длины
+    списка, кроме битовой карты повторов: она растет до максимального ID, но
+    не больше BITSET_MAX_ID.
+    """
+
+    def __init__(self):
+        self.stats = ObjectIDsStats()
+        self._seen = _IdBitset()
+        self._prev: Optional[int] = None
+
+    def iter_object_ids(self, chunks: Iterable[bytes]) -> Iterator[int]:
+        """
+        Отдает целочисленные элементы objectIDs по мере чтения тела ответа.
+
+        Args:
+            chunks: Фрагменты тела ответа
+
+        Yields:
+            int: Очередной ID объекта
+        """
+        chunks = iter(chunks)
+        head = b""
+        tail = b""
+
+        # Ищем начало массива objectIDs, накапливая заголовок документа
+        for chunk in chunks:
+            head += chunk
+            match = _OBJECT_IDS_START.search(head)
+            if match is None:
+                continue
+
+            rest = head[match.end():]
+            head = head[:match.start()]
+
+            if match.group(1) == b"null":
+                self.stats.is_null = True
+                tail = rest
+            else:
+                tail = yield from self._iter_array(rest, chunks)
+            break
+
+        for chunk in chunks:
+            tail += chunk
+
+        total = _TOTAL.search(head) or _TOTAL.search(tail)
+        if total is not None:
+            self.stats.total = int(total.group(1))
+
+    def _iter_array(self, buffer: bytes, chunks: Iterator[bytes]):
+        """Разбирает элементы массива; возвращает данные после закрывающей скобки."""
+        while True:
+            end = buffer.find(b"]")
+            if end != -1:
+                yield from self._iter_items(buffer[:end].split(b","))
+                return buffer[end + 1:]
+
+            *items, buffer = buffer.split(b",")
+            yield from self._iter_items(items)
+
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise ValueError("Массив objectIDs не завершен")
+            buffer += chunk
+
+    def _iter_items(self, items: list[bytes]) -> Iterator[int]:
+        """Проверяет и учитывает в статистике пачку элементов массива."""
+        try:
+            values = [int(item) for item in items if item.strip()]
+        except ValueError:
+            values = self._filter_ints(items)
+
+        if not values:
+            return
+
+        self._update_stats(values)
+        yield from values
+
+    def _filter_ints(self, items: list[bytes]) -> list[int]:
+        """Отбирает целочисленные элементы, считая остальные нарушениями типа."""
+        values = []
+
+        for item in items:
+            item = item.strip()
+            if not item:
+                continue
+            if _INT.fullmatch(item):
+                values.append(int(item))
+            else:
+                self.stats.non_int += 1
+
+        return values
+
+    def _update_stats(self, values: list[int]):
+        """Обновляет статистику по пачке значений."""
+        stats = self.stats
+        batch_min, batch_max = min(values), max(values)
+
+        stats.count += len(values)
+        stats.min_id = batch_min if stats.min_id is None else min(stats.min_id, batch_min)
+        stats.max_id = batch_max if stats.max_id is None else max(stats.max_id, batch_max)
+
+        if stats.is_sorted:
+            continues = self._prev is None or values[0] >= self._prev
+            stats.is_sorted = continues and values == sorted(values)
+
+        if batch_min < 0:
+            stats.negative += sum(1 for value in values if value < 0)
+
+        stats.duplicates += self._seen.add_all(values)
+        self._prev = values[-1]
+
+
+def stream_object_ids_stats(response: requests.Response, chunk_size: int = CHUNK_SIZE) -> ObjectIDsStats:
+    """
+    Считает статистику objectIDs ответа API, не разбирая JSON целиком.
+
+    Предназначена для ответов, полученных с stream=True (APIClient.stream):
+    фрагменты читаются из сети по мере разбора и тело целиком не хранится.
+    Для уже прочитанного тела используется object_ids_stats.
+
+    Args:
+        response: Ответ API
+        chunk_size: Размер фрагмента при чтении тела
+
+    Returns:
+        ObjectIDsStats: Агрегаты по списку objectIDs
+    """
+    parser = ObjectIDsStreamParser()
+    for _ in parser.iter_object_ids(response.iter_content(chunk_size=chunk_size)):
+        pass
+    return parser.stats
+
+
+def object_ids_stats(body: bytes, chunk_size: int = CHUNK_SIZE) -> ObjectIDsStats:
+    """
+    Считает статистику objectIDs по уже прочитанному телу ответа, не разбирая JSON целиком.
+
+    Тело передается разборщику фрагментами memoryview без копирования,
+    поэтому список objectIDs не материализуется.
+
+    Args:
+        body: Тело ответа API (например, response.content закэшированного ответа)
+        chunk_size: Размер фрагмента разбора
+
+    Returns:
+        ObjectIDsStats: Агрегаты по списку objectIDs
+    """
+    view = memoryview(body)
+    parser = ObjectIDsStreamParser()
+    chunks = (view[start:start + chunk_size] for start in range(0, len(view), chunk_size))
+    for _ in parser.iter_object_ids(chunks):
+        pass
+    return parser.stats
@@ -0,0 +1,79 @@
+import json
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from client.cassette import CassetteStore
+
+
+class _CassetteHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов, отвечающий записанными кассетами."""
+
+    protocol_version = "HTTP/1.1"
+    # Заголовки и тело отправляются отдельно, без TCP_NODELAY ответ задерживается на ~40 мс
+    disable_nagle_algorithm = True
+    store: CassetteStore = None
+
+    def do_GET(self):
+        cassette = self.store.find(self.path)
+
+        if cassette is None:
+            body = json.dumps({"message": f"Ответ для {self.path} не записан"}, ensure_ascii=False).encode("utf-8")
+            self._send(404, {"Content-Type": "application/json", "X-Cassette-Miss": "1"}, body)
+            return
+
+        self._send(cassette.status, cassette.headers, cassette.body)
+
+    def _send(self, status: int, headers: dict, body: bytes):
+        """Отправляет ответ с заданными статусом, заголовками и телом."""
+        self.send_response(status)
+        for name, value in headers.items():
+            # Server и Date уже добавлены send_response
+            if name.lower() not in ("server", "date"):
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Отключает вывод журнала запросов в stderr."""
+        pass
+
+
+class StubServer:
+    """
+    Локальный HTTP-сервер, подменяющий API Метрополитен-музея.
+
+    Отдает записанные ответы для /objects, /objects/{id}, /departments и /search
+    из хранилища кассет.
+    """
+
+    def __init__(self, store: CassetteStore, host: str = "127.0.0.1", port: int = 0):
+        """
+        Инициализирует сервер.
+
+        Args:
+            store: Хранилище кассет
+            host: Адрес для прослушивания
+            port: Порт для прослушивания (0 - выбрать свободный)
+        """
+        handler = type("CassetteHandler", (_CassetteHandler,), {"store": store})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Базовый URL сервера."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        """Запускает сервер в фоновом потоке."""
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Останавливает сервер."""
+        self.server.shutdown()
+        self.server.server_close()
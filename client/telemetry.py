@@ -0,0 +1,249 @@
+"""
+Телеметрия запросов к API: замеры этапов соединения и отчет по задержкам.
+
+Отчет по файлам телеметрии: python -m client.telemetry [api_logs/telemetry.jsonl]
+"""
+import argparse
+import json
+import math
+import re
+import socket
+import threading
+import time
+
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+# Замеры установки соединения в текущем потоке
+_local = threading.local()
+
+_API_PREFIX = re.compile(r"^.*/public/collection/v1")
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+@dataclass
+class ConnectTimings:
+    """Время этапов установки нового соединения в секундах."""
+
+    dns: float = 0.0
+    connect: float = 0.0
+    tls: float = 0.0
+
+
+def reset_connect_timings():
+    """Сбрасывает замеры соединения текущего потока перед запросом."""
+    _local.timings = None
+
+
+def pop_connect_timings() -> Optional[ConnectTimings]:
+    """Возвращает замеры, если запрос открыл новое соединение, иначе None."""
+    timings = getattr(_local, "timings", None)
+    _local.timings = None
+    return timings
+
+
+class _TimedConnectionMixin:
+    """Замеряет разрешение имени и установку TCP соединения."""
+
+    def _new_conn(self):
+        timings = ConnectTimings()
+        _local.timings = timings
+        host = self._dns_host
+
+        started = time.perf_counter()
+        try:
+            address = socket.getaddrinfo(host, self.port, type=socket.SOCK_STREAM)[0][4][0]
+        except (socket.gaierror, IndexError):
+            # Ошибку разрешения имени сформирует urllib3
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        timings.dns = resolved - started
+
+        self._dns_host = address
+        try:
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = host
+
+        timings.connect = time.perf_counter() - resolved
+        return sock
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """HTTP соединение с замером этапов установки."""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """HTTPS соединение с замером этапов установки, включая TLS рукопожатие."""
+
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+
+        timings = getattr(_local, "timings", None)
+        if timings is not None:
+            timings.tls = max(time.perf_counter() - started - timings.dns - timings.connect, 0.0)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+# Классы пулов для PoolManager адаптера requests
+TIMED_POOL_CLASSES = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+
+def endpoint_of(url: str) -> str:
+    """
+    Возвращает имя эндпоинта для группировки: путь после /public/collection/v1 с {id} вместо чисел.
+
+    Args:
+        url: URL запроса
+    """
+    path = _API_PREFIX.sub("", urlsplit(url).path) or "/"
+    return _NUMERIC_SEGMENT.sub("/{id}", path)
+
+
+def build_event(url: str, status: Optional[int], total: float, ttfb: float = 0.0,
+                size: int = 0, cache: str = "miss", timings: Optional[ConnectTimings] = None,
+                error: Optional[str] = None, wire_size: Optional[int] = None) -> dict:
+    """
+    Формирует событие телеметрии запроса.
+
+    Args:
+        url: URL запроса
+        status: HTTP статус ответа (None при ошибке запроса)
+        total: Полное время запроса в секундах
+        ttfb: Время до получения заголовков ответа в секундах
+        size: Размер тела ответа в байтах
+        cache: Результат обращения к кэшу (hit, miss, bypass)
+        timings: Замеры установки нового соединения
+        error: Текст ошибки запроса
+        wire_size: Размер тела ответа при передаче (до распаковки сжатия)
+    """
+    event = {
+        "ts": round(time.time(), 3),
+        "url": url,
+        "endpoint": endpoint_of(url),
+        "params": dict(parse_qsl(urlsplit(url).query, keep_blank_values=True)),
+        "status": status,
+        "cache": cache,
+        "bytes": size,
+        "new_connection": timings is not None,
+        "timings_ms": {
+            **{name: round(value * 1000, 3) for name, value in asdict(timings or ConnectTimings()).items()},
+            "ttfb": round(ttfb * 1000, 3),
+            "total": round(total * 1000, 3)
+        }
+    }
+    if wire_size is not None:
+        event["wire_bytes"] = wire_size
+    if error is not None:
+        event["error"] = error
+    return event
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """
+    Возвращает перцентиль методом ближайшего ранга.
+
+    Args:
+        sorted_values: Упорядоченные по возрастанию значения
+        percent: Перцентиль от 0 до 100
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def telemetry_files(path: str) -> list[Path]:
+    """Возвращает файл телеметрии, файлы процессов-исполнителей и их ротированные копии."""
+    base = Path(path)
+    stem = base.name[:-len(".jsonl")] if base.name.endswith(".jsonl") else base.name
+    return sorted(p for p in base.parent.glob(f"{stem}*.jsonl*") if p.is_file())
+
+
+def aggregate(paths: Iterable[Path], include_cache_hits: bool = False) -> dict[str, dict]:
+    """
+    Считает статистику задержек по эндпоинтам.
+
+    Args:
+        paths: Файлы телеметрии
+        include_cache_hits: Учитывать ответы из кэша
+
+    Returns:
+        Словарь эндпоинт -> статистика (count, errors, bytes, p50/p95/p99 в мс)
+    """
+    totals = defaultdict(list)
+    ttfbs = defaultdict(list)
+    errors = defaultdict(int)
+    sizes = defaultdict(int)
+
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+
+                if event.get("cache") == "hit" and not include_cache_hits:
+                    continue
+
+                endpoint = event.get("endpoint", "?")
+                status = event.get("status")
+                if status is None or status >= 500:
+                    errors[endpoint] += 1
+                if status is None:
+                    continue
+
+                totals[endpoint].append(event["timings_ms"]["total"])
+                ttfbs[endpoint].append(event["timings_ms"]["ttfb"])
+                sizes[endpoint] += event.get("bytes", 0)
+
+    report = {}
+    for endpoint in sorted(set(totals) | set(errors)):
+        values = sorted(totals[endpoint])
+        ttfb = sorted(ttfbs[endpoint])
+        report[endpoint] = {
+            "count": len(values),
+            "errors": errors[endpoint],
+            "bytes": sizes[endpoint],
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "ttfb_p50": percentile(ttfb, 50)
+        }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Перцентили задержек запросов по эндпоинтам")
+    parser.add_argument("path", nargs="?", default=str(Path(__file__).parent.parent / "api_logs" / "telemetry.jsonl"),
+                        help="файл телеметрии (ротированные копии учитываются автоматически)")
+    parser.add_argument("--include-cache-hits", action="store_true", help="учитывать ответы из кэша")
+    args = parser.parse_args(argv)
+
+    report = aggregate(telemetry_files(args.path), args.include_cache_hits)
+
+    print(f"{'эндпоинт':<24}{'запросов':>10}{'ошибок':>8}{'p50, мс':>10}{'p95, мс':>10}{'p99, мс':>10}"
+          f"{'TTFB p50':>10}{'МБ':>8}")
+    for endpoint, stats in report.items():
+        print(f"{endpoint:<24}{stats['count']:>10}{stats['errors']:>8}{stats['p50']:>10.1f}{stats['p95']:>10.1f}"
+              f"{stats['p99']:>10.1f}{stats['ttfb_p50']:>10.1f}{stats['bytes'] / 1024 / 1024:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
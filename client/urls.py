@@ -0,0 +1,125 @@
+import sys
+
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+
+# Порты по умолчанию, которые не включаются в канонический URL
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Размер кэшей построенных URL и ключей запросов
+URL_CACHE_SIZE = 4096
+
+
+def normalize_value(value: Any) -> str:
+    """
+    Приводит значение query-параметра к строке.
+
+    Логические значения записываются как true/false, последовательности -
+    через "|" (формат departmentIds).
+
+    Args:
+        value: Значение параметра
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return "|".join(normalize_value(item) for item in value)
+    return str(value)
+
+
+def encode_query(pairs: Iterable[tuple[str, str]]) -> str:
+    """
+    Формирует канонический query string: пары упорядочены, символы вне
+    unreserved (RFC 3986) кодируются процентами, пробел - как %20.
+
+    Args:
+        pairs: Пары (имя, значение)
+    """
+    return urlencode(sorted(pairs), quote_via=quote, safe="")
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def canonical_url(url: str) -> str:
+    """
+    Возвращает канонический вид URL.
+
+    Схема и хост приводятся к нижнему регистру, порт по умолчанию и фрагмент
+    отбрасываются, query-параметры упорядочиваются и кодируются единообразно,
+    поэтому эквивалентные запросы получают одинаковую строку. Результат
+    интернируется: равные URL представлены одним объектом строки.
+
+    Args:
+        url: URL запроса
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+
+    netloc = (parts.hostname or "").lower()
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{parts.port}"
+
+    query = encode_query(parse_qsl(parts.query, keep_blank_values=True))
+    return sys.intern(urlunsplit((scheme, netloc, parts.path or "/", query, "")))
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def request_key(url: str, with_host: bool = True) -> str:
+    """
+    Возвращает ключ запроса для кэшей и слоев дедупликации.
+
+    Args:
+        url: URL запроса
+        with_host: Учитывать схему и хост (False - только путь и query,
+            например для ответов, воспроизводимых с другого хоста)
+    """
+    url = canonical_url(url)
+    if with_host:
+        return url
+
+    parts = urlsplit(url)
+    return sys.intern(f"{parts.path}?{parts.query}" if parts.query else parts.path)
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _build_url(endpoint: str, sep: str, params: tuple[tuple[str, Any], ...]) -> str:
+    """Строит канонический URL из хешируемого набора параметров."""
+    pairs = [(name, normalize_value(value)) for name, value in params if value is not None]
+    if not pairs:
+        return sys.intern(endpoint)
+
+    base, has_query, query = endpoint.partition("?")
+    if has_query:
+        # У endpoint уже есть query: параметры объединяются в один query string,
+        # переданные значения заменяют одноименные параметры endpoint
+        names = {name for name, _ in pairs}
+        pairs.extend((name, value) for name, value in parse_qsl(query, keep_blank_values=True)
+                     if name not in names)
+        return sys.intern(f"{base}?{encode_query(pairs)}")
+
+    return sys.intern(f"{endpoint}{sep}{encode_query(pairs)}")
+
+
+def build_url(endpoint: str, sep: Optional[str] = "?", **params) -> str:
+    """
+    Формирует канонический URL с query-параметрами.
+
+    Параметры со значением None пропускаются. Если endpoint уже содержит
+    query, параметры объединяются с ним (переданные значения заменяют
+    одноименные) и sep не используется. Построенные URL кэшируются,
+    повторный вызов с теми же аргументами возвращает тот же объект строки.
+
+    Args:
+        endpoint: Базовый URL endpoint
+        sep: Разделитель перед query-параметрами endpoint без query (None - "?")
+        **params: Параметры для добавления в query string
+    """
+    sep = "?" if sep is None else sep
+    items = tuple(sorted((name, tuple(value) if isinstance(value, list) else value)
+                         for name, value in params.items()))
+    try:
+        return _build_url(endpoint, sep, items)
+    except TypeError:
+        # Нехешируемые значения параметров строятся без кэша
+        return _build_url.__wrapped__(endpoint, sep, items)
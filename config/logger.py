@@ -1,9 +1,259 @@
+import atexit
+import heapq
+import json
 import logging
+import os
+import queue
+import re
+import threading
+
+from logging.handlers import MemoryHandler, QueueHandler, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+
+from config import settings
+
+
+# Переменные окружения с идентификатором процесса-исполнителя при параллельном запуске.
+# Идентификатор pytest-xdist важнее: унаследованный METAPI_WORKER_ID одинаков у всех исполнителей
+WORKER_ENV_VARS = ("PYTEST_XDIST_WORKER", "METAPI_WORKER_ID")
+
+# Шарды исполнителей pytest-xdist (gw0, gw1, ...), которые объединяет управляющий процесс.
+# Шарды процессов с METAPI_WORKER_ID (например, нагрузочного прогона) не объединяются и не удаляются
+XDIST_SHARD_GLOB = "*.gw[0-9]*.log"
+# Файлы телеметрии исполнителей pytest-xdist вместе с ротированными копиями
+XDIST_TELEMETRY_GLOB = "*.gw[0-9]*.jsonl*"
+
+_RECORD_START = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} - ")
+
+
+def get_worker_id() -> Optional[str]:
+    """Возвращает идентификатор процесса-исполнителя или None для обычного запуска."""
+    for name in WORKER_ENV_VARS:
+        value = os.environ.get(name)
+        if value:
+            return value
+    return None
+
+
+# Типы аргументов, которые безопасно форматировать в фоновом потоке
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None), bytes})
+
+
+class BackpressureQueueHandler(QueueHandler):
+    """
+    Обработчик, передающий записи в очередь фонового потока записи.
+
+    При переполнении очереди действует политика:
+    - drop_low: записи ниже WARNING отбрасываются, остальные ждут место в очереди
+    - drop: отбрасываются любые записи
+    - block: поток ждет освобождения места в очереди
+    """
+
+    POLICIES = ("drop_low", "drop", "block")
+
+    # Максимальное ожидание места в очереди для важных записей
+    BLOCK_TIMEOUT = 1.0
+
+    def __init__(self, log_queue: queue.Queue, policy: str = "drop_low"):
+        """
+        Инициализирует обработчик.
+
+        Args:
+            log_queue: Очередь фонового потока записи
+            policy: Политика при переполнении очереди
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Неизвестная политика переполнения очереди логов: {policy}")
+
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Готовит запись к передаче в фоновый поток.
+
+        Очередь работает внутри процесса, поэтому запись не копируется.
+        Сообщение собирается в фоновом потоке, если аргументы неизменяемые;
+        изменяемые аргументы и исключения форматируются сразу, пока они актуальны.
+        """
+        if record.exc_info or (record.args and not all(type(arg) in _IMMUTABLE_TYPES for arg in record.args)):
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+                record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        """Помещает запись в очередь с учетом политики переполнения."""
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if self.policy == "drop" or (self.policy == "drop_low" and record.levelno < logging.WARNING):
+            self.dropped += 1
+            return
+
+        timeout = None if self.policy == "block" else self.BLOCK_TIMEOUT
+        try:
+            self.queue.put(record, timeout=timeout)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogWriter:
+    """
+    Фоновый поток записи логов всех APILogger.
+
+    Записи накапливаются в буфере обработчика каждого лога и сбрасываются
+    на диск пачками: при заполнении буфера, при записи уровня ERROR и выше,
+    а также когда очередь простаивает дольше интервала сброса.
+    """
+
+    _STOP = object()
+
+    def __init__(self, queue_size: int = 10000, batch_size: int = 200,
+                 flush_interval: float = 0.5, policy: str = "drop_low"):
+        """
+        Инициализирует поток записи.
+
+        Args:
+            queue_size: Максимальный размер очереди записей
+            batch_size: Количество записей в буфере до сброса на диск
+            flush_interval: Время простоя очереди в секундах до сброса буферов
+            policy: Политика при переполнении очереди
+        """
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue_handler = BackpressureQueueHandler(self.queue, policy)
+
+        self._targets: dict[str, MemoryHandler] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def register(self, logger_name: str, handler: logging.Handler):
+        """
+        Назначает обработчик для записей указанного логера.
+
+        Args:
+            logger_name: Имя логера
+            handler: Обработчик, выполняющий запись на диск
+        """
+        buffered = MemoryHandler(self.batch_size, flushLevel=logging.ERROR, target=handler)
+
+        with self._lock:
+            previous = self._targets.pop(logger_name, None)
+            self._targets[logger_name] = buffered
+            self._ensure_started()
+
+        if previous is not None:
+            self.flush()
+            self._close_target(previous)
+
+    def flush(self, timeout: float = 5.0):
+        """
+        Дожидается записи всех поставленных в очередь сообщений.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах
+        """
+        if self._thread is None:
+            return
+
+        done = threading.Event()
+        try:
+            self.queue.put(done, timeout=timeout)
+        except queue.Full:
+            return
+        done.wait(timeout)
+
+    def stop(self):
+        """Записывает оставшиеся сообщения и останавливает поток."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is not None:
+            self.queue.put(self._STOP)
+            thread.join()
+
+        with self._lock:
+            for buffered in self._targets.values():
+                self._close_target(buffered)
+            self._targets.clear()
+
+    @staticmethod
+    def _close_target(buffered: MemoryHandler):
+        """Сбрасывает буфер и закрывает файл лога."""
+        target = buffered.target
+        buffered.close()
+        if target is not None:
+            target.close()
+
+    def _ensure_started(self):
+        """Запускает фоновый поток, если он еще не запущен."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="api-log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Цикл фонового потока: обработка записей и периодический сброс буферов."""
+        while True:
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush_targets()
+                continue
+
+            if item is self._STOP:
+                self._flush_targets()
+                return
+
+            if isinstance(item, threading.Event):
+                self._flush_targets()
+                item.set()
+                continue
+
+            target = self._targets.get(item.name)
+            if target is not None:
+                target.handle(item)
+
+    def _flush_targets(self):
+        """Сбрасывает буферы всех логов на диск."""
+        for buffered in list(self._targets.values()):
+            buffered.flush()
+
+
+_writer = None
+
+
+def get_log_writer() -> LogWriter:
+    """Возвращает общий фоновый поток записи логов."""
+    global _writer
+    if _writer is None:
+        _writer = LogWriter(
+            queue_size=settings.LOG_QUEUE_SIZE,
+            batch_size=settings.LOG_BATCH_SIZE,
+            flush_interval=settings.LOG_FLUSH_INTERVAL,
+            policy=settings.LOG_BACKPRESSURE
+        )
+        atexit.register(_writer.stop)
+    return _writer
 
 
 class APILogger:
-    """Логер для записи результатов выполнения API тестов."""
+    """
+    Логер для записи результатов выполнения API тестов.
+
+    Запись в файл выполняется фоновым потоком, поэтому вызовы логера не
+    блокируют тест. Сообщения форматируются лениво: аргументы передаются
+    отдельно от шаблона (logger.debug("Код: %s", code)), и для отключенных
+    уровней строка не собирается.
+    """
 
     def __init__(self, api_name: str, log_dir: str = None):
         """
@@ -32,7 +282,7 @@ class APILogger:
         """Создает и настраивает объект логера."""
         logger_name = f"api_tests.{self.api_name}"
         logger = logging.getLogger(logger_name)
-        logger.setLevel(logging.DEBUG)
+        logger.setLevel(settings.LOG_LEVEL)
 
         # Очищаем существующие обработчики
         logger.handlers.clear()
@@ -43,8 +293,10 @@ class APILogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
 
-        # Создаем file handler с режимом перезаписи
-        log_file = self.log_dir / f"{self.api_name}.log"
+        # Создаем file handler с режимом перезаписи.
+        # При параллельном запуске каждый процесс пишет в свой файл-шард,
+        # который объединяется с остальными при завершении прогона
+        log_file = self.get_shard_path() or self.get_log_file_path()
         file_handler = logging.FileHandler(
             str(log_file),
             mode='w',
@@ -53,38 +305,228 @@ class APILogger:
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.DEBUG)
 
-        # Добавляем обработчик
-        logger.addHandler(file_handler)
+        # Запись в файл выполняет фоновый поток, логер только ставит записи в очередь
+        writer = get_log_writer()
+        writer.register(logger_name, file_handler)
+
+        logger.addHandler(writer.queue_handler)
         logger.propagate = False
 
         return logger
 
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """Записывает информационное сообщение в лог."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """Записывает отладочное сообщение в лог."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Записывает предупреждение в лог."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message: str, exc_info: bool = False):
+    def error(self, message: str, *args, exc_info: bool = False):
         """
         Записывает сообщение об ошибке в лог.
 
         Args:
             message: Текст сообщения об ошибке
+            *args: Аргументы для подстановки в сообщение
             exc_info: Флаг для включения информации об исключении
         """
-        self.logger.error(message, exc_info=exc_info)
+        self.logger.error(message, *args, exc_info=exc_info)
 
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """Записывает сообщение о критической ошибке в лог."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
+
+    def flush(self):
+        """Дожидается записи всех сообщений в файл."""
+        get_log_writer().flush()
 
     def get_log_file_path(self) -> Path:
         """Возвращает путь к файлу лога."""
-        return self.log_dir / f"{self.api_name}.log"
\ No newline at end of file
+        return self.log_dir / f"{self.api_name}.log"
+
+    def get_shard_path(self) -> Optional[Path]:
+        """Возвращает путь к файлу-шарду процесса-исполнителя или None для обычного запуска."""
+        worker_id = get_worker_id()
+        if worker_id is None:
+            return None
+        return self.log_dir / f"{self.api_name}.{worker_id}.log"
+
+
+class TelemetryLogger:
+    """
+    Канал структурированной телеметрии запросов.
+
+    Каждое событие записывается одной строкой JSON в файл с ротацией по размеру.
+    Запись выполняет тот же фоновый поток, что и для APILogger.
+    """
+
+    def __init__(self, name: str = "telemetry", log_dir: str = None,
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        """
+        Инициализирует канал телеметрии.
+
+        Args:
+            name: Имя файла телеметрии без расширения
+            log_dir: Директория для сохранения файлов
+            max_bytes: Размер файла, при котором выполняется ротация
+            backup_count: Количество хранимых файлов после ротации
+        """
+        if log_dir is None:
+            self.log_dir = Path(__file__).parent.parent / "api_logs"
+        else:
+            self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(exist_ok=True)
+
+        # Ротация файла небезопасна при записи из нескольких процессов, поэтому у каждого свой файл
+        worker_id = get_worker_id()
+        suffix = f".{worker_id}" if worker_id else ""
+        self.path = self.log_dir / f"{name}{suffix}.jsonl"
+
+        handler = RotatingFileHandler(
+            str(self.path),
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        logger_name = f"api_telemetry.{name}"
+        writer = get_log_writer()
+        writer.register(logger_name, handler)
+
+        self.logger = logging.getLogger(logger_name)
+        self.logger.setLevel(logging.INFO)
+        self.logger.handlers.clear()
+        self.logger.addHandler(writer.queue_handler)
+        self.logger.propagate = False
+
+    def event(self, **fields):
+        """Записывает событие телеметрии."""
+        self.logger.info("%s", json.dumps(fields, ensure_ascii=False))
+
+
+def _read_records(path: Path):
+    """Читает записи лога, объединяя многострочные записи (трассировки) с их началом."""
+    record = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if _RECORD_START.match(line) or record is None:
+                if record is not None:
+                    yield record
+                record = line
+            else:
+                record += line
+    if record is not None:
+        yield record
+
+
+def merge_log_shards(log_dir: str = None) -> list[Path]:
+    """
+    Объединяет файлы-шарды процессов-исполнителей в общие файлы логов.
+
+    Шарды <api_name>.gw<N>.log сливаются по времени записей в <api_name>.log,
+    после чего удаляются. Записи одной секунды идут в порядке шардов.
+
+    Args:
+        log_dir: Директория логов
+
+    Returns:
+        Список объединенных файлов логов
+    """
+    log_dir = Path(log_dir) if log_dir else Path(__file__).parent.parent / "api_logs"
+
+    shards = {}
+    for path in sorted(log_dir.glob(XDIST_SHARD_GLOB)):
+        api_name = path.name.split(".", 1)[0]
+        shards.setdefault(api_name, []).append(path)
+
+    merged = []
+    for api_name, paths in shards.items():
+        # Шарды упорядочены по времени, поэтому сливаются потоково; время - первые 19 символов записи
+        records = heapq.merge(*(_read_records(path) for path in paths), key=lambda record: record[:19])
+
+        target = log_dir / f"{api_name}.log"
+        tmp_path = target.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(records)
+        tmp_path.replace(target)
+
+        for path in paths:
+            path.unlink()
+        merged.append(target)
+
+    return merged
+
+
+def _read_lines(paths: list[Path]):
+    """Читает строки файлов по порядку."""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            yield from f
+
+
+def _event_time(line: str) -> float:
+    """Возвращает время события телеметрии (0 для строк без времени)."""
+    try:
+        return json.loads(line).get("ts", 0)
+    except (ValueError, AttributeError):
+        return 0
+
+
+def _rotation_index(path: Path) -> int:
+    """Номер ротированной копии файла телеметрии (0 для текущего файла)."""
+    suffix = path.name.rsplit(".", 1)[-1]
+    return int(suffix) if suffix.isdigit() else 0
+
+
+def merge_telemetry_shards(log_dir: str = None) -> list[Path]:
+    """
+    Дописывает файлы телеметрии процессов-исполнителей в общий файл телеметрии.
+
+    Файлы <name>.gw<N>.jsonl и их ротированные копии сливаются по времени
+    событий в конец <name>.jsonl, после чего удаляются.
+
+    Args:
+        log_dir: Директория логов
+
+    Returns:
+        Список дополненных файлов телеметрии
+    """
+    log_dir = Path(log_dir) if log_dir else Path(__file__).parent.parent / "api_logs"
+
+    shards = {}
+    for path in log_dir.glob(XDIST_TELEMETRY_GLOB):
+        name, worker_id = path.name.split(".", 2)[:2]
+        shards.setdefault(name, {}).setdefault(worker_id, []).append(path)
+
+    merged = []
+    for name, workers in sorted(shards.items()):
+        # Внутри исполнителя события упорядочены: от старших ротированных копий к текущему файлу
+        streams = []
+        for paths in workers.values():
+            paths.sort(key=_rotation_index, reverse=True)
+            streams.append(_read_lines(paths))
+
+        target = log_dir / f"{name}.jsonl"
+        with open(target, "a", encoding="utf-8") as f:
+            f.writelines(heapq.merge(*streams, key=_event_time))
+
+        for paths in workers.values():
+            for path in paths:
+                path.unlink()
+        merged.append(target)
+
+    return merged
+
+
+def remove_log_shards(log_dir: str = None):
+    """Удаляет оставшиеся от прерванных прогонов файлы-шарды и телеметрию исполнителей pytest-xdist."""
+    log_dir = Path(log_dir) if log_dir else Path(__file__).parent.parent / "api_logs"
+    for pattern in (XDIST_SHARD_GLOB, XDIST_TELEMETRY_GLOB):
+        for path in log_dir.glob(pattern):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,97 @@
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    """Читает целочисленную настройку из переменной окружения."""
+    value = os.environ.get(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Читает вещественную настройку из переменной окружения."""
+    value = os.environ.get(name)
+    return float(value) if value not in (None, "") else default
+
+
+# Кэш ответов API (в памяти, общий на весь прогон)
+CACHE_TTL = _env_float("METAPI_CACHE_TTL", 600.0)
+CACHE_MAX_ENTRIES = _env_int("METAPI_CACHE_MAX_ENTRIES", 256)
+CACHE_MAX_BYTES = _env_int("METAPI_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+
+# Постоянный кэш ответов на диске с условной перепроверкой (ETag/Last-Modified)
+DISK_CACHE_ENABLED = os.environ.get("METAPI_DISK_CACHE", "1") not in ("0", "false", "no")
+DISK_CACHE_DIR = os.environ.get("METAPI_DISK_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".http_cache"
+)
+DISK_CACHE_MAX_BYTES = _env_int("METAPI_DISK_CACHE_MAX_BYTES", 512 * 1024 * 1024)
+
+# Общая директория ответов API процессов-исполнителей одного прогона
+# (при запуске pytest -n создается автоматически)
+SHARED_DIR = os.environ.get("METAPI_SHARED_DIR")
+
+# Пул соединений HTTP-сессии
+POOL_CONNECTIONS = _env_int("METAPI_POOL_CONNECTIONS", 4)
+POOL_MAXSIZE = _env_int("METAPI_POOL_MAXSIZE", 10)
+
+# Повторы запросов при ответе 502 Bad Gateway
+RETRY_TOTAL = _env_int("METAPI_RETRY_TOTAL", 2)
+RETRY_BACKOFF = _env_float("METAPI_RETRY_BACKOFF", 0.5)
+
+# Адаптивное ограничение частоты запросов к API (0 - без ограничения): частота
+# снижается при ответах 429/503 и Retry-After и постепенно растет до RATE_LIMIT
+RATE_LIMIT = _env_float("METAPI_RATE_LIMIT", 80.0)
+RATE_LIMIT_MIN = _env_float("METAPI_RATE_LIMIT_MIN", 1.0)
+
+# Автомат выключения запросов к эндпоинту после серии ошибок (0 - отключен)
+BREAKER_THRESHOLD = _env_int("METAPI_BREAKER_THRESHOLD", 5)
+BREAKER_RESET_TIMEOUT = _env_float("METAPI_BREAKER_RESET_TIMEOUT", 30.0)
+
+# Параллельная предзагрузка параметризованных URL
+PREFETCH_CONCURRENCY = _env_int("METAPI_PREFETCH_CONCURRENCY", 8)
+PREFETCH_HOST_RATE = _env_float("METAPI_PREFETCH_HOST_RATE", 20.0)
+
+# Директория с записанными ответами API для режимов record/replay
+CASSETTE_DIR = os.environ.get("METAPI_CASSETTE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cassettes"
+)
+
+# Базовый URL API коллекции
+API_BASE_URL = os.environ.get("METAPI_BASE_URL", "https://collectionapi.metmuseum.org/public/collection/v1")
+
+# Массовый обход объектов коллекции
+CRAWL_WORKERS = _env_int("METAPI_CRAWL_WORKERS", 8)
+CRAWL_RATE = _env_float("METAPI_CRAWL_RATE", 20.0)
+
+# Пакетная проверка записей объектов (VALIDATION_WORKERS = 0 - без пула процессов)
+VALIDATION_BATCH_SIZE = _env_int("METAPI_VALIDATION_BATCH_SIZE", 1000)
+VALIDATION_WORKERS = _env_int("METAPI_VALIDATION_WORKERS", 0)
+
+# Директория состояния инкрементальной валидации
+DELTA_STATE_DIR = os.environ.get("METAPI_DELTA_STATE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".delta_state"
+)
+
+# Директория снимков коллекции
+SNAPSHOT_DIR = os.environ.get("METAPI_SNAPSHOT_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "snapshots"
+)
+
+# Асинхронная запись логов
+LOG_LEVEL = os.environ.get("METAPI_LOG_LEVEL", "DEBUG")
+LOG_QUEUE_SIZE = _env_int("METAPI_LOG_QUEUE_SIZE", 10000)
+LOG_BATCH_SIZE = _env_int("METAPI_LOG_BATCH_SIZE", 200)
+LOG_FLUSH_INTERVAL = _env_float("METAPI_LOG_FLUSH_INTERVAL", 0.5)
+# Политика при переполнении очереди: drop_low, drop или block
+LOG_BACKPRESSURE = os.environ.get("METAPI_LOG_BACKPRESSURE", "drop_low")
+
+# Структурированная телеметрия запросов (JSON Lines с ротацией по размеру)
+TELEMETRY_ENABLED = os.environ.get("METAPI_TELEMETRY", "1") not in ("0", "false", "no")
+TELEMETRY_MAX_BYTES = _env_int("METAPI_TELEMETRY_MAX_BYTES", 10 * 1024 * 1024)
+TELEMETRY_BACKUP_COUNT = _env_int("METAPI_TELEMETRY_BACKUP_COUNT", 5)
+
+# Замеры производительности эндпоинтов
+PERF_SAMPLES = _env_int("METAPI_PERF_SAMPLES", 3)
+PERF_TOLERANCE = _env_float("METAPI_PERF_TOLERANCE", 0.25)
+PERF_BASELINE_PATH = os.environ.get("METAPI_PERF_BASELINE") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json"
+)
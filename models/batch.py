@@ -0,0 +1,240 @@
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from pydantic import ValidationError
+from typing_extensions import TypedDict
+
+from config import settings
+from models.object import ObjectSchema
+from models.validation import get_adapter
+
+
+class _RecordKeys(TypedDict, total=False):
+    """Поля записи для межзаписных проверок (без валидации значений)."""
+
+    objectID: object
+    objectBeginDate: object
+    objectEndDate: object
+
+
+@dataclass
+class BatchReport:
+    """Результат проверки одной пачки записей ObjectSchema."""
+
+    index: int
+    total: int = 0
+    invalid: int = 0
+    # Количество ошибок по ключу "поле:тип ошибки"
+    failures: Counter = field(default_factory=Counter)
+    # Первое сообщение об ошибке для каждого ключа
+    messages: dict = field(default_factory=dict)
+    # Количество записей с objectEndDate < objectBeginDate
+    date_inversions: int = 0
+    # objectID записей пачки (для поиска повторов между пачками)
+    object_ids: list = field(default_factory=list, repr=False)
+    # objectID записей, не прошедших проверку (None, если ID не извлечен)
+    invalid_ids: list = field(default_factory=list)
+
+    @property
+    def valid(self) -> int:
+        return self.total - self.invalid
+
+
+@dataclass
+class BatchSummary:
+    """Сводный результат проверки всех пачек."""
+
+    batches: list[BatchReport] = field(default_factory=list)
+    total: int = 0
+    invalid: int = 0
+    failures: Counter = field(default_factory=Counter)
+    messages: dict = field(default_factory=dict)
+    date_inversions: int = 0
+    # Повторяющиеся objectID и количество их записей
+    duplicates: dict = field(default_factory=dict)
+
+    @property
+    def valid(self) -> int:
+        return self.total - self.invalid
+
+    @property
+    def ok(self) -> bool:
+        return not self.invalid and not self.duplicates
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "failures": dict(self.failures.most_common()),
+            "messages": self.messages,
+            "date_inversions": self.date_inversions,
+            "duplicates": {str(object_id): count for object_id, count in sorted(self.duplicates.items())},
+            "batches": [
+                {"index": report.index, "total": report.total, "invalid": report.invalid,
+                 "failures": dict(report.failures), "date_inversions": report.date_inversions}
+                for report in self.batches
+            ]
+        }
+
+
+def validate_batch(index: int, payloads: list[Union[bytes, str]]) -> BatchReport:
+    """
+    Проверяет пачку записей через ObjectSchema.
+
+    Функция верхнего уровня, чтобы ее можно было выполнять в процессах пула.
+
+    Args:
+        index: Номер пачки
+        payloads: Тела ответов /objects/{id}
+
+    Returns:
+        BatchReport: Ошибки пачки по полям и типам ошибок
+    """
+    report = BatchReport(index, total=len(payloads))
+    keys_adapter = get_adapter(_RecordKeys)
+
+    for raw in payloads:
+        try:
+            obj = ObjectSchema.model_validate_json(raw)
+        except ValidationError as e:
+            report.invalid += 1
+            for error in e.errors(include_url=False, include_input=False):
+                key = f"{'.'.join(str(loc) for loc in error['loc']) or '__root__'}:{error['type']}"
+                report.failures[key] += 1
+                report.messages.setdefault(key, error["msg"])
+        else:
+            report.object_ids.append(obj.objectID)
+            continue
+
+        # Запись не прошла проверку: поля межзаписных проверок извлекаются без валидации
+        try:
+            keys = keys_adapter.validate_json(raw)
+        except ValidationError:
+            report.invalid_ids.append(None)
+            continue
+
+        object_id = keys.get("objectID")
+        object_id = object_id if isinstance(object_id, int) else None
+        report.invalid_ids.append(object_id)
+        if object_id is not None:
+            report.object_ids.append(object_id)
+
+        begin, end = keys.get("objectBeginDate"), keys.get("objectEndDate")
+        if isinstance(begin, int) and isinstance(end, int) and end < begin:
+            report.date_inversions += 1
+
+    return report
+
+
+class BatchValidator:
+    """
+    Пакетная проверка записей объектов через ObjectSchema.
+
+    Записи читаются из итератора пачками по batch_size и проверяются в текущем
+    процессе или в пуле процессов. Кроме ошибок отдельных записей проверяются
+    повторяющиеся objectID и записи с objectEndDate < objectBeginDate.
+    """
+
+    def __init__(self, batch_size: int = settings.VALIDATION_BATCH_SIZE,
+                 workers: int = settings.VALIDATION_WORKERS):
+        """
+        Инициализирует валидатор.
+
+        Args:
+            batch_size: Количество записей в пачке
+            workers: Количество процессов (0 - проверка в текущем процессе)
+        """
+        self.batch_size = batch_size
+        self.workers = workers
+
+    def iter_batches(self, payloads: Iterable[Union[bytes, str]]) -> Iterator[BatchReport]:
+        """
+        Отдает отчеты пачек в порядке следования записей.
+
+        При работе с пулом в обработке находится не более 2 * workers пачек,
+        поэтому поток записей не читается в память целиком.
+
+        Args:
+            payloads: Тела ответов /objects/{id}
+        """
+        batches = enumerate(_chunks(payloads, self.batch_size))
+
+        if self.workers <= 0:
+            for index, batch in batches:
+                yield validate_batch(index, batch)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending: deque[Future] = deque()
+            for index, batch in batches:
+                pending.append(pool.submit(validate_batch, index, batch))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def validate(self, payloads: Iterable[Union[bytes, str]]) -> BatchSummary:
+        """
+        Проверяет все записи и собирает сводный отчет.
+
+        Args:
+            payloads: Тела ответов /objects/{id}
+
+        Returns:
+            BatchSummary: Сводный отчет с отчетами пачек
+        """
+        summary = BatchSummary()
+        counts: Counter = Counter()
+
+        for report in self.iter_batches(payloads):
+            summary.total += report.total
+            summary.invalid += report.invalid
+            summary.failures.update(report.failures)
+            for key, message in report.messages.items():
+                summary.messages.setdefault(key, message)
+            summary.date_inversions += report.date_inversions
+            counts.update(report.object_ids)
+
+            # ID нужны только для поиска повторов, в сводном отчете они не хранятся
+            report.object_ids = []
+            summary.batches.append(report)
+
+        summary.duplicates = {object_id: count for object_id, count in counts.items() if count > 1}
+        return summary
+
+
+def _chunks(payloads: Iterable, size: int) -> Iterator[list]:
+    """Разбивает поток записей на списки по size элементов."""
+    iterator = iter(payloads)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def iter_json_lines(stream: IO[bytes]) -> Iterator[bytes]:
+    """
+    Отдает записи из потока JSON Lines (одна запись объекта в строке).
+
+    Args:
+        stream: Бинарный поток
+    """
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def format_summary(summary: BatchSummary, top: Optional[int] = 20) -> str:
+    """Форматирует сводный отчет для вывода в консоль."""
+    lines = [
+        f"Записей: {summary.total}, корректных: {summary.valid}, с ошибками: {summary.invalid}, "
+        f"пачек: {len(summary.batches)}",
+        f"objectEndDate < objectBeginDate: {summary.date_inversions}, "
+        f"повторяющихся objectID: {len(summary.duplicates)}"
+    ]
+    for key, count in summary.failures.most_common(top):
+        lines.append(f"  {count:>8}  {key}  ({summary.messages[key]})")
+    return "\n".join(lines)
@@ -0,0 +1,150 @@
+import threading
+
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Union
+
+from typing_extensions import TypedDict
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from models.object import ObjectSchema
+from models.validation import get_adapter
+
+
+class LazyModel:
+    """
+    Ленивое представление Pydantic модели поверх тела ответа API.
+
+    Тело ответа декодируется при первом обращении к любому полю, причем
+    разбираются только поля проекции. Каждое поле валидируется валидаторами
+    исходной модели при первом обращении и сохраняется в слоте экземпляра,
+    повторные обращения читают слот напрямую.
+
+    Классы создаются функцией lazy_model: для каждой проекции - свой класс
+    со __slots__ по полям проекции.
+
+    Проверки, зависящие от других полей (например, objectEndDate и objectBeginDate),
+    учитывают только поля, входящие в проекцию.
+    """
+
+    __slots__ = ("_raw", "_data")
+
+    # Заполняются в lazy_model
+    _schema: type[BaseModel]
+    _fields: frozenset
+    _decode = None
+
+    # Экземпляр модели для валидации отдельных полей, свой для каждого потока
+    _scratch = threading.local()
+
+    def __init__(self, raw: Union[bytes, str]):
+        """
+        Args:
+            raw: Тело ответа API (JSON объект)
+        """
+        self._raw = raw
+        self._data: Optional[dict] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Вызывается только для незаполненных слотов и неизвестных атрибутов
+        if name not in self._fields:
+            raise AttributeError(f"{type(self).__name__} не содержит поле {name}")
+
+        value = self._validate_field(name)
+        setattr(self, name, value)
+        return value
+
+    @classmethod
+    def project(cls, *fields: str) -> type["LazyModel"]:
+        """Возвращает класс представления с проекцией на указанные поля."""
+        return lazy_model(cls._schema, fields)
+
+    @property
+    def raw(self) -> Union[bytes, str]:
+        """Исходное тело ответа."""
+        return self._raw
+
+    def to_dict(self) -> dict:
+        """Возвращает провалидированные значения всех полей проекции."""
+        return {name: getattr(self, name) for name in sorted(self._fields)}
+
+    def model(self) -> BaseModel:
+        """Валидирует тело ответа целиком в исходную модель."""
+        return self._schema.model_validate_json(self._raw)
+
+    def _validate_field(self, name: str) -> Any:
+        """Извлекает значение поля и проверяет его валидаторами исходной модели."""
+        if self._data is None:
+            self._data = self._decode(self._raw)
+            if not isinstance(self._data, dict):
+                raise TypeError("Тело ответа должно быть JSON объектом")
+
+        if name not in self._data:
+            return self._schema.model_fields[name].get_default(call_default_factory=True)
+
+        scratch = getattr(self._scratch, self._schema.__name__, None)
+        if scratch is None:
+            scratch = self._schema.model_construct()
+            setattr(self._scratch, self._schema.__name__, scratch)
+
+        # validate_assignment читает остальные поля из __dict__ и не изменяет его,
+        # а записывает в экземпляр новый словарь с провалидированным значением
+        object.__setattr__(scratch, "__dict__", self._data)
+        self._schema.__pydantic_validator__.validate_assignment(scratch, name, self._data[name])
+        return scratch.__dict__[name]
+
+    def __repr__(self) -> str:
+        loaded = {name: object.__getattribute__(self, name) for name in sorted(self._fields)
+                  if _slot_is_set(self, name)}
+        return f"{type(self).__name__}({loaded})"
+
+
+def _slot_is_set(instance: LazyModel, name: str) -> bool:
+    """Проверяет, что значение поля уже вычислено, не вызывая его вычисление."""
+    try:
+        object.__getattribute__(instance, name)
+        return True
+    except AttributeError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _lazy_model(schema: type[BaseModel], fields: frozenset) -> type[LazyModel]:
+    all_fields = fields == frozenset(schema.model_fields)
+
+    if all_fields:
+        decode = from_json
+    else:
+        # Разбор JSON с пропуском полей вне проекции без создания их значений
+        projection = TypedDict(f"{schema.__name__}Projection", {name: Any for name in sorted(fields)}, total=False)
+        decode = get_adapter(projection).validate_json
+
+    name = f"Lazy{schema.__name__}" if all_fields else f"Lazy{schema.__name__}[{','.join(sorted(fields))}]"
+    return type(name, (LazyModel,), {
+        "__slots__": tuple(sorted(fields)),
+        "_schema": schema,
+        "_fields": fields,
+        "_decode": staticmethod(decode)
+    })
+
+
+def lazy_model(schema: type[BaseModel], fields: Optional[Iterable[str]] = None) -> type[LazyModel]:
+    """
+    Возвращает класс ленивого представления модели (классы кэшируются).
+
+    Args:
+        schema: Pydantic модель
+        fields: Поля проекции (по умолчанию все поля модели)
+
+    Raises:
+        ValueError: Если поле отсутствует в модели
+    """
+    fields = frozenset(fields) if fields else frozenset(schema.model_fields)
+    unknown = fields - set(schema.model_fields)
+    if unknown:
+        raise ValueError(f"В модели {schema.__name__} нет полей: {', '.join(sorted(unknown))}")
+    return _lazy_model(schema, fields)
+
+
+# Ленивое представление ObjectSchema со всеми полями
+LazyObjectSchema = lazy_model(ObjectSchema)
@@ -5,6 +5,11 @@ from typing import List, Dict, Any, Optional, Annotated
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 
+# Регулярные выражения и константы валидаторов компилируются один раз при импорте
+ACCESSION_YEAR_RE = re.compile(r'\d{4}')
+URL_PREFIXES = ("http://", "https://")
+
+
 class ObjectSchema(BaseModel):
     """
     Pydantic схема для валидации данных объекта из API музея.
@@ -99,7 +104,7 @@ class ObjectSchema(BaseModel):
     @classmethod
     def validate_url_fields(cls, v: Optional[str]) -> Optional[str]:
         """Проверяет корректность URL основных изображений."""
-        if v and v.strip() and not v.startswith(("http://", "https://")):
+        if v and v.strip() and not v.startswith(URL_PREFIXES):
             raise ValueError(f"URL должен начинаться с http:// или https://")
         return v
 
@@ -109,7 +114,7 @@ class ObjectSchema(BaseModel):
     def validate_optional_url_fields(cls, v: Optional[str]) -> Optional[str]:
         """Проверяет корректность опциональных URL полей."""
         if v and v.strip():
-            if not v.startswith(("http://", "https://")):
+            if not v.startswith(URL_PREFIXES):
                 raise ValueError(f"URL должен начинаться с http:// или https://")
         return v
 
@@ -119,7 +124,7 @@ class ObjectSchema(BaseModel):
         """Проверяет корректность URL дополнительных изображений."""
         if v:
             for url in v:
-                if url and not url.startswith(("http://", "https://")):
+                if url and not url.startswith(URL_PREFIXES):
                     raise ValueError(f"URL должен начинаться с http:// или https://")
         return v
 
@@ -149,6 +154,6 @@ class ObjectSchema(BaseModel):
     def validate_accession_year(cls, v: Optional[str]) -> Optional[str]:
         """Проверяет формат года приобретения."""
         if v and v.strip():
-            if not re.search(r'\d{4}', v):
+            if not ACCESSION_YEAR_RE.search(v):
                 raise ValueError(f"Год должен содержать 4 цифры")
         return v
\ No newline at end of file
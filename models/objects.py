@@ -1,5 +1,69 @@
+import operator
+import sys
+
+from array import array
+from bisect import bisect_left
+from itertools import islice
 from typing_extensions import Annotated
 from pydantic import BaseModel, Field, field_validator
+from pydantic_core import core_schema
+
+
+def is_increasing(values, strict: bool = True) -> bool:
+    """
+    Проверяет возрастание одним проходом сравнений соседних элементов.
+
+    Сравнения выполняются на уровне C (map с operator.lt/le), новые списки не создаются.
+    Строгое возрастание одновременно доказывает упорядоченность и уникальность.
+
+    Args:
+        values: Список или array целых чисел
+        strict: Требовать строгое возрастание (без повторов)
+    """
+    compare = operator.lt if strict else operator.le
+    return all(map(compare, values, islice(values, 1, None)))
+
+
+def validate_object_ids(value, typecode: str = "Q") -> tuple[array, bool]:
+    """
+    Проверяет список ID объектов: тип, неотрицательность и уникальность элементов.
+
+    Тип и диапазон проверяются одним проходом при упаковке списка в беззнаковый
+    array (цикл выполняется на уровне C). Ответы /objects упорядочены по
+    возрастанию, поэтому уникальность доказывается проверкой строгого возрастания
+    без построения множества; множество строится только для неупорядоченных
+    списков (например, ответов /search).
+
+    Args:
+        value: Значение поля objectIDs для валидации
+        typecode: Код типа элементов array
+
+    Returns:
+        Массив ID, упакованный из value, и признак упорядоченности по возрастанию
+
+    Raises:
+        TypeError: Если значение не список или содержит не целые числа
+        ValueError: Если ID отрицательны, слишком велики для typecode или повторяются
+    """
+    if not isinstance(value, list):
+        raise TypeError("objectIDs должно быть списком")
+
+    try:
+        ids = array(typecode, value)
+    except TypeError:
+        raise TypeError("Все элементы в objectIDs должны быть целочисленными")
+    except OverflowError:
+        max_id = 2 ** (8 * array(typecode).itemsize) - 1
+        raise ValueError(f"Элементы objectIDs должны быть в диапазоне от 0 до {max_id}")
+
+    # Сравнение идет по элементам исходного списка: элементы array пришлось бы создавать заново
+    if is_increasing(value):
+        return ids, True
+
+    if len(set(value)) != len(value):
+        raise ValueError("Элементы objectIDs не должны повторяться")
+
+    return ids, False
 
 
 class ObjectsSchema(BaseModel):
@@ -28,19 +92,166 @@ class ObjectsSchema(BaseModel):
             return value
         raise TypeError("total должно быть целочисленным")
 
-    @field_validator("objectIDs", mode="before")
+    @field_validator("objectIDs", mode="plain")
     def check_objectids(cls, value):
         """
         Валидатор для проверки поля objectIDs.
 
+        Полностью заменяет стандартную проверку list[int], поэтому каждый
+        элемент проверяется один раз.
+
         Args:
             value: Значение поля objectIDs для валидации
         """
-        if not isinstance(value, list):
-            raise TypeError("objectIDs должно быть списком")
+        validate_object_ids(value)
+        return value
+
+    def memory_usage(self) -> int:
+        """Возвращает оценку памяти, занимаемой списком objectIDs, в байтах."""
+        ids = self.objectIDs
+        return sys.getsizeof(ids) + sum(sys.getsizeof(el) for el in ids)
+
+
+class ObjectIDArray:
+    """
+    Компактный неизменяемый массив ID объектов.
 
-        for el in value:
-            if not isinstance(el, int):
-                raise TypeError("Все элементы в objectIDs должны быть целочисленными")
+    Хранит ID в непрерывном буфере array('I') по 4 байта на элемент вместо
+    отдельных объектов int в списке. Буфер можно передать потребителям без
+    копирования через memoryview.
+    """
+
+    TYPECODE = "I"
+
+    __slots__ = ("_data", "_sorted")
+
+    def __init__(self, values=()):
+        """
+        Инициализирует массив.
+
+        Args:
+            values: Итерируемая коллекция неотрицательных целых ID или array('I')
+
+        Raises:
+            TypeError: Если элементы не являются целыми числами
+            OverflowError: Если ID отрицателен или не помещается в 32 бита
+        """
+        if isinstance(values, array) and values.typecode == self.TYPECODE:
+            self._data = values
+        else:
+            self._data = array(self.TYPECODE, values)
+        self._sorted = None
+
+    @property
+    def buffer(self) -> memoryview:
+        """Буфер массива только для чтения (без копирования)."""
+        return memoryview(self._data).toreadonly()
+
+    @property
+    def nbytes(self) -> int:
+        """Размер данных массива в байтах."""
+        return len(self._data) * self._data.itemsize
+
+    @property
+    def is_sorted(self) -> bool:
+        """Признак упорядоченности по возрастанию (вычисляется один раз)."""
+        if self._sorted is None:
+            # Сравнение прямо по буферу, без преобразования массива в список
+            self._sorted = is_increasing(self._data, strict=False)
+        return self._sorted
+
+    def sorted(self) -> "ObjectIDArray":
+        """Возвращает упорядоченную по возрастанию копию массива."""
+        if self.is_sorted:
+            return self
+        result = ObjectIDArray(array(self.TYPECODE, sorted(self._data)))
+        result._sorted = True
+        return result
+
+    def unique(self) -> "ObjectIDArray":
+        """Возвращает упорядоченный массив уникальных ID."""
+        result = ObjectIDArray(array(self.TYPECODE, sorted(set(self._data))))
+        result._sorted = True
+        return result
+
+    def tolist(self) -> list[int]:
+        """Преобразует массив в список int."""
+        return self._data.tolist()
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, int):
+            return False
+        if self.is_sorted:
+            index = bisect_left(self._data, value)
+            return index < len(self._data) and self._data[index] == value
+        return value in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ObjectIDArray(self._data[index])
+        return self._data[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ObjectIDArray):
+            return self._data == other._data
+        if isinstance(other, list):
+            return self._data.tolist() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ObjectIDArray(len={len(self)}, nbytes={self.nbytes})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        """Описывает валидацию из списка int и сериализацию обратно в список."""
+        def validate(value):
+            if isinstance(value, cls):
+                return value
+            if not isinstance(value, (list, tuple, array)):
+                raise TypeError("objectIDs должно быть списком")
+            try:
+                return cls(value)
+            except OverflowError:
+                raise ValueError("Элементы objectIDs должны быть в диапазоне от 0 до 2^32 - 1")
+
+        return core_schema.no_info_plain_validator_function(
+            validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda v: v.tolist())
+        )
+
+
+class CompactObjectsSchema(ObjectsSchema):
+    """
+    Вариант ObjectsSchema с компактным хранением objectIDs.
+
+    Используется для больших ответов /objects: список ID хранится
+    в ObjectIDArray вместо list[int].
+    """
+
+    objectIDs: Annotated[ObjectIDArray, Field(description="ID объектов")]
+
+    @field_validator("objectIDs", mode="plain")
+    def check_objectids(cls, value):
+        """
+        Валидатор для проверки поля objectIDs с упаковкой в ObjectIDArray.
+
+        Args:
+            value: Значение поля objectIDs для валидации
+        """
+        if isinstance(value, ObjectIDArray):
+            return value
+        ids, is_sorted = validate_object_ids(value, ObjectIDArray.TYPECODE)
+        result = ObjectIDArray(ids)
+        # Повторы отклонены, поэтому признак строгого возрастания равен признаку упорядоченности
+        result._sorted = is_sorted
+        return result
 
-        return value
\ No newline at end of file
+    def memory_usage(self) -> int:
+        """Возвращает память, занимаемую данными массива objectIDs, в байтах."""
+        return self.objectIDs.nbytes
@@ -0,0 +1,56 @@
+from functools import lru_cache
+from typing import Any, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def get_adapter(schema: Any) -> TypeAdapter:
+    """
+    Возвращает закэшированный TypeAdapter для типа.
+
+    Построение TypeAdapter компилирует валидатор pydantic-core, поэтому
+    для каждого типа оно выполняется один раз.
+
+    Args:
+        schema: Тип для валидации (например, list[ObjectSchema])
+    """
+    return TypeAdapter(schema)
+
+
+def validate_json(schema: Any, data: Union[bytes, str]) -> Any:
+    """
+    Валидирует JSON напрямую из байтов ответа, без промежуточного словаря.
+
+    Args:
+        schema: Pydantic модель или произвольный тип
+        data: Тело ответа API
+
+    Returns:
+        Экземпляр модели или провалидированное значение
+
+    Raises:
+        pydantic.ValidationError: Если данные не соответствуют схеме
+    """
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return schema.model_validate_json(data)
+    return get_adapter(schema).validate_json(data)
+
+
+def validate_python(schema: Any, data: Any) -> Any:
+    """
+    Валидирует уже разобранные данные без распаковки в именованные аргументы.
+
+    Args:
+        schema: Pydantic модель или произвольный тип
+        data: Разобранный ответ API
+
+    Returns:
+        Экземпляр модели или провалидированное значение
+
+    Raises:
+        pydantic.ValidationError: Если данные не соответствуют схеме
+    """
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return schema.model_validate(data)
+    return get_adapter(schema).validate_python(data)
@@ -3,6 +3,7 @@ import pytest
 from config.logger import APILogger
 from tests.src.API_test_template import APITestTemplate
 from models.departments import DepartmentsSchema
+from models.validation import validate_python
 
 
 @pytest.mark.departments
@@ -21,7 +22,7 @@ class TestBaseAPI(APITestTemplate):
         response = make_request(TestBaseAPI.API_URL)
 
         assert response.status_code == 200, "API должен возвращать статус 200"
-        TestBaseAPI.logger.debug(f"Код API ответа: {response.status_code}")
+        TestBaseAPI.logger.debug("Код API ответа: %s", response.status_code)
 
         TestBaseAPI.logger.info("=== Конец теста test_status_code ===")
 
@@ -34,18 +35,19 @@ class TestBaseAPI(APITestTemplate):
         response = make_request(TestBaseAPI.API_URL)
 
         try:
+            # Разобранное тело закэшировано в ответе и используется также в test_data_content
             response_json = response.json()
-            validated_data = DepartmentsSchema(**response_json)
+            validated_data = validate_python(DepartmentsSchema, response_json)
 
         except Exception as e:
-            TestBaseAPI.logger.error(f"Ошибка валидации данных: {e}")
+            TestBaseAPI.logger.error("Ошибка валидации данных: %s", e)
             pytest.fail(f"Валидация данных не удалась: {e}")
 
         assert isinstance(response_json, dict), "Ответ API должен быть словарём"
-        TestBaseAPI.logger.debug(f"API ответ является словарём: {isinstance(response_json, dict)}")
+        TestBaseAPI.logger.debug("API ответ является словарём: %s", isinstance(response_json, dict))
 
         assert validated_data is not None, "Данные должны соответствовать схеме DepartmentsSchema"
-        TestBaseAPI.logger.debug(f"Данные соответствуют Pydantic модели: {validated_data is not None}")
+        TestBaseAPI.logger.debug("Данные соответствуют Pydantic модели: %s", validated_data is not None)
 
         TestBaseAPI.logger.info("=== Конец теста test_data_structure ===")
 
@@ -59,12 +61,22 @@ class TestBaseAPI(APITestTemplate):
         try:
             response_json = response.json()
         except Exception as e:
-            TestBaseAPI.logger.error(f"API ответ не соответствует типу JSON: {e}")
+            TestBaseAPI.logger.error("API ответ не соответствует типу JSON: %s", e)
             pytest.fail(f"API ответ не соответствует типу JSON: {e}")
 
         departments = response_json.get("departments", [])
 
         assert len(departments) > 0, "API должен возвращать непустой список департаментов"
-        TestBaseAPI.logger.debug(f"Количество отделов > 0: {len(departments) > 0}")
+        TestBaseAPI.logger.debug("Количество отделов > 0: %s", len(departments) > 0)
 
-        TestBaseAPI.logger.info("=== Конец теста test_data_content ===")
\ No newline at end of file
+        TestBaseAPI.logger.info("=== Конец теста test_data_content ===")
+
+    @pytest.mark.performance
+    def test_performance(self, measure_performance):
+        """Проверяет задержку и размер ответа API отделов относительно бюджета."""
+        TestBaseAPI.logger.info("=== Начало теста test_performance ===")
+
+        TestBaseAPI.logger.info("Замеряем API: %s", TestBaseAPI.API_URL)
+        measure_performance(TestBaseAPI.API_URL, "departments_base_api", TestBaseAPI.logger)
+
+        TestBaseAPI.logger.info("=== Конец теста test_performance ===")
@@ -19,6 +19,9 @@ class TestInvalidParams(APITestTemplate):
         (APIBuilder.build_url_with_id(BASE_API, "absbsbs"))  # Некорректный формат ID
     ]
 
+    # Замеряемый запрос: несуществующий ID
+    PERF_API_URL = APIBuilder.build_url_with_id(BASE_API, "999999999")
+
     logger = APILogger("object_invalid_param_api")
 
     @pytest.mark.negative
@@ -27,11 +30,11 @@ class TestInvalidParams(APITestTemplate):
         """Проверяет корректные статус-коды для невалидных запросов."""
         TestInvalidParams.logger.info("=== Начало теста test_status_code ===")
 
-        TestInvalidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestInvalidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         assert response.status_code in [400, 404, 422], "Для невалидных запросов ожидаются коды 400, 404 или 422"
-        TestInvalidParams.logger.debug(f"Код API ответа: {response.status_code}")
+        TestInvalidParams.logger.debug("Код API ответа: %s", response.status_code)
 
         TestInvalidParams.logger.info("=== Конец теста test_status_code ===")
 
@@ -41,17 +44,17 @@ class TestInvalidParams(APITestTemplate):
         """Проверяет структуру данных при невалидных запросах."""
         TestInvalidParams.logger.info("=== Начало теста test_data_structure ===")
 
-        TestInvalidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestInvalidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         try:
             response_json = response.json()
         except Exception as e:
-            TestInvalidParams.logger.error(f"API ответ не соответствует типу JSON: {e}")
+            TestInvalidParams.logger.error("API ответ не соответствует типу JSON: %s", e)
             pytest.fail(f"API ответ не соответствует типу JSON: {e}")
 
         assert isinstance(response_json, dict), "Ответ API должен быть словарём"
-        TestInvalidParams.logger.debug(f"API ответ является словарём: {isinstance(response_json, dict)}")
+        TestInvalidParams.logger.debug("API ответ является словарём: %s", isinstance(response_json, dict))
 
         TestInvalidParams.logger.info("=== Конец теста test_data_structure ===")
 
@@ -61,16 +64,26 @@ class TestInvalidParams(APITestTemplate):
         """Проверяет наличие данных в ответе на невалидные запросы."""
         TestInvalidParams.logger.info("=== Начало теста test_data_content ===")
 
-        TestInvalidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestInvalidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         try:
             response_json = response.json()
         except Exception as e:
-            TestInvalidParams.logger.error(f"API ответ не соответствует типу JSON: {e}")
+            TestInvalidParams.logger.error("API ответ не соответствует типу JSON: %s", e)
             pytest.fail(f"API ответ не соответствует типу JSON: {e}")
 
         assert response_json, "Ответ должен содержать данные (не быть пустым)"
-        TestInvalidParams.logger.debug(f"API ответ не пуст {response_json != {} }")
+        TestInvalidParams.logger.debug("API ответ не пуст %s", response_json != {})
+
+        TestInvalidParams.logger.info("=== Конец теста test_data_content ===")
+
+    @pytest.mark.performance
+    def test_performance(self, measure_performance):
+        """Проверяет задержку и размер ответа API объекта при невалидном ID относительно бюджета."""
+        TestInvalidParams.logger.info("=== Начало теста test_performance ===")
+
+        TestInvalidParams.logger.info("Замеряем API: %s", TestInvalidParams.PERF_API_URL)
+        measure_performance(TestInvalidParams.PERF_API_URL, "object_invalid_param_api", TestInvalidParams.logger)
 
-        TestInvalidParams.logger.info("=== Конец теста test_data_content ===")
\ No newline at end of file
+        TestInvalidParams.logger.info("=== Конец теста test_performance ===")
@@ -1,6 +1,7 @@
 import pytest
 
 from models.object import ObjectSchema
+from models.validation import validate_python
 from config.logger import APILogger
 from tests.src.API_test_template import APITestTemplate
 from tests.src.API_param_builder import APIBuilder
@@ -17,6 +18,10 @@ class TestValidParams(APITestTemplate):
         (APIBuilder.build_url_with_id(BASE_API, 437133)),
         (APIBuilder.build_url_with_id(BASE_API, 45734))
     ]
+
+    # Замеряемый запрос к существующему объекту
+    PERF_API_URL = APIBuilder.build_url_with_id(BASE_API, 437133)
+
     logger = APILogger("object_valid_param_api")
 
     @pytest.mark.smoke
@@ -25,11 +30,11 @@ class TestValidParams(APITestTemplate):
         """Проверяет корректный HTTP статус-код для валидного запроса."""
         TestValidParams.logger.info("=== Начало теста test_status_code ===")
 
-        TestValidParams.logger.info(f"Делаем запрос к API: {TestValidParams.VALID_APIS[0]}")
+        TestValidParams.logger.info("Делаем запрос к API: %s", TestValidParams.VALID_APIS[0])
         response = make_request(TestValidParams.VALID_APIS[0])
 
         assert response.status_code == 200, "API должен возвращать статус 200 для валидного запроса"
-        TestValidParams.logger.debug(f"Код API ответа: {response.status_code}")
+        TestValidParams.logger.debug("Код API ответа: %s", response.status_code)
 
         TestValidParams.logger.info("=== Конец теста test_status_code ===")
 
@@ -40,21 +45,22 @@ class TestValidParams(APITestTemplate):
         """Проверяет структуру данных для валидных объектов."""
         TestValidParams.logger.info("=== Начало теста test_data_structure ===")
 
-        TestValidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestValidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         try:
+            # Разобранное тело закэшировано в ответе и используется также в test_data_content
             response_json = response.json()
-            validated_data = ObjectSchema(**response_json)
+            validated_data = validate_python(ObjectSchema, response_json)
         except Exception as e:
-            TestValidParams.logger.error(f"Ошибка валидации данных: {e}")
+            TestValidParams.logger.error("Ошибка валидации данных: %s", e)
             pytest.fail(f"Валидация данных не удалась: {e}")
 
         assert isinstance(response_json, dict), "Ответ API должен быть словарём"
-        TestValidParams.logger.debug(f"API ответ является словарём: {isinstance(response_json, dict)}")
+        TestValidParams.logger.debug("API ответ является словарём: %s", isinstance(response_json, dict))
 
         assert validated_data is not None, "Данные должны соответствовать схеме ObjectSchema"
-        TestValidParams.logger.debug(f"Данные соответствуют Pydantic модели: {validated_data is not None}")
+        TestValidParams.logger.debug("Данные соответствуют Pydantic модели: %s", validated_data is not None)
 
         TestValidParams.logger.info("=== Конец теста test_data_structure ===")
 
@@ -64,14 +70,24 @@ class TestValidParams(APITestTemplate):
         """Проверяет наличие данных в ответе для валидных объектов."""
         TestValidParams.logger.info("=== Начало теста test_data_content ===")
 
-        TestValidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestValidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         try:
             response_json = response.json()
         except Exception as e:
-            TestValidParams.logger.error(f"API ответ не соответствует типу JSON: {e}")
+            TestValidParams.logger.error("API ответ не соответствует типу JSON: %s", e)
             pytest.fail(f"API ответ не соответствует типу JSON: {e}")
 
         assert response_json, "Ответ должен содержать данные (не быть пустым)"
-        TestValidParams.logger.debug(f"API ответ не пуст {response_json != {}}")
\ No newline at end of file
+        TestValidParams.logger.debug("API ответ не пуст %s", response_json != {})
+
+    @pytest.mark.performance
+    def test_performance(self, measure_performance):
+        """Проверяет задержку и размер ответа API объекта относительно бюджета."""
+        TestValidParams.logger.info("=== Начало теста test_performance ===")
+
+        TestValidParams.logger.info("Замеряем API: %s", TestValidParams.PERF_API_URL)
+        measure_performance(TestValidParams.PERF_API_URL, "object_valid_param_api", TestValidParams.logger)
+
+        TestValidParams.logger.info("=== Конец теста test_performance ===")
@@ -1,7 +1,9 @@
 import pytest
 
-from models.objects import ObjectsSchema
+from models.objects import CompactObjectsSchema
+from models.validation import validate_json
 from config.logger import APILogger
+from client.streaming import object_ids_stats
 from tests.src.API_test_template import APITestTemplate
 
 
@@ -21,7 +23,7 @@ class TestBaseAPI(APITestTemplate):
         response = make_request(TestBaseAPI.API_URL)
 
         assert response.status_code == 200, "API должен возвращать статус 200"
-        TestBaseAPI.logger.debug(f"Код API ответа: {response.status_code}")
+        TestBaseAPI.logger.debug("Код API ответа: %s", response.status_code)
 
         TestBaseAPI.logger.info("=== Конец теста test_status_code ===")
 
@@ -33,19 +35,19 @@ class TestBaseAPI(APITestTemplate):
 
         response = make_request(TestBaseAPI.API_URL)
 
+        # Тело разбирается один раз: схема валидируется прямо из байтов, а ответ не
+        # JSON объект отклоняется той же валидацией. Полный список /objects хранится
+        # компактно, без ~500 тыс. объектов int
         try:
-            response_json = response.json()
-            validated_data = ObjectsSchema(**response_json)
+            validated_data = validate_json(CompactObjectsSchema, response.content)
 
         except Exception as e:
-            TestBaseAPI.logger.error(f"Ошибка валидации данных: {e}")
+            TestBaseAPI.logger.error("Ошибка валидации данных: %s", e)
             pytest.fail(f"Валидация данных не удалась: {e}")
 
-        assert isinstance(response_json, dict), "Ответ API должен быть словарём"
-        TestBaseAPI.logger.debug(f"API ответ является словарём: {isinstance(response_json, dict)}")
-
         assert validated_data is not None, "Данные должны соответствовать схеме ObjectsSchema"
-        TestBaseAPI.logger.debug(f"Данные соответствуют Pydantic модели: {validated_data is not None}")
+        TestBaseAPI.logger.debug("Данные соответствуют Pydantic модели: %s", validated_data is not None)
+        TestBaseAPI.logger.debug("Память под objectIDs: %s байт", validated_data.memory_usage())
 
         TestBaseAPI.logger.info("=== Конец теста test_data_structure ===")
 
@@ -56,23 +58,40 @@ class TestBaseAPI(APITestTemplate):
 
         response = make_request(TestBaseAPI.API_URL)
 
+        # Потоковый разбор закэшированного тела: список objectIDs не материализуется целиком
         try:
-            response_json = response.json()
+            stats = object_ids_stats(response.content)
         except Exception as e:
-            TestBaseAPI.logger.error(f"API ответ не соответствует типу JSON: {e}")
-            pytest.fail(f"API ответ не соответствует типу JSON: {e}")
+            TestBaseAPI.logger.error("API ответ не соответствует ожидаемому формату: %s", e)
+            pytest.fail(f"API ответ не соответствует ожидаемому формату: {e}")
 
-        total = response_json.get("total", 0)
-        object_ids = response_json.get("objectIDs", [])
-        object_ids_length = len(object_ids)
+        total = stats.total or 0
+        object_ids_length = stats.count
 
         assert total > 0, "Общее количество объектов должно быть больше 0"
-        TestBaseAPI.logger.debug(f"Значение по ключу total > 0: {total > 0}")
+        TestBaseAPI.logger.debug("Значение по ключу total > 0: %s", total > 0)
 
         assert object_ids_length > 0, "Список objectIDs должен содержать элементы"
-        TestBaseAPI.logger.debug(f"Количество элементов в objectIDs > 0: {object_ids_length > 0}")
+        TestBaseAPI.logger.debug("Количество элементов в objectIDs > 0: %s", object_ids_length > 0)
 
         assert total == object_ids_length, "Количество элементов в objectIDs должно соответствовать total"
-        TestBaseAPI.logger.debug(f"Количество элементов в objectIDs равно значению total: {total == object_ids_length}")
+        TestBaseAPI.logger.debug("Количество элементов в objectIDs равно значению total: %s", total == object_ids_length)
+
+        assert stats.non_int == 0, "Все элементы в objectIDs должны быть целочисленными"
+        assert stats.negative == 0, "Элементы objectIDs не должны быть отрицательными"
+        TestBaseAPI.logger.debug("Диапазон objectIDs: %s..%s", stats.min_id, stats.max_id)
+
+        assert stats.duplicates == 0, "Элементы objectIDs не должны повторяться"
+        TestBaseAPI.logger.debug("Повторов в objectIDs: %s", stats.duplicates)
+
+        TestBaseAPI.logger.info("=== Конец теста test_data_content ===")
+
+    @pytest.mark.performance
+    def test_performance(self, measure_performance):
+        """Проверяет задержку и размер ответа API объектов относительно бюджета."""
+        TestBaseAPI.logger.info("=== Начало теста test_performance ===")
+
+        TestBaseAPI.logger.info("Замеряем API: %s", TestBaseAPI.API_URL)
+        measure_performance(TestBaseAPI.API_URL, "objects_base_api", TestBaseAPI.logger)
 
-        TestBaseAPI.logger.info("=== Конец теста test_data_content ===")
\ No newline at end of file
+        TestBaseAPI.logger.info("=== Конец теста test_performance ===")
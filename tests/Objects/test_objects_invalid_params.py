@@ -29,6 +29,9 @@ class TestInvalidParams(APITestTemplate):
         (APIBuilder.build_url(BASE_API, departmentIds="abc", metadataDate="invalid"), 400)
     ]
 
+    # Замеряемый запрос: невалидная дата отклоняется с ответом 400
+    PERF_API_URL = APIBuilder.build_url(BASE_API, metadataDate="2023-13-01")
+
     logger = APILogger("objects_invalid_param_api")
 
     @pytest.mark.negative
@@ -37,11 +40,11 @@ class TestInvalidParams(APITestTemplate):
         """Проверяет ожидаемые статус-коды для невалидных параметров."""
         TestInvalidParams.logger.info("=== Начало теста test_status_code ===")
 
-        TestInvalidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestInvalidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         assert response.status_code == expected_status, f"Ожидался статус {expected_status}, получен {response.status_code}"
-        TestInvalidParams.logger.debug(f"Код API ответа: {response.status_code} (ожидался: {expected_status})")
+        TestInvalidParams.logger.debug("Код API ответа: %s (ожидался: %s)", response.status_code, expected_status)
 
         TestInvalidParams.logger.info("=== Конец теста test_status_code ===")
 
@@ -51,30 +54,30 @@ class TestInvalidParams(APITestTemplate):
         """Проверяет структуру данных при невалидных параметрах."""
         TestInvalidParams.logger.info("=== Начало теста test_data_structure ===")
 
-        TestInvalidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestInvalidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         if expected_status == 502:
-            TestInvalidParams.logger.warning(f"API вернул {expected_status} Bad Gateway")
+            TestInvalidParams.logger.warning("API вернул %s Bad Gateway", expected_status)
             assert response.text, "При ошибке 502 должен быть текстовый ответ"
-            TestInvalidParams.logger.debug(f"Текст ответа: {response.text[:100]}...")
+            TestInvalidParams.logger.debug("Текст ответа: %s...", response.text[:100])
 
         elif expected_status == 400:
             try:
                 response_json = response.json()
-                TestInvalidParams.logger.debug(f"JSON ответ: {response_json}")
+                TestInvalidParams.logger.debug("JSON ответ: %s", response_json)
                 assert isinstance(response_json, dict), "Ответ должен быть словарём при статусе 400"
             except:
                 assert response.text, "При ошибке 400 должен быть текстовый ответ"
-                TestInvalidParams.logger.debug(f"Текстовый ответ: {response.text[:100]}...")
+                TestInvalidParams.logger.debug("Текстовый ответ: %s...", response.text[:100])
 
         else:
             try:
                 response_json = response.json()
                 assert isinstance(response_json, dict), "Ответ API должен быть словарём"
-                TestInvalidParams.logger.debug(f"API ответ является словарём: {isinstance(response_json, dict)}")
+                TestInvalidParams.logger.debug("API ответ является словарём: %s", isinstance(response_json, dict))
             except Exception as e:
-                TestInvalidParams.logger.error(f"API ответ не соответствует типу JSON: {e}")
+                TestInvalidParams.logger.error("API ответ не соответствует типу JSON: %s", e)
                 pytest.fail(f"API ответ не соответствует типу JSON: {e}")
 
         TestInvalidParams.logger.info("=== Конец теста test_data_structure ===")
@@ -85,18 +88,18 @@ class TestInvalidParams(APITestTemplate):
         """Проверяет содержимое данных при невалидных параметрах."""
         TestInvalidParams.logger.info("=== Начало теста test_data_content ===")
 
-        TestInvalidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestInvalidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         if expected_status in [502, 400]:
-            TestInvalidParams.logger.warning(f"Пропускаем проверку для {expected_status} ошибки")
+            TestInvalidParams.logger.warning("Пропускаем проверку для %s ошибки", expected_status)
             assert response.text, "При ошибках 502/400 должен быть текстовый ответ"
             return
 
         try:
             response_json = response.json()
         except Exception as e:
-            TestInvalidParams.logger.error(f"API ответ не соответствует типу JSON: {e}")
+            TestInvalidParams.logger.error("API ответ не соответствует типу JSON: %s", e)
             pytest.fail(f"API ответ не соответствует типу JSON: {e}")
 
         total = response_json.get("total", 0)
@@ -105,12 +108,22 @@ class TestInvalidParams(APITestTemplate):
         if object_ids is None:
             object_ids = []
 
-        TestInvalidParams.logger.debug(f"total={total}, objectIDs length={len(object_ids)}")
+        TestInvalidParams.logger.debug("total=%s, objectIDs length=%s", total, len(object_ids))
 
         assert total == len(object_ids), "total должен соответствовать длине objectIDs"
-        TestInvalidParams.logger.debug(f"total равен длине objects_ids: {total == len(object_ids)}")
+        TestInvalidParams.logger.debug("total равен длине objects_ids: %s", total == len(object_ids))
 
         if "departmentIds=999999999" in api_url or "departmentIds=-999999" in api_url:
             assert total == 0, "Для несуществующего departmentIds total должен быть 0"
 
-        TestInvalidParams.logger.info("=== Конец теста test_data_content ===")
\ No newline at end of file
+        TestInvalidParams.logger.info("=== Конец теста test_data_content ===")
+
+    @pytest.mark.performance
+    def test_performance(self, measure_performance):
+        """Проверяет задержку и размер ответа API объектов при невалидных параметрах относительно бюджета."""
+        TestInvalidParams.logger.info("=== Начало теста test_performance ===")
+
+        TestInvalidParams.logger.info("Замеряем API: %s", TestInvalidParams.PERF_API_URL)
+        measure_performance(TestInvalidParams.PERF_API_URL, "objects_invalid_param_api", TestInvalidParams.logger)
+
+        TestInvalidParams.logger.info("=== Конец теста test_performance ===")
@@ -1,7 +1,9 @@
 import pytest
 
 from models.objects import ObjectsSchema
+from models.validation import validate_python
 from config.logger import APILogger
+from client.streaming import object_ids_stats
 from tests.src.API_test_template import APITestTemplate
 from tests.src.API_param_builder import APIBuilder
 
@@ -18,6 +20,10 @@ class TestValidParams(APITestTemplate):
         APIBuilder.build_url(BASE_API, metadataDate="2018-10-22", departmentIds="3|9|12"),
         APIBuilder.build_url(BASE_API, metadataDate="2018-10-22"),
     ]
+
+    # Замеряемый запрос: фильтр по дате и нескольким отделам
+    PERF_API_URL = APIBuilder.build_url(BASE_API, metadataDate="2018-10-22", departmentIds="3|9|12")
+
     logger = APILogger("objects_valid_param_api")
 
     @pytest.mark.smoke
@@ -26,11 +32,11 @@ class TestValidParams(APITestTemplate):
         """Проверяет корректный HTTP статус-код для валидного запроса с параметрами."""
         TestValidParams.logger.info("=== Начало теста test_status_code ===")
 
-        TestValidParams.logger.info(f"Делаем запрос к API: {TestValidParams.VALID_APIS[1]}")
+        TestValidParams.logger.info("Делаем запрос к API: %s", TestValidParams.VALID_APIS[1])
         response = make_request(TestValidParams.VALID_APIS[1])
 
         assert response.status_code == 200, "API должен возвращать статус 200 для валидного запроса"
-        TestValidParams.logger.debug(f"Код API ответа: {response.status_code}")
+        TestValidParams.logger.debug("Код API ответа: %s", response.status_code)
 
         TestValidParams.logger.info("=== Конец теста test_status_code ===")
 
@@ -41,7 +47,7 @@ class TestValidParams(APITestTemplate):
         """Проверяет структуру данных для валидных запросов с параметрами."""
         TestValidParams.logger.info("=== Начало теста test_data_structure ===")
 
-        TestValidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestValidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         try:
@@ -50,17 +56,17 @@ class TestValidParams(APITestTemplate):
             # Нормализуем данные для валидации
             if response_json.get("objectIDs") is None:
                 response_json["objectIDs"] = []
-            validated_data = ObjectsSchema(**response_json)
+            validated_data = validate_python(ObjectsSchema, response_json)
 
         except Exception as e:
-            TestValidParams.logger.error(f"Ошибка валидации данных: {e}")
+            TestValidParams.logger.error("Ошибка валидации данных: %s", e)
             pytest.fail(f"Валидация данных не удалась: {e}")
 
         assert isinstance(response_json, dict), "Ответ API должен быть словарём"
-        TestValidParams.logger.debug(f"API ответ является словарём: {isinstance(response_json, dict)}")
+        TestValidParams.logger.debug("API ответ является словарём: %s", isinstance(response_json, dict))
 
         assert validated_data is not None, "Данные должны соответствовать схеме ObjectsSchema"
-        TestValidParams.logger.debug(f"Данные соответствуют Pydantic модели: {validated_data is not None}")
+        TestValidParams.logger.debug("Данные соответствуют Pydantic модели: %s", validated_data is not None)
 
         TestValidParams.logger.info("=== Конец теста test_data_structure ===")
 
@@ -70,32 +76,40 @@ class TestValidParams(APITestTemplate):
         """Проверяет корректность данных для валидных запросов с параметрами."""
         TestValidParams.logger.info("=== Начало теста test_data_content ===")
 
-        TestValidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestValidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
+        # Потоковый разбор закэшированного тела: список objectIDs не материализуется целиком
         try:
-            response_json = response.json()
+            stats = object_ids_stats(response.content)
         except Exception as e:
-            TestValidParams.logger.error(f"API ответ не соответствует типу JSON: {e}")
-            pytest.fail(f"API ответ не соответствует типу JSON: {e}")
-
-        total = response_json.get("total")
-        object_ids = response_json.get("objectIDs")
-
-        # Нормализуем объект для проверок
-        if object_ids is None:
-            object_ids = []
+            TestValidParams.logger.error("API ответ не соответствует ожидаемому формату: %s", e)
+            pytest.fail(f"API ответ не соответствует ожидаемому формату: {e}")
 
-        object_ids_length = len(object_ids)
+        total = stats.total or 0
+        object_ids_length = stats.count
 
         assert total > 0, "Общее количество объектов должно быть больше 0"
-        TestValidParams.logger.debug(f"Значение по ключу total: {total}")
+        TestValidParams.logger.debug("Значение по ключу total: %s", total)
 
         assert object_ids_length > 0, "Список objectIDs должен содержать элементы"
-        TestValidParams.logger.debug(f"Количество элементов в objectIDs: {object_ids_length}")
+        TestValidParams.logger.debug("Количество элементов в objectIDs: %s", object_ids_length)
 
         assert total == object_ids_length, "Количество элементов в objectIDs должно соответствовать total"
         TestValidParams.logger.debug(
-            f"Количество элементов в objectIDs равно значению total: {total == object_ids_length}")
+            "Количество элементов в objectIDs равно значению total: %s", total == object_ids_length)
+
+        assert stats.non_int == 0, "Все элементы в objectIDs должны быть целочисленными"
+        TestValidParams.logger.debug("Диапазон objectIDs: %s..%s", stats.min_id, stats.max_id)
+
+        TestValidParams.logger.info("=== Конец теста test_data_content ===")
+
+    @pytest.mark.performance
+    def test_performance(self, measure_performance):
+        """Проверяет задержку и размер ответа API объектов с валидными параметрами относительно бюджета."""
+        TestValidParams.logger.info("=== Начало теста test_performance ===")
+
+        TestValidParams.logger.info("Замеряем API: %s", TestValidParams.PERF_API_URL)
+        measure_performance(TestValidParams.PERF_API_URL, "objects_valid_param_api", TestValidParams.logger)
 
-        TestValidParams.logger.info("=== Конец теста test_data_content ===")
\ No newline at end of file
+        TestValidParams.logger.info("=== Конец теста test_performance ===")
@@ -1,6 +1,7 @@
 import pytest
 
 from models.objects import ObjectsSchema
+from models.validation import validate_python
 from config.logger import APILogger
 from tests.src.API_test_template import APITestTemplate
 
@@ -21,7 +22,7 @@ class TestBaseAPI(APITestTemplate):
         response = make_request(TestBaseAPI.API_URL)
 
         assert response.status_code == 200, "API должен возвращать статус 200 для пустого поискового запроса"
-        TestBaseAPI.logger.debug(f"Код API ответа: {response.status_code}")
+        TestBaseAPI.logger.debug("Код API ответа: %s", response.status_code)
 
         TestBaseAPI.logger.info("=== Конец теста test_status_code ===")
 
@@ -40,17 +41,17 @@ class TestBaseAPI(APITestTemplate):
             if response_json.get("objectIDs") is None:
                 response_json["objectIDs"] = []
 
-            validated_data = ObjectsSchema(**response_json)
+            validated_data = validate_python(ObjectsSchema, response_json)
 
         except Exception as e:
-            TestBaseAPI.logger.error(f"Ошибка валидации данных: {e}")
+            TestBaseAPI.logger.error("Ошибка валидации данных: %s", e)
             pytest.fail(f"Валидация данных не удалась: {e}")
 
         assert isinstance(response_json, dict), "Ответ API должен быть словарём"
-        TestBaseAPI.logger.debug(f"API ответ является словарём: {isinstance(response_json, dict)}")
+        TestBaseAPI.logger.debug("API ответ является словарём: %s", isinstance(response_json, dict))
 
         assert validated_data is not None, "Данные должны соответствовать схеме ObjectsSchema"
-        TestBaseAPI.logger.debug(f"Данные соответствуют Pydantic модели: {validated_data is not None}")
+        TestBaseAPI.logger.debug("Данные соответствуют Pydantic модели: %s", validated_data is not None)
 
         TestBaseAPI.logger.info("=== Конец теста test_data_structure ===")
 
@@ -64,7 +65,7 @@ class TestBaseAPI(APITestTemplate):
         try:
             response_json = response.json()
         except Exception as e:
-            TestBaseAPI.logger.error(f"API ответ не соответствует типу JSON: {e}")
+            TestBaseAPI.logger.error("API ответ не соответствует типу JSON: %s", e)
             pytest.fail(f"API ответ не соответствует типу JSON: {e}")
 
         total = response_json.get("total", 0)
@@ -77,12 +78,22 @@ class TestBaseAPI(APITestTemplate):
 
         # Для пустого поискового запроса ожидаем 0 результатов
         assert total == 0, "Пустой поисковый запрос должен возвращать total = 0"
-        TestBaseAPI.logger.debug(f"Значение по ключу total: {total} (ожидалось: 0)")
+        TestBaseAPI.logger.debug("Значение по ключу total: %s (ожидалось: 0)", total)
 
         assert object_ids_length == 0, "Пустой поисковый запрос должен возвращать пустой objectIDs"
-        TestBaseAPI.logger.debug(f"Количество элементов в objectIDs: {object_ids_length} (ожидалось: 0)")
+        TestBaseAPI.logger.debug("Количество элементов в objectIDs: %s (ожидалось: 0)", object_ids_length)
 
         assert total == object_ids_length, "total должен соответствовать длине objectIDs"
-        TestBaseAPI.logger.debug(f"Количество элементов в objectIDs равно значению total: {total == object_ids_length}")
+        TestBaseAPI.logger.debug("Количество элементов в objectIDs равно значению total: %s", total == object_ids_length)
 
-        TestBaseAPI.logger.info("=== Конец теста test_data_content ===")
\ No newline at end of file
+        TestBaseAPI.logger.info("=== Конец теста test_data_content ===")
+
+    @pytest.mark.performance
+    def test_performance(self, measure_performance):
+        """Проверяет задержку и размер ответа API поиска относительно бюджета."""
+        TestBaseAPI.logger.info("=== Начало теста test_performance ===")
+
+        TestBaseAPI.logger.info("Замеряем API: %s", TestBaseAPI.API_URL)
+        measure_performance(TestBaseAPI.API_URL, "search_base_api", TestBaseAPI.logger)
+
+        TestBaseAPI.logger.info("=== Конец теста test_performance ===")
@@ -33,6 +33,9 @@ class TestInvalidParams(APITestTemplate):
         APIBuilder.build_url(BASE_API, q=""),
     ]
 
+    # Замеряется запрос с ответом 200: без поискового запроса API стабильно отвечает 502
+    PERF_API_URL = APIBuilder.build_url(BASE_API, q="null")
+
     logger = APILogger("search_invalid_param_api")
 
     @pytest.mark.negative
@@ -41,11 +44,11 @@ class TestInvalidParams(APITestTemplate):
         """Проверяет допустимые статус-коды для невалидных параметров поиска."""
         TestInvalidParams.logger.info("=== Начало теста test_status_code ===")
 
-        TestInvalidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestInvalidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         assert response.status_code in [200, 400, 422, 502], "Для невалидных параметров ожидаются коды 200, 400, 422 или 502"
-        TestInvalidParams.logger.debug(f"Код API ответа: {response.status_code}")
+        TestInvalidParams.logger.debug("Код API ответа: %s", response.status_code)
 
         TestInvalidParams.logger.info("=== Конец теста test_status_code ===")
 
@@ -55,29 +58,29 @@ class TestInvalidParams(APITestTemplate):
         """Проверяет структуру данных при невалидных параметрах поиска."""
         TestInvalidParams.logger.info("=== Начало теста test_data_structure ===")
 
-        TestInvalidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestInvalidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         if response.status_code == 502:
-            TestInvalidParams.logger.warning(f"API вернул 502 для: {api_url}")
+            TestInvalidParams.logger.warning("API вернул 502 для: %s", api_url)
             assert response.text, "При ошибке 502 должен быть текстовый ответ"
             return
 
         if response.status_code in [400, 422]:
             try:
                 response_json = response.json()
-                TestInvalidParams.logger.debug(f"JSON ответ для ошибки: {response_json}")
+                TestInvalidParams.logger.debug("JSON ответ для ошибки: %s", response_json)
             except:
                 assert response.text, "При ошибках 400/422 должен быть текстовый ответ"
-                TestInvalidParams.logger.debug(f"Текстовый ответ для ошибки: {response.text[:100]}...")
+                TestInvalidParams.logger.debug("Текстовый ответ для ошибки: %s...", response.text[:100])
             return
 
         try:
             response_json = response.json()
             assert isinstance(response_json, dict), "Ответ API должен быть словарём"
-            TestInvalidParams.logger.debug(f"API ответ является словарём: {isinstance(response_json, dict)}")
+            TestInvalidParams.logger.debug("API ответ является словарём: %s", isinstance(response_json, dict))
         except Exception as e:
-            TestInvalidParams.logger.error(f"API ответ не соответствует типу JSON: {e}")
+            TestInvalidParams.logger.error("API ответ не соответствует типу JSON: %s", e)
             pytest.fail(f"API ответ не соответствует типу JSON: {e}")
 
         TestInvalidParams.logger.info("=== Конец теста test_data_structure ===")
@@ -88,17 +91,17 @@ class TestInvalidParams(APITestTemplate):
         """Проверяет содержимое данных при невалидных параметрах поиска."""
         TestInvalidParams.logger.info("=== Начало теста test_data_content ===")
 
-        TestInvalidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestInvalidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         if response.status_code in [400, 422, 502]:
-            TestInvalidParams.logger.warning(f"Пропускаем проверку для статуса {response.status_code}")
+            TestInvalidParams.logger.warning("Пропускаем проверку для статуса %s", response.status_code)
             return
 
         try:
             response_json = response.json()
         except Exception as e:
-            TestInvalidParams.logger.error(f"API ответ не соответствует типу JSON: {e}")
+            TestInvalidParams.logger.error("API ответ не соответствует типу JSON: %s", e)
             pytest.fail(f"API ответ не соответствует типу JSON: {e}")
 
         total = response_json.get("total", 0)
@@ -109,9 +112,19 @@ class TestInvalidParams(APITestTemplate):
 
         object_ids_length = len(object_ids)
 
-        TestInvalidParams.logger.debug(f"total={total}, objectIDs length={object_ids_length}")
+        TestInvalidParams.logger.debug("total=%s, objectIDs length=%s", total, object_ids_length)
 
         assert total == object_ids_length, "total должен соответствовать длине objectIDs"
-        TestInvalidParams.logger.debug(f"Количество элементов в objectIDs равно total: {total == object_ids_length}")
+        TestInvalidParams.logger.debug("Количество элементов в objectIDs равно total: %s", total == object_ids_length)
+
+        TestInvalidParams.logger.info("=== Конец теста test_data_content ===")
+
+    @pytest.mark.performance
+    def test_performance(self, measure_performance):
+        """Проверяет задержку и размер ответа API поиска при невалидных параметрах относительно бюджета."""
+        TestInvalidParams.logger.info("=== Начало теста test_performance ===")
+
+        TestInvalidParams.logger.info("Замеряем API: %s", TestInvalidParams.PERF_API_URL)
+        measure_performance(TestInvalidParams.PERF_API_URL, "search_invalid_param_api", TestInvalidParams.logger)
 
-        TestInvalidParams.logger.info("=== Конец теста test_data_content ===")
\ No newline at end of file
+        TestInvalidParams.logger.info("=== Конец теста test_performance ===")
@@ -1,6 +1,7 @@
 import pytest
 
 from models.objects import ObjectsSchema
+from models.validation import validate_python
 from config.logger import APILogger
 from tests.src.API_test_template import APITestTemplate
 from tests.src.API_param_builder import APIBuilder
@@ -27,6 +28,10 @@ class TestValidParams(APITestTemplate):
         APIBuilder.build_url(BASE_API, q="paris", geoLocation="France"),
         APIBuilder.build_url(BASE_API, q="renaissance", dateBegin=1400, dateEnd=1600)
     ]
+
+    # Замеряемый запрос: простой поиск по ключевому слову
+    PERF_API_URL = APIBuilder.build_url(BASE_API, q="sunflowers")
+
     logger = APILogger("search_valid_param_api")
 
     @pytest.mark.smoke
@@ -35,11 +40,11 @@ class TestValidParams(APITestTemplate):
         """Проверяет корректный HTTP статус-код для валидного поискового запроса."""
         TestValidParams.logger.info("=== Начало теста test_status_code ===")
 
-        TestValidParams.logger.info(f"Делаем запрос к API: {TestValidParams.VALID_APIS[-1]}")
+        TestValidParams.logger.info("Делаем запрос к API: %s", TestValidParams.VALID_APIS[-1])
         response = make_request(TestValidParams.VALID_APIS[-1])
 
         assert response.status_code == 200, "API должен возвращать статус 200 для валидного поискового запроса"
-        TestValidParams.logger.debug(f"Код API ответа: {response.status_code}")
+        TestValidParams.logger.debug("Код API ответа: %s", response.status_code)
 
         TestValidParams.logger.info("=== Конец теста test_status_code ===")
 
@@ -50,11 +55,11 @@ class TestValidParams(APITestTemplate):
         """Проверяет структуру данных для валидных поисковых запросов."""
         TestValidParams.logger.info("=== Начало теста test_data_structure ===")
 
-        TestValidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestValidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         if response.status_code == 502:
-            TestValidParams.logger.warning(f"API вернул 502, пропускаем проверку для: {api_url}")
+            TestValidParams.logger.warning("API вернул 502, пропускаем проверку для: %s", api_url)
             assert response.text, "При ошибке 502 должен быть текстовый ответ"
             return
 
@@ -65,16 +70,16 @@ class TestValidParams(APITestTemplate):
             if response_json.get("objectIDs") is None:
                 response_json["objectIDs"] = []
 
-            validated_data = ObjectsSchema(**response_json)
+            validated_data = validate_python(ObjectsSchema, response_json)
         except Exception as e:
-            TestValidParams.logger.error(f"Ошибка валидации данных: {e}")
+            TestValidParams.logger.error("Ошибка валидации данных: %s", e)
             pytest.fail(f"Валидация данных не удалась: {e}")
 
         assert isinstance(response_json, dict), "Ответ API должен быть словарём"
-        TestValidParams.logger.debug(f"API ответ является словарём: {isinstance(response_json, dict)}")
+        TestValidParams.logger.debug("API ответ является словарём: %s", isinstance(response_json, dict))
 
         assert validated_data is not None, "Данные должны соответствовать схеме ObjectsSchema"
-        TestValidParams.logger.debug(f"Данные соответствуют Pydantic модели: {validated_data is not None}")
+        TestValidParams.logger.debug("Данные соответствуют Pydantic модели: %s", validated_data is not None)
 
         TestValidParams.logger.info("=== Конец теста test_data_structure ===")
 
@@ -84,17 +89,17 @@ class TestValidParams(APITestTemplate):
         """Проверяет корректность данных для валидных поисковых запросов."""
         TestValidParams.logger.info("=== Начало теста test_data_content ===")
 
-        TestValidParams.logger.info(f"Делаем запрос к API: {api_url}")
+        TestValidParams.logger.info("Делаем запрос к API: %s", api_url)
         response = make_request(api_url)
 
         if response.status_code == 502:
-            TestValidParams.logger.warning(f"API вернул 502, пропускаем проверку для: {api_url}")
+            TestValidParams.logger.warning("API вернул 502, пропускаем проверку для: %s", api_url)
             return
 
         try:
             response_json = response.json()
         except Exception as e:
-            TestValidParams.logger.error(f"API ответ не соответствует типу JSON: {e}")
+            TestValidParams.logger.error("API ответ не соответствует типу JSON: %s", e)
             pytest.fail(f"API ответ не соответствует типу JSON: {e}")
 
         total = response_json.get("total", 0)
@@ -105,10 +110,20 @@ class TestValidParams(APITestTemplate):
 
         object_ids_length = len(object_ids)
 
-        TestValidParams.logger.debug(f"Значение по ключу total: {total}")
-        TestValidParams.logger.debug(f"Количество элементов в objectIDs: {object_ids_length}")
+        TestValidParams.logger.debug("Значение по ключу total: %s", total)
+        TestValidParams.logger.debug("Количество элементов в objectIDs: %s", object_ids_length)
 
         assert total == object_ids_length, "total должен соответствовать длине objectIDs"
-        TestValidParams.logger.debug(f"total равен длине objectIDs: {total == object_ids_length}")
+        TestValidParams.logger.debug("total равен длине objectIDs: %s", total == object_ids_length)
+
+        TestValidParams.logger.info("=== Конец теста test_data_content ===")
+
+    @pytest.mark.performance
+    def test_performance(self, measure_performance):
+        """Проверяет задержку и размер ответа API поиска с валидными параметрами относительно бюджета."""
+        TestValidParams.logger.info("=== Начало теста test_performance ===")
+
+        TestValidParams.logger.info("Замеряем API: %s", TestValidParams.PERF_API_URL)
+        measure_performance(TestValidParams.PERF_API_URL, "search_valid_param_api", TestValidParams.logger)
 
-        TestValidParams.logger.info("=== Конец теста test_data_content ===")
\ No newline at end of file
+        TestValidParams.logger.info("=== Конец теста test_performance ===")
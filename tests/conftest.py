@@ -0,0 +1,389 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from requests.exceptions import RequestException, Timeout
+
+from config import settings
+from config.logger import get_log_writer, merge_log_shards, merge_telemetry_shards, remove_log_shards
+from client.api_client import get_client
+from client.cassette import CassetteStore
+from client.performance import PerformanceBaseline, measure_endpoint
+from client.prefetch import PrefetchEngine, PrefetchStats
+from client.stub_server import StubServer
+
+# Ключи для хранения состояния прогона в config.stash
+_prefetch_stats_key = pytest.StashKey()
+_prefetch_scopes_key = pytest.StashKey()
+_prefetch_engine_key = pytest.StashKey()
+_stub_server_key = pytest.StashKey()
+_shared_dir_key = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    """Регистрирует опции командной строки для работы с API."""
+    group = parser.getgroup("metapi", "API Метрополитен-музея")
+    group.addoption(
+        "--no-prefetch",
+        action="store_true",
+        default=False,
+        help="отключить параллельную предзагрузку URL перед запуском тестов"
+    )
+    group.addoption(
+        "--api-mode",
+        choices=("live", "record", "replay"),
+        default="live",
+        help="live - запросы к API, record - запись ответов в кассеты, "
+             "replay - ответы из кассет через локальный сервер"
+    )
+    group.addoption(
+        "--cassette-dir",
+        default=settings.CASSETTE_DIR,
+        help="директория с записанными ответами API"
+    )
+    group.addoption(
+        "--run-performance",
+        action="store_true",
+        default=False,
+        help="выполнить замеры производительности (тесты с маркером performance)"
+    )
+    group.addoption(
+        "--update-perf-baseline",
+        action="store_true",
+        default=False,
+        help="перезаписать бюджеты производительности результатами замеров (включает --run-performance)"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """
+    При запуске pytest -n распределяет тесты по процессам целыми классами.
+
+    Данные запрашиваются фикстурами уровня класса, поэтому разбиение класса
+    между процессами повторяло бы запросы. Явно заданный --dist не меняется.
+    """
+    if getattr(config.option, "numprocesses", None) and config.option.dist == "no" \
+            and not config.option.distload:
+        config.option.dist = "loadscope"
+
+
+def pytest_configure(config):
+    """Настраивает клиент API в соответствии с режимом запуска."""
+    if _is_controller(config):
+        remove_log_shards()
+
+        # Процессы-исполнители наследуют переменную окружения и получают
+        # ответы API, уже загруженные другими процессами, из общей директории
+        if _is_distributed(config) and not os.environ.get("METAPI_SHARED_DIR"):
+            shared_dir = tempfile.mkdtemp(prefix="metapi-shared-")
+            os.environ["METAPI_SHARED_DIR"] = shared_dir
+            config.stash[_shared_dir_key] = shared_dir
+
+    mode = config.getoption("--api-mode")
+    client = get_client()
+
+    if mode == "record":
+        client.recorder = CassetteStore(config.getoption("--cassette-dir"))
+
+    elif mode == "replay":
+        store = CassetteStore(config.getoption("--cassette-dir")).load()
+        server = StubServer(store).start()
+        client.replay_base_url = server.base_url
+        config.stash[_stub_server_key] = server
+
+
+def pytest_unconfigure(config):
+    """Сохраняет записанные ответы, дописывает логи и останавливает локальный сервер."""
+    get_log_writer().flush()
+    client = get_client()
+
+    if client.recorder is not None:
+        client.recorder.save()
+        client.recorder = None
+
+    if client.disk_cache is not None:
+        client.disk_cache.close()
+
+    server = config.stash.get(_stub_server_key, None)
+    if server is not None:
+        server.stop()
+        client.replay_base_url = None
+
+    # Процессы-исполнители к этому моменту завершены, их логи объединяются в общие файлы
+    if _is_controller(config):
+        merge_log_shards()
+        merge_telemetry_shards()
+
+    shared_dir = config.stash.get(_shared_dir_key, None)
+    if shared_dir is not None:
+        del os.environ["METAPI_SHARED_DIR"]
+        shutil.rmtree(shared_dir, ignore_errors=True)
+
+
+def _is_controller(config) -> bool:
+    """Проверяет, что текущий процесс управляющий, а не исполнитель pytest-xdist."""
+    return not hasattr(config, "workerinput")
+
+
+def _is_distributed(config) -> bool:
+    """Проверяет, что тесты запускаются в процессах-исполнителях pytest-xdist."""
+    return bool(getattr(config.option, "tx", None)) and getattr(config.option, "dist", "no") != "no"
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Пропускает замеры производительности без опции --run-performance.
+
+    Каждый замер выполняет серию запросов в обход кэша, поэтому в обычном
+    прогоне замеры не выполняются.
+    """
+    if config.getoption("--run-performance") or config.getoption("--update-perf-baseline"):
+        return
+
+    skip = pytest.mark.skip(reason="замеры производительности включаются опцией --run-performance")
+    for item in items:
+        if item.get_closest_marker("performance") is not None:
+            item.add_marker(skip)
+
+
+def _collect_api_urls(items) -> list[str]:
+    """Собирает URL из параметров api_url и атрибутов API_URL тестовых классов."""
+    urls = []
+
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "api_url" in callspec.params:
+            urls.append(callspec.params["api_url"])
+
+        api_url = getattr(item.cls, "API_URL", None)
+        if api_url:
+            urls.append(api_url)
+
+    return urls
+
+
+def _scope_of(item) -> str:
+    """Возвращает группу теста, по которой pytest-xdist с --dist loadscope распределяет тесты."""
+    return item.nodeid.rsplit("::", 1)[0]
+
+
+def pytest_collection_finish(session):
+    """
+    Параллельно загружает в кэш URL, собранные при коллекции тестов.
+
+    В обычном прогоне все URL загружаются сразу. Исполнители pytest-xdist
+    собирают все тесты, но выполняют только назначенные им группы, поэтому
+    URL группы загружаются перед ее первым тестом (см. pytest_runtest_setup).
+    """
+    config = session.config
+    if config.option.collectonly or config.getoption("--no-prefetch"):
+        return
+
+    engine = PrefetchEngine(
+        get_client(),
+        concurrency=settings.PREFETCH_CONCURRENCY,
+        host_rate=settings.PREFETCH_HOST_RATE
+    )
+
+    if _is_controller(config):
+        config.stash[_prefetch_stats_key] = engine.prefetch(_collect_api_urls(session.items))
+        return
+
+    scopes = {}
+    for item in session.items:
+        scopes.setdefault(_scope_of(item), []).append(item)
+    config.stash[_prefetch_scopes_key] = scopes
+    config.stash[_prefetch_engine_key] = engine
+    config.stash[_prefetch_stats_key] = PrefetchStats()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """На исполнителе pytest-xdist загружает URL группы перед ее первым тестом."""
+    scopes = item.config.stash.get(_prefetch_scopes_key, None)
+    if not scopes:
+        return
+
+    scope_items = scopes.pop(_scope_of(item), None)
+    if scope_items is None:
+        return
+
+    stats = item.config.stash[_prefetch_engine_key].prefetch(_collect_api_urls(scope_items))
+    total = item.config.stash[_prefetch_stats_key]
+    total.urls += stats.urls
+    total.fetched += stats.fetched
+    total.failed += stats.failed
+    total.elapsed += stats.elapsed
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Выводит статистику кэша ответов и пула соединений API в итоговый отчет прогона."""
+    client = get_client()
+    cache = client.cache
+    stats = cache.stats
+
+    prefetch = config.stash.get(_prefetch_stats_key, None)
+    if prefetch is not None and prefetch.urls:
+        terminalreporter.section("Предзагрузка API")
+        terminalreporter.write_line(
+            f"URL: {prefetch.urls}, загружено: {prefetch.fetched}, "
+            f"ошибок: {prefetch.failed}, время: {prefetch.elapsed:.2f} сек."
+        )
+
+    # Без запросов к API (например, при запуске только модульных тестов) разделы не выводятся
+    if stats.hits or stats.misses:
+        terminalreporter.section("Кэш ответов API")
+        terminalreporter.write_line(
+            f"попаданий: {stats.hits}, промахов: {stats.misses}, "
+            f"доля попаданий: {stats.hit_rate:.1%}"
+        )
+        terminalreporter.write_line(
+            f"вытеснено: {stats.evictions}, устарело: {stats.expirations}, "
+            f"записей: {len(cache)}, размер: {cache.size_bytes / 1024:.1f} КБ"
+        )
+
+    coalesced = client.single_flight.stats
+    if coalesced.saved:
+        terminalreporter.write_line(
+            f"объединено одновременных запросов: {coalesced.saved} из {coalesced.calls} промахов кэша"
+        )
+
+    shared = client.shared
+    if shared is not None and shared.stats.shared:
+        terminalreporter.write_line(
+            f"получено от других процессов: {shared.stats.shared} "
+            f"({shared.stats.saved_bytes / 1024:.1f} КБ не загружено), запрошено: {shared.stats.fetched}"
+        )
+
+    disk_cache = client.disk_cache
+    if disk_cache is not None and (disk_cache.stats.revalidated or disk_cache.stats.stored):
+        terminalreporter.write_line(
+            f"постоянный кэш: подтверждено ответом 304: {disk_cache.stats.revalidated} "
+            f"({disk_cache.stats.saved_bytes / 1024:.1f} КБ не загружено), сохранено: {disk_cache.stats.stored}"
+        )
+
+    limiter = client.limiter
+    if limiter is not None and limiter.stats.throttled:
+        terminalreporter.write_line(
+            f"ответов о перегрузке API: {limiter.stats.throttled}, снижений частоты: {limiter.stats.decreases}, "
+            f"пауз по Retry-After: {limiter.stats.retry_after}, текущая частота: {limiter.rate:.1f} запр./сек."
+        )
+
+    if client.breakers is not None:
+        for endpoint, breaker in client.breakers.items():
+            if breaker.opened:
+                terminalreporter.write_line(
+                    f"запросы к {endpoint} приостанавливались после серии ошибок: {breaker.opened} раз"
+                )
+
+    dropped = get_log_writer().queue_handler.dropped
+    if dropped:
+        terminalreporter.write_line(f"Логи: при переполнении очереди отброшено записей: {dropped}")
+
+    transport = client.session.stats
+    if not transport.requests:
+        return
+
+    terminalreporter.section("Соединения API")
+    terminalreporter.write_line(
+        f"запросов: {transport.requests}, новых соединений: {transport.new_connections}, "
+        f"переиспользовано: {transport.reused_connections} ({transport.reuse_rate:.1%})"
+    )
+
+
+@pytest.fixture(scope="class")
+def make_request():
+    """
+    Фикстура для выполнения HTTP GET запросов.
+
+    Ответы кэшируются в общем для всего прогона хранилище, поэтому
+    повторные запросы того же URL не уходят в сеть.
+
+    Args:
+        api_url (str): URL API для запроса
+        timeout (int): Таймаут в секундах (по умолчанию 10)
+
+    Returns:
+        requests.Response: Объект ответа от API
+
+    Raises:
+        pytest.fail: При таймауте - сервис не отвечает в заданное время
+        pytest.skip: При других ошибках запроса
+    """
+    client = get_client()
+
+    def _make_request(api_url, timeout=10):
+        try:
+            response = client.get(api_url, timeout=timeout)
+            return response
+        except Timeout:
+            # Таймаут - критическая ошибка
+            pytest.fail(f"API не отвечает {timeout}сек.")
+        except RequestException as e:
+            # Другие ошибки подключения
+            pytest.skip(f"API недоступно: {e}")
+
+    return _make_request
+
+
+@pytest.fixture(scope="class")
+def measure_performance(request):
+    """
+    Фикстура для замеров производительности эндпоинта.
+
+    Выполняет серию запросов в обход кэша, считает перцентили задержки и
+    средний размер ответа и сравнивает их с бюджетом эндпоинта из файла
+    config/perf_baseline.json с учетом допуска PERF_TOLERANCE. С опцией
+    --update-perf-baseline бюджет перезаписывается результатами замеров.
+
+    Args:
+        api_url (str): URL API для замеров
+        budget_key (str): Ключ бюджета эндпоинта в файле
+        logger (APILogger): Логгер тестового класса (необязательно)
+
+    Returns:
+        PerfStats: Результаты замеров
+
+    Raises:
+        pytest.fail: При таймауте или превышении бюджета
+        pytest.skip: При других ошибках запроса, в режиме replay или без бюджета
+    """
+    client = get_client()
+    baseline = PerformanceBaseline.load(settings.PERF_BASELINE_PATH)
+    update = request.config.getoption("--update-perf-baseline")
+
+    def _measure_performance(api_url, budget_key, logger=None):
+        if client.replay_base_url:
+            pytest.skip("Замеры производительности не имеют смысла в режиме replay")
+
+        try:
+            stats = measure_endpoint(client, api_url, samples=settings.PERF_SAMPLES)
+        except Timeout:
+            pytest.fail(f"API не отвечает при замерах: {api_url}")
+        except RequestException as e:
+            pytest.skip(f"API недоступно: {e}")
+
+        if logger is not None:
+            logger.debug("Задержка p50/p95/p99: %.1f/%.1f/%.1f мс (замеров: %s)",
+                         stats.p50, stats.p95, stats.p99, stats.samples)
+            logger.debug("Средний размер ответа: %s байт", stats.bytes_mean)
+
+        if update:
+            baseline.update(budget_key, stats)
+            baseline.save()
+            return stats
+
+        budget = baseline.get(budget_key)
+        if budget is None:
+            pytest.skip(f"Для {budget_key} не задан бюджет производительности")
+
+        violations = budget.check(stats, settings.PERF_TOLERANCE)
+        if violations:
+            pytest.fail(f"Регрессия производительности {budget_key}: " + "; ".join(violations))
+
+        return stats
+
+    return _measure_performance
@@ -1,5 +1,7 @@
 from typing import Optional
 
+from client import urls
+
 
 class APIBuilder:
     """Класс для формирования URL адресов API запросов."""
@@ -7,22 +9,18 @@ class APIBuilder:
     @staticmethod
     def build_url(endpoint: str, sep: Optional[str] = "?", **params) -> str:
         """
-        Формирует URL с query-параметрами.
+        Формирует канонический URL с query-параметрами.
+
+        Параметры упорядочиваются по имени и кодируются процентами, логические
+        значения записываются как true/false, поэтому эквивалентные наборы
+        параметров дают одну и ту же строку. Построенные URL кэшируются.
 
         Args:
             endpoint: Базовый URL endpoint
-            sep: Разделитель перед query-параметрами
-            **params: Параметры для добавления в query string
+            sep: Разделитель перед query-параметрами endpoint без query (None - "?")
+            **params: Параметры для добавления в query string (None пропускаются)
         """
-        url = f"{endpoint}"
-
-        if params:
-            # Фильтруем None значения
-            filtered_params = {k: v for k, v in params.items() if v is not None}
-            query_string = "&".join(f"{k}={v}" for k, v in filtered_params.items())
-            url += f"{sep}{query_string}"
-
-        return url
+        return urls.build_url(endpoint, sep, **params)
 
     @staticmethod
     def build_url_with_id(base_url: str, object_id: str) -> str:
@@ -35,4 +33,14 @@ class APIBuilder:
         """
         url = f"{base_url}/{object_id}"
 
-        return url
\ No newline at end of file
+        return url
+
+    @staticmethod
+    def request_key(url: str) -> str:
+        """
+        Возвращает канонический ключ запроса для кэшей и дедупликации.
+
+        Args:
+            url: URL запроса
+        """
+        return urls.request_key(url)
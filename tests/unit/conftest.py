@@ -0,0 +1,110 @@
+import threading
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+import pytest
+
+from config import settings
+from client.api_client import APIClient
+from client.cache import ResponseCache
+from client.session import APISession
+
+
+class _RouteHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов, отвечающий заданными для путей ответами."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "LocalAPI"
+
+    def do_GET(self):
+        self.server.hits[self.path] += 1
+        route = self.server.routes.get(self.path.split("?", 1)[0])
+        if route is None:
+            status, headers, body = 404, {}, b'{"message": "Not Found"}'
+        else:
+            status, headers, body = route(self)
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Отключает вывод журнала запросов в stderr."""
+        pass
+
+
+class LocalAPI(ThreadingHTTPServer):
+    """
+    Локальный HTTP-сервер для проверки клиента без обращения к API.
+
+    Ответы задаются для путей функциями, принимающими обработчик запроса и
+    возвращающими (статус, заголовки, тело); количество запросов по полному
+    пути с query хранится в hits.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RouteHandler)
+        self.routes: dict[str, Callable] = {}
+        self.hits: Counter = Counter()
+
+    @property
+    def base_url(self) -> str:
+        """Базовый URL сервера."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def route(self, path: str, status: int = 200, body: bytes = b"{}", headers: dict = None):
+        """Задает постоянный ответ для пути."""
+        self.routes[path] = lambda handler: (status, headers or {}, body)
+
+    def url(self, path: str) -> str:
+        """Полный URL пути на сервере."""
+        return f"{self.base_url}{path}"
+
+
+@pytest.fixture
+def local_api():
+    """Локальный HTTP-сервер, работающий в фоновом потоке во время теста."""
+    server = LocalAPI()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """
+    Создает клиент API без постоянного кэша, телеметрии, общих ответов и повторов запросов.
+
+    Ограничитель частоты и автоматы выключения по умолчанию отключены и
+    передаются явно, как и остальные параметры клиента.
+    """
+    monkeypatch.setattr(settings, "DISK_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "TELEMETRY_ENABLED", False)
+    monkeypatch.setattr(settings, "SHARED_DIR", None)
+    monkeypatch.setattr(settings, "RATE_LIMIT", 0)
+    monkeypatch.setattr(settings, "BREAKER_THRESHOLD", 0)
+    clients = []
+
+    def factory(**kwargs) -> APIClient:
+        kwargs.setdefault("cache", ResponseCache(ttl=60, max_entries=100, max_bytes=1024 * 1024))
+        kwargs.setdefault("session", APISession(retry_total=0))
+        client = APIClient(**kwargs)
+        clients.append(client)
+        return client
+
+    yield factory
+
+    for client in clients:
+        client.session.close()
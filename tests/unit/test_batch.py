@@ -0,0 +1,91 @@
+import io
+import json
+
+from pathlib import Path
+
+import pytest
+
+from models.batch import BatchValidator, format_summary, iter_json_lines, validate_batch
+
+
+SAMPLE = json.loads((Path(__file__).parents[2] / "benchmarks" / "data" / "object_sample.json").read_text("utf-8"))
+
+
+def make_record(object_id, **fields) -> bytes:
+    """Формирует тело ответа /objects/{id} на основе образца записи."""
+    return json.dumps(dict(SAMPLE, objectID=object_id, **fields)).encode("utf-8")
+
+
+@pytest.fixture
+def payloads() -> list[bytes]:
+    """Записи с ошибками полей, инверсией дат, повтором ID и поврежденным JSON."""
+    return [
+        make_record(1),
+        make_record(2, primaryImage="ftp://image.jpg"),
+        make_record(3, objectBeginDate=1900, objectEndDate=1800),
+        make_record(1),
+        make_record("x"),
+        b"{broken",
+        make_record(4)
+    ]
+
+
+class TestValidateBatch:
+    """Тесты проверки одной пачки записей."""
+
+    def test_failures_by_field(self, payloads):
+        """Проверяет учет ошибок по полям и ID записей с ошибками."""
+        report = validate_batch(5, payloads)
+
+        assert (report.index, report.total, report.invalid, report.valid) == (5, 7, 4, 3)
+        assert report.failures["primaryImage:value_error"] == 1
+        assert report.failures["objectEndDate:value_error"] == 1
+        assert report.failures["objectID:int_parsing"] == 1
+        assert report.failures["__root__:json_invalid"] == 1
+        assert report.messages["objectEndDate:value_error"].endswith("Дата окончания не может быть раньше даты начала")
+        assert report.date_inversions == 1
+        assert report.invalid_ids == [2, 3, None, None]
+        assert sorted(report.object_ids) == [1, 1, 2, 3, 4]
+
+
+class TestBatchValidator:
+    """Тесты пакетной проверки записей."""
+
+    def test_summary(self, payloads):
+        """Проверяет сводный отчет по пачкам, включая повторы ID между пачками."""
+        summary = BatchValidator(batch_size=3, workers=0).validate(payloads)
+
+        assert [(report.index, report.total) for report in summary.batches] == [(0, 3), (1, 3), (2, 1)]
+        assert (summary.total, summary.invalid, summary.date_inversions) == (7, 4, 1)
+        assert summary.duplicates == {1: 2}
+        assert not summary.ok
+        assert all(report.object_ids == [] for report in summary.batches)
+        assert summary.to_dict()["duplicates"] == {"1": 2}
+
+    def test_process_pool_same_result(self, payloads):
+        """Проверяет, что проверка в пуле процессов дает тот же отчет в том же порядке пачек."""
+        local = BatchValidator(batch_size=2, workers=0).validate(payloads * 3)
+        pooled = BatchValidator(batch_size=2, workers=2).validate(payloads * 3)
+
+        assert pooled.to_dict() == local.to_dict()
+
+    def test_valid_records(self):
+        """Проверяет отчет для корректных записей без повторов."""
+        summary = BatchValidator(batch_size=10, workers=0).validate(make_record(i) for i in range(5))
+
+        assert summary.ok
+        assert (summary.total, summary.valid) == (5, 5)
+        assert format_summary(summary).splitlines() == [
+            "Записей: 5, корректных: 5, с ошибками: 0, пачек: 1",
+            "objectEndDate < objectBeginDate: 0, повторяющихся objectID: 0"
+        ]
+
+
+class TestJsonLines:
+    """Тесты чтения записей из потока JSON Lines."""
+
+    def test_blank_lines_skipped(self):
+        """Проверяет, что пустые строки и переводы строк отбрасываются."""
+        stream = io.BytesIO(b'{"objectID": 1}\n\n  {"objectID": 2}\r\n')
+
+        assert list(iter_json_lines(stream)) == [b'{"objectID": 1}', b'{"objectID": 2}']
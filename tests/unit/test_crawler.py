@@ -0,0 +1,136 @@
+import json
+import time
+
+from pathlib import Path
+
+import pytest
+
+from client.crawler import (
+    Checkpoint,
+    CrawlResult,
+    ObjectCrawler,
+    STATUS_ERROR,
+    STATUS_INVALID,
+    STATUS_NOT_FOUND,
+    STATUS_OK
+)
+from client.rate_limit import AdaptiveRateLimiter
+
+
+API_PREFIX = "/public/collection/v1"
+SAMPLE = json.loads((Path(__file__).parents[2] / "benchmarks" / "data" / "object_sample.json").read_text("utf-8"))
+
+
+def make_record(object_id: int, **fields) -> bytes:
+    """Формирует тело ответа /objects/{id} на основе образца записи."""
+    return json.dumps(dict(SAMPLE, objectID=object_id, **fields)).encode("utf-8")
+
+
+@pytest.fixture
+def api(local_api):
+    """Эндпоинты /objects/{id}: корректная запись, запись с ошибкой, 404 и 500."""
+    local_api.route(f"{API_PREFIX}/objects/1", body=make_record(1))
+    local_api.route(f"{API_PREFIX}/objects/2", body=make_record(2, primaryImage="ftp://image.jpg"))
+    local_api.route(f"{API_PREFIX}/objects/4", status=500, body=b'{"message": "error"}')
+    local_api.route(f"{API_PREFIX}/objects/5", body=make_record(5))
+    return local_api
+
+
+class TestCheckpoint:
+    """Тесты контрольной точки обхода."""
+
+    def test_append_and_load(self, tmp_path):
+        """Проверяет, что загружается последний результат каждого объекта."""
+        checkpoint = Checkpoint(str(tmp_path / "crawl" / "checkpoint.jsonl"), flush_every=2)
+        checkpoint.append(CrawlResult(1, STATUS_ERROR, errors=["timeout"]))
+        checkpoint.append(CrawlResult(2, STATUS_INVALID, 200, ["title: error"]))
+        checkpoint.append(CrawlResult(1, STATUS_OK, 200, metadata_date="2024-01-01T00:00:00"))
+
+        # Первые две записи сброшены на диск по flush_every, третья - при закрытии
+        assert len(checkpoint.load()) == 2
+        checkpoint.close()
+        results = checkpoint.load()
+
+        assert results[1] == CrawlResult(1, STATUS_OK, 200, metadata_date="2024-01-01T00:00:00")
+        assert results[2] == CrawlResult(2, STATUS_INVALID, 200, ["title: error"])
+
+    def test_truncated_lines_skipped(self, tmp_path):
+        """Проверяет пропуск пустых и не полностью записанных строк."""
+        path = tmp_path / "checkpoint.jsonl"
+        path.write_text('{"id": 1, "status": "ok"}\n\n{"status": "ok"}\n{"id": 2, "sta', encoding="utf-8")
+
+        assert list(Checkpoint(str(path)).load()) == [1]
+        assert Checkpoint(str(tmp_path / "missing.jsonl")).load() == {}
+
+
+class TestObjectCrawler:
+    """Тесты обхода объектов на локальном сервере."""
+
+    def test_check_object_statuses(self, api, make_client):
+        """Проверяет статусы проверки для корректной записи, записи с ошибкой, 404 и 500."""
+        crawler = ObjectCrawler(make_client(), base_url=api.url(API_PREFIX), workers=2, rate=0, keep_payload=True)
+
+        results = {object_id: crawler.check_object(object_id) for object_id in (1, 2, 3, 4)}
+
+        assert results[1].status == STATUS_OK
+        assert results[1].metadata_date.startswith(SAMPLE["metadataDate"][:19])
+        assert results[1].payload == make_record(1)
+        assert results[2].status == STATUS_INVALID
+        assert results[2].errors[0].startswith("primaryImage")
+        assert (results[3].status, results[3].http_status) == (STATUS_NOT_FOUND, 404)
+        assert (results[4].status, results[4].http_status) == (STATUS_ERROR, 500)
+
+    def test_resume_skips_checked_objects(self, api, make_client, tmp_path):
+        """Проверяет, что при возобновлении повторно проверяются только объекты со статусом error."""
+        checkpoint = Checkpoint(str(tmp_path / "checkpoint.jsonl"))
+        for result in (CrawlResult(1, STATUS_OK), CrawlResult(2, STATUS_INVALID),
+                       CrawlResult(3, STATUS_NOT_FOUND), CrawlResult(4, STATUS_ERROR)):
+            checkpoint.append(result)
+        checkpoint.close()
+        crawler = ObjectCrawler(make_client(), base_url=api.url(API_PREFIX), workers=2, rate=0)
+
+        report = crawler.crawl([1, 2, 3, 4, 5], checkpoint)
+
+        assert (report.total, report.skipped) == (5, 3)
+        assert report.counts == {STATUS_ERROR: 1, STATUS_OK: 1}
+        assert [api.hits[f"{API_PREFIX}/objects/{object_id}"] for object_id in (1, 2, 3, 4, 5)] == [0, 0, 0, 1, 1]
+        assert checkpoint.load()[5].status == STATUS_OK
+
+    def test_in_flight_bounded(self, make_client):
+        """Проверяет, что ID читаются из источника не дальше ограничения на число задач в очереди."""
+        # Единственный поток занят первым объектом, поэтому очередь не разгружается
+        crawler = ObjectCrawler(make_client(), workers=1, rate=0)
+        consumed, seen_by_first = [0], []
+
+        def object_ids():
+            for object_id in range(100):
+                consumed[0] += 1
+                yield object_id
+
+        def check_object(object_id):
+            if object_id == 0:
+                time.sleep(0.2)
+                seen_by_first.append(consumed[0])
+            else:
+                time.sleep(0.01)
+            return CrawlResult(object_id, STATUS_OK)
+
+        crawler.check_object = check_object
+        report = crawler.crawl(object_ids())
+
+        # Очередь ограничена workers * 4 задачами, и еще один ID ожидает места в ней
+        assert seen_by_first[0] == crawler.workers * 4 + 1
+        assert (report.total, report.counts) == (100, {STATUS_OK: 100})
+
+    def test_rate_sets_client_limiter(self, make_client):
+        """Проверяет, что частота обхода задается ограничителю клиента, а не отдельному ограничителю."""
+        client = make_client(limiter=AdaptiveRateLimiter(80))
+        ObjectCrawler(client, rate=20)
+
+        assert client.limiter.max_rate == 20
+
+        client = make_client()
+        ObjectCrawler(client, rate=20)
+
+        assert client.limiter.max_rate == 20
+        assert ObjectCrawler(make_client(), rate=0).client.limiter is None
@@ -0,0 +1,150 @@
+import json
+
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+
+from client.crawler import ObjectCrawler, STATUS_ERROR, STATUS_OK
+from client.delta import DeltaValidator, SyncState
+
+
+API_PREFIX = "/public/collection/v1"
+# Дата синхронизации сохраняется по UTC
+TODAY = datetime.now(timezone.utc).date().isoformat()
+SAMPLE = json.loads((Path(__file__).parents[2] / "benchmarks" / "data" / "object_sample.json").read_text("utf-8"))
+
+
+def make_record(object_id: int) -> bytes:
+    """Формирует тело ответа /objects/{id} на основе образца записи."""
+    return json.dumps(dict(SAMPLE, objectID=object_id)).encode("utf-8")
+
+
+@pytest.fixture
+def api(local_api):
+    """
+    API коллекции: /objects возвращает все ID или ID из changed при запросе с metadataDate.
+
+    Даты metadataDate из запросов сохраняются в since.
+    """
+    local_api.all_ids = [1, 2, 3, 4]
+    local_api.changed = []
+    local_api.since = []
+
+    def objects(handler):
+        query = parse_qs(urlsplit(handler.path).query)
+        local_api.since.append(query.get("metadataDate", [None])[0])
+        object_ids = local_api.changed if "metadataDate" in query else local_api.all_ids
+        return 200, {}, json.dumps({"total": len(object_ids), "objectIDs": object_ids}).encode()
+
+    local_api.routes[f"{API_PREFIX}/objects"] = objects
+    for object_id in (1, 2, 3, 4):
+        local_api.route(f"{API_PREFIX}/objects/{object_id}", body=make_record(object_id))
+    return local_api
+
+
+@pytest.fixture
+def validator(api, make_client, tmp_path):
+    crawler = ObjectCrawler(make_client(), base_url=api.url(API_PREFIX), workers=2, rate=0)
+    return DeltaValidator(crawler, str(tmp_path / "delta"))
+
+
+def hits(api, object_id: int) -> int:
+    """Количество запросов объекта к локальному серверу."""
+    return api.hits[f"{API_PREFIX}/objects/{object_id}"]
+
+
+class TestSyncState:
+    """Тесты сохранения состояния инкрементальной валидации."""
+
+    def test_save_and_load(self, tmp_path):
+        """Проверяет сохранение и загрузку состояния без временного файла."""
+        path = tmp_path / "state.json"
+        SyncState("2024-01-01", [1, 3], [{"changed": 2}]).save(path)
+
+        assert SyncState.load(path) == SyncState("2024-01-01", [1, 3], [{"changed": 2}])
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_missing_state(self, tmp_path):
+        """Проверяет пустое состояние при отсутствии файла."""
+        assert SyncState.load(tmp_path / "state.json") == SyncState()
+
+
+class TestDeltaValidator:
+    """Тесты инкрементальной валидации на локальном сервере."""
+
+    def test_first_run_full_then_changed_only(self, api, validator):
+        """Проверяет, что первый запуск проверяет все объекты, а следующий - только изменившиеся."""
+        first = validator.run()
+        api.changed = [2]
+        second = validator.run()
+
+        assert first.counts == {STATUS_OK: 4}
+        assert second.counts == {STATUS_OK: 1}
+        assert api.since == [None, TODAY]
+        assert [hits(api, object_id) for object_id in (1, 2, 3, 4)] == [1, 2, 1, 1]
+        assert sorted(validator.results.load()) == [1, 2, 3, 4]
+        assert not validator.pending.path.exists()
+        assert len(SyncState.load(validator.state_path).history) == 2
+
+    def test_errors_retried(self, api, validator):
+        """Проверяет, что объекты с ошибкой проверки запрашиваются повторно, даже если не изменились."""
+        api.route(f"{API_PREFIX}/objects/4", status=500)
+        validator.run()
+        api.route(f"{API_PREFIX}/objects/4", body=make_record(4))
+
+        report = validator.run()
+
+        assert report.counts == {STATUS_OK: 1}
+        assert hits(api, 4) == 2
+        assert validator.results.load()[4].status == STATUS_OK
+
+    def test_department_change_resets_cursor(self, api, validator):
+        """Проверяет, что смена фильтра отделов запускает полную проверку."""
+        validator.run()
+        validator.run(department_ids=[3, 1])
+
+        assert api.since == [None, None]
+        assert SyncState.load(validator.state_path).department_ids == [1, 3]
+
+    def test_cursor_not_advanced_on_failure(self, api, validator):
+        """Проверяет, что дата синхронизации не сдвигается, если запуск не завершился."""
+        validator.state_dir.mkdir(parents=True)
+        SyncState("2024-01-01").save(validator.state_path)
+        api.route(f"{API_PREFIX}/objects", status=500)
+
+        with pytest.raises(requests.HTTPError):
+            validator.run()
+
+        assert SyncState.load(validator.state_path) == SyncState("2024-01-01")
+
+    def test_resume_after_interrupted_run(self, api, validator):
+        """Проверяет, что после прерванного запуска проверяются только объекты, не попавшие в контрольную точку."""
+        append = validator.pending.append
+        appended = []
+
+        def interrupt(result):
+            if len(appended) == 2:
+                raise KeyboardInterrupt
+            append(result)
+            appended.append(result.object_id)
+
+        validator.pending.append = interrupt
+        with pytest.raises(KeyboardInterrupt):
+            validator.run()
+        del validator.pending.append
+
+        assert SyncState.load(validator.state_path).last_sync is None
+        assert sorted(validator.pending.load()) == sorted(appended)
+
+        report = validator.run()
+
+        assert (report.total, report.skipped) == (4, 2)
+        assert sorted(validator.results.load()) == [1, 2, 3, 4]
+        assert all(result.status == STATUS_OK for result in validator.results.load().values())
+        assert SyncState.load(validator.state_path).last_sync == TODAY
+        # Объекты из контрольной точки прерванного запуска повторно не запрашивались
+        assert [hits(api, object_id) for object_id in appended] == [1, 1]
+        assert STATUS_ERROR not in report.counts
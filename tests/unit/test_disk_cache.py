@@ -0,0 +1,118 @@
+import os
+import time
+
+import pytest
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+from client.disk_cache import DiskCache
+
+
+OBJECT_PATH = "/public/collection/v1/objects/1"
+
+
+def make_response(body: bytes, status: int = 200, **headers) -> requests.Response:
+    """Создает ответ API с заданным телом и заголовками."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers)
+    return response
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    cache = DiskCache(str(tmp_path / "http_cache"), max_bytes=1024 * 1024)
+    yield cache
+    cache.close()
+
+
+class TestDiskCacheStorage:
+    """Тесты хранения и вытеснения записей постоянного кэша."""
+
+    def test_only_revalidatable_responses_stored(self, disk_cache):
+        """Проверяет, что сохраняются только ответы 200 с ETag или Last-Modified."""
+        assert disk_cache.put("a", make_response(b"{}", ETag='"1"', **{"Content-Encoding": "gzip"}))
+        assert disk_cache.put("b", make_response(b"{}", **{"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}))
+        assert not disk_cache.put("c", make_response(b"{}"))
+        assert not disk_cache.put("d", make_response(b"{}", status=404, ETag='"1"'))
+
+        entry = disk_cache.get("a")
+        assert (entry.status, entry.body, entry.etag) == (200, b"{}", '"1"')
+        assert "Content-Encoding" not in entry.headers
+        assert entry.conditional_headers() == {"If-None-Match": '"1"'}
+        assert disk_cache.get("b").conditional_headers() == {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        assert disk_cache.get("c") is None
+        assert len(disk_cache) == 2
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        """Проверяет вытеснение давно использованных записей при превышении размера."""
+        cache = DiskCache(str(tmp_path), max_bytes=2500)
+        # Случайные данные не сжимаются, поэтому каждая запись занимает чуть больше 1000 байт
+        for key in ("a", "b"):
+            cache.put(key, make_response(os.urandom(1000), ETag=key))
+            time.sleep(0.01)
+        cache.revalidated(cache.get("a"), make_response(b"", status=304))
+        cache.put("c", make_response(os.urandom(1000), ETag="c"))
+
+        assert [entry["key"] for entry in cache.entries()] == ["a", "c"]
+        assert cache.stats.evictions == 1
+        assert cache.size_bytes() <= 2500
+        cache.close()
+
+    def test_prune(self, disk_cache):
+        """Проверяет удаление записей по размеру и по времени последнего использования."""
+        for key in ("a", "b", "c"):
+            disk_cache.put(key, make_response(os.urandom(1000), ETag=key))
+            time.sleep(0.01)
+
+        assert disk_cache.prune(max_bytes=2500) == 1
+        assert disk_cache.prune(older_than=3600) == 0
+        assert disk_cache.prune(older_than=0) == 2
+        assert len(disk_cache) == 0
+
+
+class TestDiskCacheRevalidation:
+    """Тесты перепроверки ответов условными запросами через клиент API."""
+
+    @pytest.fixture
+    def api(self, local_api):
+        """Эндпоинт с ETag, возвращающий 304 при совпадении If-None-Match."""
+        state = {"etag": '"v1"', "body": b'{"objectID": 1, "title": "v1"}'}
+
+        def handler(request):
+            headers = {"ETag": state["etag"]}
+            if request.headers.get("If-None-Match") == state["etag"]:
+                return 304, headers, b""
+            return 200, headers, state["body"]
+
+        local_api.routes[OBJECT_PATH] = handler
+        local_api.state = state
+        return local_api
+
+    def test_not_modified_served_from_disk(self, api, disk_cache, make_client):
+        """Проверяет, что при ответе 304 тело берется из постоянного кэша нового прогона."""
+        url = api.url(OBJECT_PATH)
+        first = make_client(disk_cache=disk_cache).get(url)
+
+        second = make_client(disk_cache=disk_cache).get(url)
+
+        assert first.json() == second.json() == {"objectID": 1, "title": "v1"}
+        assert second.status_code == 200
+        assert second.headers["ETag"] == '"v1"'
+        assert (disk_cache.stats.stored, disk_cache.stats.revalidated) == (1, 1)
+        assert disk_cache.stats.saved_bytes == len(first.content)
+
+    def test_changed_response_replaced(self, api, disk_cache, make_client):
+        """Проверяет, что измененный ответ возвращается и заменяет запись кэша."""
+        url = api.url(OBJECT_PATH)
+        make_client(disk_cache=disk_cache).get(url)
+        api.state.update(etag='"v2"', body=b'{"objectID": 1, "title": "v2"}')
+
+        response = make_client(disk_cache=disk_cache).get(url)
+
+        assert response.json()["title"] == "v2"
+        assert disk_cache.stats.revalidated == 0
+        assert len(disk_cache) == 1
+        assert disk_cache.entries()[0]["etag"] == '"v2"'
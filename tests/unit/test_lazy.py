@@ -0,0 +1,109 @@
+import json
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from pydantic import ValidationError
+
+from models.lazy import LazyObjectSchema, lazy_model
+from models.object import ObjectSchema
+
+
+SAMPLE = json.loads((Path(__file__).parents[2] / "benchmarks" / "data" / "object_sample.json").read_text("utf-8"))
+
+
+def make_body(**fields) -> bytes:
+    """Формирует тело ответа /objects/{id} на основе образца записи."""
+    return json.dumps(dict(SAMPLE, **fields)).encode("utf-8")
+
+
+class TestLazyModel:
+    """Тесты ленивого представления ObjectSchema."""
+
+    def test_same_values_as_model(self):
+        """Проверяет, что значения полей совпадают с полной валидацией модели."""
+        body = make_body()
+        lazy = LazyObjectSchema(body)
+
+        assert lazy.to_dict() == ObjectSchema.model_validate_json(body).model_dump()
+        assert lazy.model() == ObjectSchema.model_validate_json(body)
+        assert lazy.raw is body
+
+    def test_fields_validated_on_access(self):
+        """Проверяет, что тело разбирается при первом обращении, а ошибка относится к полю."""
+        lazy = LazyObjectSchema(make_body(primaryImage="ftp://image.jpg"))
+
+        assert lazy._data is None
+        assert lazy.title == "Sample Painting"
+        assert isinstance(lazy.metadataDate, datetime)
+        with pytest.raises(ValidationError, match="primaryImage"):
+            lazy.primaryImage
+
+    def test_value_cached_in_slot(self):
+        """Проверяет, что повторное обращение возвращает сохраненное значение."""
+        lazy = LazyObjectSchema(make_body())
+
+        assert lazy.additionalImages is lazy.additionalImages
+        assert "additionalImages" in repr(lazy)
+        assert "title" not in repr(lazy)
+
+    def test_defaults_and_normalization(self):
+        """Проверяет значения по умолчанию для отсутствующих полей и нормализацию null в списки."""
+        body = json.dumps({"objectID": 1, "tags": None}).encode()
+        lazy = LazyObjectSchema(body)
+
+        assert lazy.title is None
+        assert lazy.additionalImages == []
+        assert lazy.tags == []
+
+    def test_cross_field_check(self):
+        """Проверяет проверку objectEndDate с учетом objectBeginDate."""
+        body = make_body(objectBeginDate=1900, objectEndDate=1800)
+
+        with pytest.raises(ValidationError, match="Дата окончания"):
+            LazyObjectSchema(body).objectEndDate
+        # Без objectBeginDate в проекции проверка не выполняется
+        assert LazyObjectSchema.project("objectEndDate")(body).objectEndDate == 1800
+
+    def test_unknown_attribute(self):
+        """Проверяет обращение к полю, отсутствующему в модели."""
+        with pytest.raises(AttributeError, match="unknown"):
+            LazyObjectSchema(make_body()).unknown
+
+    def test_not_json_object(self):
+        """Проверяет ошибку для тела, не являющегося JSON объектом."""
+        with pytest.raises(TypeError):
+            LazyObjectSchema(b"[1, 2]").objectID
+
+
+class TestProjection:
+    """Тесты проекций ленивого представления."""
+
+    def test_projection_fields_only(self):
+        """Проверяет, что проекция разбирает и возвращает только свои поля."""
+        Projection = lazy_model(ObjectSchema, ["objectID", "title"])
+        lazy = Projection(make_body())
+
+        assert lazy.to_dict() == {"objectID": SAMPLE["objectID"], "title": SAMPLE["title"]}
+        assert set(lazy._data) == {"objectID", "title"}
+        with pytest.raises(AttributeError):
+            lazy.department
+
+    def test_projection_skips_invalid_fields(self):
+        """Проверяет, что ошибки полей вне проекции не влияют на результат."""
+        lazy = LazyObjectSchema.project("objectID")(make_body(primaryImage="ftp://image.jpg"))
+
+        assert lazy.objectID == SAMPLE["objectID"]
+
+    def test_classes_cached(self):
+        """Проверяет, что для одной проекции создается один класс."""
+        assert lazy_model(ObjectSchema, ["title", "objectID"]) is LazyObjectSchema.project("objectID", "title")
+        assert lazy_model(ObjectSchema) is LazyObjectSchema
+        assert LazyObjectSchema.project("objectID", "title").__slots__ == ("objectID", "title")
+
+    def test_unknown_projection_field(self):
+        """Проверяет ошибку для проекции на отсутствующее поле."""
+        with pytest.raises(ValueError, match="unknown"):
+            lazy_model(ObjectSchema, ["objectID", "unknown"])
@@ -0,0 +1,119 @@
+import time
+
+import pytest
+
+from client.load import LatencyHistogram, LoadRunner, WorkloadItem, format_report
+
+
+class TestLatencyHistogram:
+    """Тесты гистограммы задержек."""
+
+    @pytest.mark.parametrize("micros", [1, 127, 128, 255, 256, 1000, 12345, 999_999, 10_000_000])
+    def test_relative_error(self, micros):
+        """Проверяет, что верхняя граница корзины отличается от значения не более чем на 1 / 2**significant_bits."""
+        histogram = LatencyHistogram(significant_bits=7)
+        histogram.record(micros / 1_000_000)
+
+        low = next(iter(histogram.counts))
+        high = low + (1 << histogram._shift(low)) - 1
+
+        assert low <= micros <= high
+        assert (high - low) / micros <= 1 / 2 ** 7
+
+    def test_percentiles(self):
+        """Проверяет перцентили, минимум, максимум и среднее."""
+        histogram = LatencyHistogram()
+        for millis in range(1, 101):
+            histogram.record(millis / 1000)
+
+        assert histogram.count == 100
+        assert (histogram.min, histogram.max) == (1000, 100_000)
+        assert histogram.mean == pytest.approx(50.5)
+        assert histogram.value_at_percentile(50) == pytest.approx(50, rel=1 / 2 ** 7)
+        assert histogram.value_at_percentile(99) == pytest.approx(99, rel=1 / 2 ** 7)
+        assert histogram.value_at_percentile(100) == 100.0
+
+    def test_empty(self):
+        """Проверяет пустую гистограмму."""
+        histogram = LatencyHistogram()
+
+        assert histogram.value_at_percentile(99) == 0.0
+        assert histogram.mean == 0.0
+
+    def test_merge(self):
+        """Проверяет, что объединение гистограмм дает те же перцентили, что и общая запись."""
+        first, second, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for millis in range(1, 51):
+            first.record(millis / 1000)
+            combined.record(millis / 1000)
+        for millis in range(51, 201):
+            second.record(millis / 1000)
+            combined.record(millis / 1000)
+
+        first.merge(second)
+        first.merge(LatencyHistogram())
+
+        assert (first.count, first.total, first.min, first.max) == \
+            (combined.count, combined.total, combined.min, combined.max)
+        assert [first.value_at_percentile(p) for p in (50, 90, 99)] == \
+            [combined.value_at_percentile(p) for p in (50, 90, 99)]
+
+
+class TestLoadRunner:
+    """Тесты генератора нагрузки на локальном сервере."""
+
+    @pytest.fixture
+    def slow_api(self, local_api):
+        """Эндпоинт, отвечающий за 0.1 сек."""
+        def slow(handler):
+            time.sleep(0.1)
+            return 200, {}, b"{}"
+
+        local_api.routes["/objects"] = slow
+        return local_api
+
+    def test_rate_latency_from_schedule(self, slow_api):
+        """Проверяет, что в режиме rate задержка включает ожидание в очереди, а не только время ответа."""
+        runner = LoadRunner([WorkloadItem(slow_api.url("/objects"))], max_workers=1)
+
+        # 10 запросов раз в 0.05 сек. при одном потоке и времени ответа 0.1 сек. копят очередь
+        report = runner.run_rate(rate=20, duration=0.5)
+        runner.close()
+
+        assert (report.sent, report.statuses[200]) == (10, 10)
+        assert report.histogram.max / 1_000_000 > 0.4
+        assert report.histogram.value_at_percentile(50) > 150
+
+    def test_concurrency_statuses_and_target(self, local_api):
+        """Проверяет замену хоста, учет статусов и ответов с неожиданным статусом."""
+        local_api.route("/objects")
+        local_api.route("/search", status=400)
+        workload = [
+            WorkloadItem("https://collectionapi.metmuseum.org/objects", 200),
+            WorkloadItem("https://collectionapi.metmuseum.org/search", 200)
+        ]
+        runner = LoadRunner(workload, target=local_api.base_url, max_workers=2)
+
+        report = runner.run_concurrency(concurrency=2, duration=0.3)
+        runner.close()
+
+        assert report.sent == report.completed == sum(local_api.hits.values()) > 0
+        assert set(report.statuses) == {200, 400}
+        assert report.unexpected == report.statuses[400]
+        assert report.to_dict()["statuses"]["400"] == report.statuses[400]
+        assert "Статус-коды:" in format_report(report)
+
+    def test_connection_errors_counted(self):
+        """Проверяет учет ошибок соединения без записи задержки."""
+        runner = LoadRunner([WorkloadItem("http://127.0.0.1:9/objects")], max_workers=2, timeout=1)
+
+        report = runner.run_rate(rate=20, duration=0.1)
+        runner.close()
+
+        assert report.sent == report.errors["ConnectionError"] == 2
+        assert report.histogram.count == 0
+
+    def test_empty_workload(self):
+        """Проверяет ошибку для пустой нагрузки."""
+        with pytest.raises(ValueError):
+            LoadRunner([])
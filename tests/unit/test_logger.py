@@ -0,0 +1,78 @@
+import json
+
+from config.logger import merge_log_shards, merge_telemetry_shards, remove_log_shards
+
+
+class TestLogShards:
+    """Тесты объединения файлов-шардов логов процессов-исполнителей."""
+
+    def test_merge_xdist_shards_by_time(self, tmp_path):
+        """Проверяет, что шарды исполнителей сливаются по времени записей, включая многострочные."""
+        (tmp_path / "search_api.gw0.log").write_text(
+            "2024-01-01 10:00:00 - search_api - INFO - первая\n"
+            "2024-01-01 10:00:02 - search_api - ERROR - третья\nTraceback\n  line\n",
+            encoding="utf-8"
+        )
+        (tmp_path / "search_api.gw1.log").write_text(
+            "2024-01-01 10:00:01 - search_api - INFO - вторая\n",
+            encoding="utf-8"
+        )
+
+        merged = merge_log_shards(str(tmp_path))
+
+        assert merged == [tmp_path / "search_api.log"]
+        assert (tmp_path / "search_api.log").read_text(encoding="utf-8").splitlines() == [
+            "2024-01-01 10:00:00 - search_api - INFO - первая",
+            "2024-01-01 10:00:01 - search_api - INFO - вторая",
+            "2024-01-01 10:00:02 - search_api - ERROR - третья",
+            "Traceback",
+            "  line"
+        ]
+        assert not list(tmp_path.glob("*.gw*.log"))
+
+    def test_load_logs_not_merged(self, tmp_path):
+        """Проверяет, что логи нагрузочного прогона не объединяются с логами тестов и не удаляются."""
+        base_log = tmp_path / "search_api.log"
+        load_log = tmp_path / "search_api.load.log"
+        base_log.write_text("2024-01-01 09:00:00 - search_api - INFO - тесты\n", encoding="utf-8")
+        load_log.write_text("2024-01-01 10:00:00 - search_api - INFO - нагрузка\n", encoding="utf-8")
+        (tmp_path / "search_api.gw0.log").write_text("", encoding="utf-8")
+
+        remove_log_shards(str(tmp_path))
+        assert merge_log_shards(str(tmp_path)) == []
+
+        assert base_log.read_text(encoding="utf-8") == "2024-01-01 09:00:00 - search_api - INFO - тесты\n"
+        assert load_log.exists()
+        assert not (tmp_path / "search_api.gw0.log").exists()
+
+
+class TestTelemetryShards:
+    """Тесты объединения телеметрии процессов-исполнителей."""
+
+    @staticmethod
+    def write_events(path, *times):
+        path.write_text("".join(json.dumps({"ts": ts}) + "\n" for ts in times), encoding="utf-8")
+
+    def test_shards_appended_by_time(self, tmp_path):
+        """Проверяет, что телеметрия исполнителей с ротированными копиями дописывается в общий файл по времени."""
+        self.write_events(tmp_path / "telemetry.jsonl", 1)
+        self.write_events(tmp_path / "telemetry.gw0.jsonl.1", 2)
+        self.write_events(tmp_path / "telemetry.gw0.jsonl", 5)
+        self.write_events(tmp_path / "telemetry.gw1.jsonl", 3, 4)
+
+        merged = merge_telemetry_shards(str(tmp_path))
+
+        assert merged == [tmp_path / "telemetry.jsonl"]
+        lines = (tmp_path / "telemetry.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["ts"] for line in lines] == [1, 2, 3, 4, 5]
+        assert [path.name for path in tmp_path.iterdir()] == ["telemetry.jsonl"]
+
+    def test_stale_shards_removed(self, tmp_path):
+        """Проверяет удаление телеметрии исполнителей, оставшейся от прерванного прогона."""
+        self.write_events(tmp_path / "telemetry.gw0.jsonl", 1)
+        self.write_events(tmp_path / "telemetry.gw0.jsonl.2", 1)
+        self.write_events(tmp_path / "telemetry.load.jsonl", 1)
+
+        remove_log_shards(str(tmp_path))
+
+        assert [path.name for path in tmp_path.iterdir()] == ["telemetry.load.jsonl"]
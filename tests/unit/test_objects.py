@@ -0,0 +1,137 @@
+import pytest
+
+from pydantic import ValidationError
+
+from models.objects import CompactObjectsSchema, ObjectIDArray, ObjectsSchema, is_increasing, validate_object_ids
+from models.validation import validate_json
+
+
+class TestValidateObjectIds:
+    """Тесты проверки списка ID объектов."""
+
+    @pytest.mark.parametrize("values, expected", [
+        ([], True),
+        ([7], True),
+        ([1, 5, 9], True),
+        ([1, 5, 5], False),
+        ([5, 1], False)
+    ])
+    def test_is_increasing(self, values, expected):
+        """Проверяет признак строгого возрастания."""
+        assert is_increasing(values) is expected
+
+    def test_non_strict(self):
+        """Проверяет нестрогое возрастание, в том числе для array."""
+        assert is_increasing([1, 5, 5], strict=False)
+        assert not is_increasing(ObjectIDArray([5, 1])._data, strict=False)
+
+    def test_sorted_and_unsorted_lists(self):
+        """Проверяет, что упорядоченность возвращается вместе с упакованным массивом."""
+        ids, is_sorted = validate_object_ids([1, 5, 9])
+        assert (ids.tolist(), is_sorted) == ([1, 5, 9], True)
+
+        ids, is_sorted = validate_object_ids([9, 1, 5])
+        assert (ids.tolist(), is_sorted) == ([9, 1, 5], False)
+
+    @pytest.mark.parametrize("values", [[1, 2, 2, 3], [3, 1, 3]])
+    def test_duplicates_rejected(self, values):
+        """Проверяет, что повторы отклоняются в упорядоченных и неупорядоченных списках."""
+        with pytest.raises(ValueError, match="не должны повторяться"):
+            validate_object_ids(values)
+
+
+class TestObjectIDArray:
+    """Тесты компактного массива ID объектов."""
+
+    def test_buffer_without_copy(self):
+        """Проверяет, что буфер ссылается на данные массива и доступен только для чтения."""
+        ids = ObjectIDArray([5, 1, 3])
+        buffer = ids.buffer
+
+        assert buffer.tolist() == [5, 1, 3]
+        assert buffer.readonly
+        assert ids.nbytes == 3 * buffer.itemsize
+        with pytest.raises(TypeError):
+            buffer[0] = 7
+
+    def test_sorted_and_unique(self):
+        """Проверяет упорядочивание, удаление повторов и признак упорядоченности."""
+        ids = ObjectIDArray([5, 1, 3, 1])
+
+        assert not ids.is_sorted
+        assert ids.sorted() == [1, 1, 3, 5]
+        assert ObjectIDArray([1, 1, 3]).is_sorted
+        assert ids.unique() == [1, 3, 5]
+        assert ids.unique().is_sorted
+        sorted_ids = ObjectIDArray([1, 2, 3])
+        assert sorted_ids.sorted() is sorted_ids
+
+    @pytest.mark.parametrize("values", [[1, 3, 5, 7], [7, 1, 5, 3]])
+    def test_contains(self, values):
+        """Проверяет поиск ID в упорядоченном и неупорядоченном массиве."""
+        ids = ObjectIDArray(values)
+
+        assert 5 in ids
+        assert 4 not in ids
+        assert 8 not in ids
+        assert "5" not in ids
+
+    def test_eq_slice_and_repr(self):
+        """Проверяет сравнение, срезы и строковое представление."""
+        ids = ObjectIDArray([1, 2, 3])
+
+        assert ids == ObjectIDArray([1, 2, 3])
+        assert ids != [1, 2]
+        assert isinstance(ids[1:], ObjectIDArray) and ids[1:] == [2, 3]
+        assert ids[0] == 1
+        assert repr(ids) == f"ObjectIDArray(len=3, nbytes={ids.nbytes})"
+
+    def test_invalid_values(self):
+        """Проверяет ошибки для нецелых и отрицательных ID."""
+        with pytest.raises(TypeError):
+            ObjectIDArray([1, "2"])
+        with pytest.raises(OverflowError):
+            ObjectIDArray([-1])
+
+
+class TestCompactObjectsSchema:
+    """Тесты компактной схемы ответа /objects."""
+
+    def test_same_result_as_list_schema(self):
+        """Проверяет, что компактная схема принимает те же данные и сериализуется в список."""
+        body = b'{"total": 3, "objectIDs": [10, 2, 30]}'
+
+        compact = validate_json(CompactObjectsSchema, body)
+
+        assert isinstance(compact.objectIDs, ObjectIDArray)
+        assert compact.objectIDs == validate_json(ObjectsSchema, body).objectIDs
+        assert compact.model_dump() == {"total": 3, "objectIDs": [10, 2, 30]}
+        assert compact.memory_usage() == compact.objectIDs.nbytes
+        assert compact.memory_usage() < validate_json(ObjectsSchema, body).memory_usage()
+        assert compact.objectIDs._sorted is False
+        assert validate_json(CompactObjectsSchema, b'{"total": 2, "objectIDs": [1, 2]}').objectIDs._sorted
+
+    @pytest.mark.parametrize("object_ids, message", [
+        ([1, 1], "не должны повторяться"),
+        ([1, -1], "в диапазоне"),
+        ([2 ** 32], "в диапазоне")
+    ])
+    def test_invalid_object_ids(self, object_ids, message):
+        """Проверяет ошибки валидации значений objectIDs."""
+        with pytest.raises(ValidationError, match=message):
+            CompactObjectsSchema.model_validate({"total": 2, "objectIDs": object_ids})
+
+    @pytest.mark.parametrize("object_ids, message", [
+        ([1, "2"], "целочисленными"),
+        ("1,2", "списком")
+    ])
+    def test_invalid_object_ids_type(self, object_ids, message):
+        """Проверяет, что ошибки типа objectIDs передаются как TypeError, как в ObjectsSchema."""
+        with pytest.raises(TypeError, match=message):
+            CompactObjectsSchema.model_validate({"total": 2, "objectIDs": object_ids})
+
+    def test_array_passed_without_copy(self):
+        """Проверяет, что готовый ObjectIDArray принимается без повторной упаковки."""
+        ids = ObjectIDArray([1, 2])
+
+        assert CompactObjectsSchema(total=2, objectIDs=ids).objectIDs is ids
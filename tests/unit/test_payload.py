@@ -0,0 +1,59 @@
+import pytest
+import requests
+
+from client.payload import APIResponse, Payload
+
+
+def make_response(body: bytes) -> APIResponse:
+    """Создает ответ API с заданным телом."""
+    response = APIResponse()
+    response._content = body
+    response.encoding = "utf-8"
+    response.status_code = 200
+    return response
+
+
+class TestAPIResponse:
+    """Тесты однократного разбора тела ответа."""
+
+    def test_body_parsed_once(self):
+        """Проверяет, что повторные вызовы json() используют сохраненный результат."""
+        response = make_response(b'{"total": 2, "objectIDs": [1, 2]}')
+
+        first, second = response.json(), response.json()
+
+        assert first == second == {"total": 2, "objectIDs": [1, 2]}
+        assert first is not second
+        assert first["objectIDs"] is second["objectIDs"] is response.payload.data["objectIDs"]
+
+    def test_top_level_copy(self):
+        """Проверяет, что замена ключей верхнего уровня не затрагивает общие данные."""
+        response = make_response(b'{"total": 0, "objectIDs": null}')
+
+        response.json()["objectIDs"] = []
+
+        assert response.json()["objectIDs"] is None
+
+    def test_invalid_json(self):
+        """Проверяет, что для некорректного тела ошибку формирует requests."""
+        response = make_response(b"<html>Bad Gateway</html>")
+
+        with pytest.raises(requests.JSONDecodeError):
+            response.json()
+
+    def test_adopt_without_copy(self):
+        """Проверяет преобразование ответа requests в APIResponse."""
+        response = requests.Response()
+        response._content = b"[1, 2]"
+
+        adopted = APIResponse.adopt(response)
+
+        assert adopted is response
+        assert adopted.json() == [1, 2]
+
+    def test_payload_frozen(self):
+        """Проверяет, что поля Payload нельзя переназначить."""
+        payload = Payload.parse(b"{}")
+
+        with pytest.raises(AttributeError):
+            payload.data = {"a": 1}
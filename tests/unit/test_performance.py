@@ -0,0 +1,32 @@
+from client.performance import PerfBudget, measure_endpoint
+from client.rate_limit import AdaptiveRateLimiter
+
+
+OBJECTS_PATH = "/public/collection/v1/objects"
+
+
+class TestMeasureEndpoint:
+    """Тесты замеров производительности эндпоинта."""
+
+    def test_latency_excludes_limiter_wait(self, local_api, make_client):
+        """Проверяет, что ожидание слота ограничителя частоты не входит в задержку."""
+        local_api.route(OBJECTS_PATH, body=b'{"total": 0, "objectIDs": []}')
+        # Слоты выдаются раз в 0.1 сек., сам запрос к локальному серверу занимает миллисекунды
+        client = make_client(limiter=AdaptiveRateLimiter(10, burst=1))
+
+        stats = measure_endpoint(client, local_api.url(OBJECTS_PATH), samples=3)
+
+        assert stats.max < 50
+        assert client.limiter.stats.waited > 0.15
+        assert stats.bytes_mean == 29
+        assert local_api.hits[OBJECTS_PATH] == 4
+
+    def test_server_errors_counted(self, local_api, make_client):
+        """Проверяет, что ответы 5xx учитываются как ошибки и нарушают бюджет."""
+        local_api.route(OBJECTS_PATH, status=502, body=b"Bad Gateway")
+        client = make_client()
+
+        stats = measure_endpoint(client, local_api.url(OBJECTS_PATH), samples=2)
+
+        assert stats.errors == 2
+        assert PerfBudget(p95_ms=1000).check(stats, tolerance=0.25) == ["ошибок при замерах: 2 из 2"]
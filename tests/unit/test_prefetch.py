@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+from client.prefetch import HostRateLimiter, PrefetchEngine
+
+
+class TestPrefetchEngine:
+    """Тесты параллельной предзагрузки ответов в кэш клиента."""
+
+    def test_urls_loaded_into_cache_once(self, local_api, make_client):
+        """Проверяет, что повторяющиеся URL загружаются один раз, а тесты получают ответ из кэша."""
+        local_api.route("/objects")
+        client = make_client()
+        urls = [local_api.url(f"/objects?q={i % 3}") for i in range(9)]
+
+        stats = PrefetchEngine(client, concurrency=4, host_rate=0).prefetch(urls)
+
+        assert (stats.urls, stats.fetched, stats.failed) == (3, 3, 0)
+        assert sum(local_api.hits.values()) == 3
+        client.get(urls[0])
+        assert sum(local_api.hits.values()) == 3
+        assert client.cache.stats.hits == 1
+
+    def test_requests_run_concurrently(self, local_api, make_client):
+        """Проверяет, что медленные ответы загружаются параллельно в пределах concurrency."""
+        def slow(handler):
+            time.sleep(0.2)
+            return 200, {}, b"{}"
+
+        local_api.routes["/slow"] = slow
+        urls = [local_api.url(f"/slow?n={i}") for i in range(4)]
+
+        stats = PrefetchEngine(make_client(), concurrency=4, host_rate=0).prefetch(urls)
+
+        assert stats.fetched == 4
+        assert stats.elapsed < 0.6
+
+    def test_failures_do_not_stop_prefetch(self, local_api, make_client):
+        """Проверяет, что ошибки соединения учитываются, а остальные URL загружаются."""
+        local_api.route("/objects")
+        urls = [local_api.url("/objects"), "http://127.0.0.1:9/objects"]
+
+        stats = PrefetchEngine(make_client(), concurrency=2, host_rate=0, timeout=1).prefetch(urls)
+
+        assert (stats.fetched, stats.failed) == (1, 1)
+
+    def test_empty_urls(self, make_client):
+        """Проверяет предзагрузку пустого списка."""
+        assert PrefetchEngine(make_client()).prefetch([]).urls == 0
+
+
+class TestHostRateLimiter:
+    """Тесты ограничения частоты запросов к хосту."""
+
+    def test_slots_spaced_per_host(self):
+        """Проверяет интервал между запросами к одному хосту и независимость хостов."""
+        limiter = HostRateLimiter(rate=20)
+
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(*(limiter.acquire("a") for _ in range(3)), limiter.acquire("b"))
+            return time.monotonic() - started
+
+        elapsed = asyncio.run(run())
+
+        # Три запроса к хосту a занимают два интервала по 0.05 сек.
+        assert 0.09 <= elapsed < 0.3
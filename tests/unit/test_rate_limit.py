@@ -0,0 +1,202 @@
+import time
+
+import pytest
+import requests
+
+from client.rate_limit import (
+    AdaptiveRateLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    EndpointCircuitBreakers,
+    parse_retry_after
+)
+
+
+SEARCH_PATH = "/public/collection/v1/search"
+
+
+class TestAdaptiveRateLimiter:
+    """Тесты подстройки частоты запросов по ответам API."""
+
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_throttle_statuses_decrease_rate(self, status):
+        """Проверяет, что ответы о перегрузке снижают частоту."""
+        limiter = AdaptiveRateLimiter(100, min_rate=1)
+        limiter.on_response(status, sent_at=limiter.acquire())
+
+        assert limiter.rate == 50
+        assert limiter.stats.throttled == 1
+        assert limiter.stats.decreases == 1
+
+    @pytest.mark.parametrize("status", [200, 400, 404, 500, 502])
+    def test_other_statuses_keep_rate(self, status):
+        """Проверяет, что остальные ответы, включая 502, частоту не снижают."""
+        limiter = AdaptiveRateLimiter(100, min_rate=1)
+        for _ in range(10):
+            limiter.on_response(status, sent_at=limiter.acquire())
+
+        assert limiter.rate == 100
+        assert limiter.stats.throttled == 0
+
+    def test_rate_not_below_min(self):
+        """Проверяет, что частота не опускается ниже min_rate."""
+        limiter = AdaptiveRateLimiter(100, min_rate=30)
+        for _ in range(5):
+            limiter.on_response(429)
+
+        assert limiter.rate == 30
+
+    def test_set_rate_keeps_decrease(self):
+        """Проверяет, что новая максимальная частота сохраняет выполненное снижение."""
+        limiter = AdaptiveRateLimiter(80, min_rate=1)
+        limiter.on_response(429)
+
+        limiter.set_rate(20)
+
+        assert (limiter.max_rate, limiter.rate) == (20, 10)
+        assert (limiter.burst, limiter.increase) == (2, 1)
+
+    def test_requests_sent_before_decrease_ignored(self):
+        """Проверяет, что ответы на запросы, отправленные до снижения, частоту повторно не снижают."""
+        limiter = AdaptiveRateLimiter(100, min_rate=1, burst=10)
+        slots = [limiter.acquire() for _ in range(3)]
+        for sent_at in slots:
+            limiter.on_response(429, sent_at=sent_at)
+
+        assert limiter.rate == 50
+        assert limiter.stats.throttled == 3
+        assert limiter.stats.decreases == 1
+
+    def test_retry_after_blocks_slots(self):
+        """Проверяет, что Retry-After откладывает следующий слот."""
+        limiter = AdaptiveRateLimiter(1000, min_rate=1000)
+        limiter.on_response(429, retry_after=0.2, sent_at=limiter.acquire())
+
+        started = time.monotonic()
+        limiter.acquire()
+
+        assert time.monotonic() - started >= 0.15
+        assert limiter.stats.retry_after == 1
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, None),
+        ("", None),
+        ("5", 5.0),
+        ("-3", 0.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("soon", None)
+    ])
+    def test_parse_retry_after(self, value, expected):
+        """Проверяет разбор заголовка Retry-After в секундах и в формате HTTP-даты."""
+        assert parse_retry_after(value) == expected
+
+
+class TestCircuitBreaker:
+    """Тесты автомата выключения эндпоинта."""
+
+    @pytest.mark.parametrize("status", [429, 503, None])
+    def test_failures_open_breaker(self, status):
+        """Проверяет, что ответы 429/503 и ошибки соединения подряд размыкают автомат."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        for _ in range(3):
+            assert breaker.allow()
+            breaker.record(status)
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+        assert breaker.opened == 1
+
+    @pytest.mark.parametrize("status", [400, 404, 500, 502])
+    def test_deterministic_errors_keep_breaker_closed(self, status):
+        """Проверяет, что ошибочные ответы на конкретные URL не размыкают автомат."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        for _ in range(10):
+            breaker.record(status)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow()
+
+    def test_success_resets_failures(self):
+        """Проверяет, что успешный ответ сбрасывает счетчик ошибок подряд."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        for status in (503, 503, 200, 503, 503):
+            breaker.record(status)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_probe(self):
+        """Проверяет пробный запрос после reset_timeout: успех замыкает автомат, ошибка размыкает."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record(None)
+        assert not breaker.allow()
+
+        time.sleep(0.06)
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        # Пока идет пробный запрос, остальные запросы отклоняются
+        assert not breaker.allow()
+
+        breaker.record(503)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.opened == 2
+
+        time.sleep(0.06)
+        assert breaker.allow()
+        breaker.record(200)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_breakers_per_endpoint(self):
+        """Проверяет, что автоматы разных эндпоинтов независимы."""
+        breakers = EndpointCircuitBreakers(failure_threshold=1, reset_timeout=60)
+        breakers.get("/search").record(None)
+
+        assert not breakers.get("/search").allow()
+        assert breakers.get("/objects").allow()
+        assert [endpoint for endpoint, _ in breakers.items()] == ["/objects", "/search"]
+
+
+class TestClientThrottling:
+    """Тесты ограничения частоты и автоматов выключения в клиенте API."""
+
+    def test_repeated_502_do_not_open_breaker(self, local_api, make_client):
+        """Проверяет, что повторяющиеся 502 на невалидные параметры не приостанавливают эндпоинт."""
+        local_api.route(SEARCH_PATH, status=502, body=b"<html>Bad Gateway</html>")
+        limiter = AdaptiveRateLimiter(1000)
+        breakers = EndpointCircuitBreakers(failure_threshold=3, reset_timeout=60)
+        client = make_client(limiter=limiter, breakers=breakers)
+
+        for i in range(10):
+            response = client.get(local_api.url(f"{SEARCH_PATH}?isHighlight=true&n={i}"))
+            assert response.status_code == 502
+
+        assert breakers.get("/search").state == CircuitBreaker.CLOSED
+        assert limiter.rate == 1000
+        assert limiter.stats.throttled == 0
+
+    def test_repeated_503_open_breaker(self, local_api, make_client):
+        """Проверяет, что после серии 503 запросы к эндпоинту не выполняются."""
+        local_api.route(SEARCH_PATH, status=503)
+        breakers = EndpointCircuitBreakers(failure_threshold=3, reset_timeout=60)
+        client = make_client(breakers=breakers)
+
+        for i in range(3):
+            assert client.get(local_api.url(f"{SEARCH_PATH}?q={i}")).status_code == 503
+
+        with pytest.raises(CircuitOpenError):
+            client.get(local_api.url(f"{SEARCH_PATH}?q=3"))
+        assert sum(local_api.hits.values()) == 3
+
+    def test_connection_errors_open_breaker(self, local_api, make_client):
+        """Проверяет, что ошибки соединения размыкают автомат."""
+        url = local_api.url(SEARCH_PATH)
+        local_api.shutdown()
+        local_api.server_close()
+        breakers = EndpointCircuitBreakers(failure_threshold=2, reset_timeout=60)
+        client = make_client(breakers=breakers)
+
+        for i in range(2):
+            with pytest.raises(requests.ConnectionError):
+                client.get(f"{url}?q={i}", timeout=1)
+
+        with pytest.raises(CircuitOpenError):
+            client.get(f"{url}?q=2", timeout=1)
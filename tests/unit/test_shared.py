@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+from client.shared import FileLock, SharedResponseStore
+
+
+URL = "https://collectionapi.metmuseum.org/public/collection/v1/objects/1"
+
+
+def make_response(body: bytes = b'{"objectID": 1}') -> requests.Response:
+    """Создает ответ API с заданным телом."""
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response._content = body
+    response.headers = CaseInsensitiveDict({"Content-Type": "application/json", "Content-Encoding": "gzip"})
+    response.elapsed = timedelta(seconds=0.25)
+    return response
+
+
+def fetch_in_process(shared_dir: str, counter_path: str) -> bytes:
+    """Запрашивает ответ через общее хранилище в отдельном процессе, отмечая выполнение запроса."""
+    def fetch():
+        with open(counter_path, "a", encoding="utf-8") as f:
+            f.write(f"{os.getpid()}\n")
+        time.sleep(0.2)
+        return make_response()
+
+    return SharedResponseStore(shared_dir, ttl=60).do(URL, URL, fetch).content
+
+
+class TestFileLock:
+    """Тесты межпроцессной файловой блокировки."""
+
+    def test_threads_serialized(self, tmp_path):
+        """Проверяет, что потоки, открывающие файл блокировки отдельно, не входят в нее одновременно."""
+        active, overlaps = [0], []
+        counter_lock = threading.Lock()
+
+        def work(_):
+            with FileLock(tmp_path / "key.lock"):
+                with counter_lock:
+                    active[0] += 1
+                    overlaps.append(active[0])
+                time.sleep(0.02)
+                with counter_lock:
+                    active[0] -= 1
+
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(work, range(8)))
+
+        assert max(overlaps) == 1
+
+
+class TestSharedResponseStore:
+    """Тесты общих для процессов ответов API."""
+
+    def test_response_restored(self, tmp_path):
+        """Проверяет, что сохраненный ответ восстанавливается с телом, статусом и заголовками."""
+        store = SharedResponseStore(str(tmp_path), ttl=60)
+        store.do(URL, URL, make_response)
+
+        response = SharedResponseStore(str(tmp_path), ttl=60).do(URL, URL, pytest.fail)
+
+        assert (response.status_code, response.reason, response.url) == (200, "OK", URL)
+        assert response.json() == {"objectID": 1}
+        assert "Content-Encoding" not in response.headers
+        assert response.elapsed == timedelta(seconds=0.25)
+        assert response.request.url == URL
+        assert (store.stats.fetched, store.stats.shared) == (1, 0)
+
+    def test_fetched_once_across_threads(self, tmp_path):
+        """Проверяет, что одновременные запросы одного ключа выполняют fetch один раз."""
+        store = SharedResponseStore(str(tmp_path), ttl=60)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.2)
+            return make_response()
+
+        with ThreadPoolExecutor(4) as pool:
+            bodies = list(pool.map(lambda _: store.do(URL, URL, fetch).content, range(4)))
+
+        assert len(calls) == 1
+        assert bodies == [b'{"objectID": 1}'] * 4
+        assert (store.stats.fetched, store.stats.shared) == (1, 3)
+        assert store.stats.saved_bytes == 3 * len(bodies[0])
+
+    def test_fetched_once_across_processes(self, tmp_path):
+        """Проверяет, что процессы прогона выполняют запрос одного ключа один раз."""
+        counter_path = tmp_path / "fetches.txt"
+
+        with ProcessPoolExecutor(3) as pool:
+            bodies = list(pool.map(fetch_in_process, [str(tmp_path / "shared")] * 3, [str(counter_path)] * 3))
+
+        assert bodies == [b'{"objectID": 1}'] * 3
+        assert len(counter_path.read_text(encoding="utf-8").splitlines()) == 1
+
+    def test_expired_response_fetched_again(self, tmp_path):
+        """Проверяет, что ответ старше ttl запрашивается заново."""
+        store = SharedResponseStore(str(tmp_path), ttl=60)
+        store.do(URL, URL, make_response)
+        for path in tmp_path.glob("*.resp"):
+            os.utime(path, (time.time() - 120, time.time() - 120))
+
+        response = store.do(URL, URL, lambda: make_response(b'{"objectID": 2}'))
+
+        assert response.json() == {"objectID": 2}
+        assert store.stats.fetched == 2
+
+    def test_fetch_error_not_saved(self, tmp_path):
+        """Проверяет, что исключение fetch передается вызывающему и ответ не сохраняется."""
+        store = SharedResponseStore(str(tmp_path), ttl=60)
+
+        def fail():
+            raise requests.ConnectionError("нет соединения")
+
+        with pytest.raises(requests.ConnectionError):
+            store.do(URL, URL, fail)
+
+        assert not list(tmp_path.glob("*.resp"))
+        assert store.do(URL, URL, make_response).json() == {"objectID": 1}
+        assert store.stats.fetched == 1
+
+    def test_clients_share_response(self, tmp_path, local_api, make_client):
+        """Проверяет, что клиенты с общей директорией отправляют один сетевой запрос."""
+        local_api.route("/objects/1", body=b'{"objectID": 1}')
+        url = local_api.url("/objects/1")
+
+        first = make_client(shared=SharedResponseStore(str(tmp_path), ttl=60)).get(url)
+        second = make_client(shared=SharedResponseStore(str(tmp_path), ttl=60)).get(url)
+
+        assert first.json() == second.json() == {"objectID": 1}
+        assert local_api.hits["/objects/1"] == 1
@@ -0,0 +1,99 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from client.singleflight import SingleFlight
+
+
+def run_concurrently(flight: SingleFlight, key, func, threads: int = 8) -> list:
+    """Вызывает flight.do одновременно из нескольких потоков и возвращает результаты или исключения."""
+    barrier = threading.Barrier(threads)
+
+    def call():
+        barrier.wait()
+        try:
+            return flight.do(key, func)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(threads) as pool:
+        return list(pool.map(lambda _: call(), range(threads)))
+
+
+class TestSingleFlight:
+    """Тесты объединения одновременных вызовов."""
+
+    def test_concurrent_calls_coalesced(self):
+        """Проверяет, что одновременные вызовы с одним ключом выполняют функцию один раз."""
+        flight = SingleFlight()
+        executions = []
+
+        def func():
+            executions.append(1)
+            time.sleep(0.2)
+            return {"objectID": 1}
+
+        results = run_concurrently(flight, "key", func)
+
+        assert len(executions) == 1
+        assert all(result is results[0] for result in results)
+        assert (flight.stats.calls, flight.stats.executions, flight.stats.saved) == (8, 1, 7)
+        assert flight.in_flight() == 0
+
+    def test_exception_shared(self):
+        """Проверяет, что исключение ведущего вызова получают все ожидающие потоки."""
+        flight = SingleFlight()
+
+        def func():
+            time.sleep(0.2)
+            raise ConnectionError("нет соединения")
+
+        results = run_concurrently(flight, "key", func)
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert flight.stats.executions == 1
+        assert flight.in_flight() == 0
+
+    def test_different_keys_not_coalesced(self):
+        """Проверяет, что вызовы с разными ключами выполняются независимо."""
+        flight = SingleFlight()
+
+        assert [flight.do(key, lambda key=key: key * 2) for key in (1, 2)] == [2, 4]
+        assert flight.stats.saved == 0
+
+    def test_key_released_after_call(self):
+        """Проверяет, что после завершения вызова следующий вызов выполняется заново."""
+        flight = SingleFlight()
+        with pytest.raises(ValueError):
+            flight.do("key", lambda: int("x"))
+
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.stats.executions == 2
+
+
+class TestClientSingleFlight:
+    """Тесты объединения одновременных запросов клиента API."""
+
+    def test_concurrent_requests_share_response(self, local_api, make_client):
+        """Проверяет, что одновременные запросы одного URL отправляют один сетевой запрос."""
+        def slow(handler):
+            time.sleep(0.2)
+            return 200, {}, b'{"objectID": 1}'
+
+        local_api.routes["/objects/1"] = slow
+        client = make_client()
+        barrier = threading.Barrier(6)
+
+        def get(_):
+            barrier.wait()
+            return client.get(local_api.url("/objects/1"))
+
+        with ThreadPoolExecutor(6) as pool:
+            results = list(pool.map(get, range(6)))
+
+        assert local_api.hits["/objects/1"] == 1
+        assert all(result.json() == {"objectID": 1} for result in results)
+        assert client.single_flight.stats.executions == 1
@@ -0,0 +1,130 @@
+import json
+
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from client.crawler import ObjectCrawler
+from client.snapshot import NULLS, SnapshotBuilder, SnapshotStore
+
+
+API_PREFIX = "/public/collection/v1"
+SAMPLE = json.loads((Path(__file__).parents[2] / "benchmarks" / "data" / "object_sample.json").read_text("utf-8"))
+
+
+def make_record(object_id: int, **fields) -> bytes:
+    """Формирует тело ответа /objects/{id} на основе образца записи."""
+    record = dict(SAMPLE, objectID=object_id, **fields)
+    return json.dumps(record).encode("utf-8")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path / "snapshots"))
+
+
+def write_snapshot(store: SnapshotStore, departments: dict[int, dict[int, bytes]]):
+    """Записывает снимок: для каждого отдела ID и тела записей (None - только ID)."""
+    writer = store.writer()
+    for dep_id, records in departments.items():
+        writer.add_ids(dep_id, records)
+        for object_id, raw in records.items():
+            if raw is not None:
+                writer.add_record(dep_id, object_id, raw)
+    return writer.commit()
+
+
+class TestSnapshotColumns:
+    """Тесты колоночного хранения снимка."""
+
+    def test_columns_and_records(self, store):
+        """Проверяет колонки ID и полей записей, в том числе для объектов без записи."""
+        snapshot = write_snapshot(store, {
+            1: {30: make_record(30, objectBeginDate=1500, isHighlight=True), 10: None,
+                20: make_record(20, objectBeginDate="abc")}
+        })
+        shard = snapshot.shard(1)
+
+        assert list(shard.ids) == [10, 20, 30]
+        assert list(shard.columns["objectBeginDate"]) == [NULLS["i"], NULLS["i"], 1500]
+        assert list(shard.columns["isHighlight"]) == [NULLS["b"], 0, 1]
+        assert shard.digests[0] == 0 and shard.digests[2] != 0
+        assert shard.get_raw(10) is None
+        assert json.loads(shard.get_raw(30))["objectID"] == 30
+        snapshot.close()
+
+    def test_lookup_across_departments(self, store):
+        """Проверяет поиск объекта по отделам и перебор записей без повторов."""
+        snapshot = write_snapshot(store, {
+            1: {1: make_record(1), 5: make_record(5)},
+            2: {3: make_record(3), 5: None, 7: None}
+        })
+
+        assert snapshot.find(3) == 2
+        assert snapshot.find(4) is None
+        assert 7 in snapshot
+        assert snapshot.get(5)["objectID"] == 5
+        assert list(snapshot.object_ids()) == [1, 3, 5, 7]
+        assert [json.loads(raw)["objectID"] for raw in snapshot.records()] == [1, 3, 5]
+        with pytest.raises(KeyError):
+            snapshot.shard(99)
+        snapshot.close()
+
+
+class TestSnapshotDiff:
+    """Тесты сравнения снимков."""
+
+    def test_added_removed_changed(self, store):
+        """Проверяет изменения по отделам, включая появившиеся и исчезнувшие отделы."""
+        base = write_snapshot(store, {
+            1: {1: make_record(1), 2: make_record(2), 3: make_record(3)},
+            2: {10: None}
+        })
+        target = write_snapshot(store, {
+            1: {2: make_record(2), 3: make_record(3, title="new"), 4: make_record(4)},
+            3: {20: None}
+        })
+
+        diff = store.diff(base, target)
+
+        assert diff.departments == {
+            1: {"added": [4], "removed": [1], "changed": [3]},
+            2: {"added": [], "removed": [10], "changed": []},
+            3: {"added": [20], "removed": [], "changed": []}
+        }
+        assert diff.totals() == {"added": 2, "removed": 2, "changed": 1}
+        assert json.loads((target.path / "diff.json").read_text("utf-8"))["totals"] == diff.totals()
+        base.close()
+        target.close()
+
+
+class TestSnapshotBuilder:
+    """Тесты инкрементального построения снимка."""
+
+    def test_incremental_build(self, store, local_api, make_client):
+        """Проверяет копирование неизменившихся записей и запрос новых, в том числе в новом отделе."""
+        write_snapshot(store, {1: {1: make_record(1), 2: make_record(2)}}).close()
+
+        def objects(handler):
+            query = parse_qs(urlsplit(handler.path).query)
+            if "metadataDate" in query:
+                object_ids = [2]
+            else:
+                object_ids = {"1": [1, 2], "2": [3]}[query["departmentIds"][0]]
+            return 200, {}, json.dumps({"total": len(object_ids), "objectIDs": object_ids}).encode()
+
+        local_api.routes[f"{API_PREFIX}/objects"] = objects
+        for object_id in (1, 2, 3):
+            local_api.route(f"{API_PREFIX}/objects/{object_id}", body=make_record(object_id, title=f"v2 {object_id}"))
+
+        crawler = ObjectCrawler(make_client(), base_url=local_api.url(API_PREFIX), workers=2, rate=1000)
+        snapshot, diff = SnapshotBuilder(crawler, store).build([1, 2], records=True)
+
+        assert local_api.hits[f"{API_PREFIX}/objects/1"] == 0
+        assert local_api.hits[f"{API_PREFIX}/objects/2"] == 1
+        assert local_api.hits[f"{API_PREFIX}/objects/3"] == 1
+        assert json.loads(snapshot.get_raw(1))["title"] == SAMPLE["title"]
+        assert json.loads(snapshot.get_raw(3))["title"] == "v2 3"
+        assert diff.totals() == {"added": 1, "removed": 0, "changed": 1}
+        snapshot.close()
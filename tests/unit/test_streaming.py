@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from client.streaming import BITSET_MAX_ID, ObjectIDsStreamParser, object_ids_stats, stream_object_ids_stats
+
+
+OBJECTS_PATH = "/public/collection/v1/objects"
+
+
+def split_chunks(body: bytes, size: int) -> list[bytes]:
+    """Разбивает тело на фрагменты заданного размера."""
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestObjectIDsStreamParser:
+    """Тесты потокового разбора списка objectIDs."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+    def test_ids_and_stats_independent_of_chunks(self, chunk_size):
+        """Проверяет, что результат не зависит от границ фрагментов."""
+        body = json.dumps({"total": 5, "objectIDs": [3, 10, 200, 4000, 50000]}).encode()
+        parser = ObjectIDsStreamParser()
+
+        ids = list(parser.iter_object_ids(split_chunks(body, chunk_size)))
+
+        assert ids == [3, 10, 200, 4000, 50000]
+        stats = parser.stats
+        assert (stats.total, stats.count, stats.min_id, stats.max_id) == (5, 5, 3, 50000)
+        assert stats.is_sorted
+        assert stats.duplicates == stats.non_int == stats.negative == 0
+
+    def test_total_after_array(self):
+        """Проверяет чтение total, расположенного после objectIDs."""
+        parser = ObjectIDsStreamParser()
+        list(parser.iter_object_ids([b'{"objectIDs": [1, 2], "total": 2}']))
+
+        assert parser.stats.total == 2
+
+    def test_violations_counted(self):
+        """Проверяет учет повторов, отрицательных, нецелых элементов и нарушения порядка."""
+        parser = ObjectIDsStreamParser()
+        ids = list(parser.iter_object_ids([b'{"total": 6, "objectIDs": [5, 2, "x", 2, -1, 1.5]}']))
+
+        assert ids == [5, 2, 2, -1]
+        stats = parser.stats
+        assert stats.duplicates == 1
+        assert stats.negative == 1
+        assert stats.non_int == 2
+        assert not stats.is_sorted
+
+    def test_null_object_ids(self):
+        """Проверяет ответ с objectIDs = null."""
+        parser = ObjectIDsStreamParser()
+
+        assert list(parser.iter_object_ids([b'{"total": 0, "objectIDs": null}'])) == []
+        assert parser.stats.is_null
+        assert parser.stats.total == 0
+
+    def test_huge_id_does_not_grow_bitset(self):
+        """Проверяет, что ID больше предела битовой карты учитываются без выделения памяти под карту."""
+        parser = ObjectIDsStreamParser()
+        ids = list(parser.iter_object_ids([b'{"total": 4, "objectIDs": [1, 1000000000000, 2, 1000000000000]}']))
+
+        assert ids == [1, 10 ** 12, 2, 10 ** 12]
+        assert parser.stats.duplicates == 1
+        assert parser.stats.max_id == 10 ** 12
+        assert len(parser._seen._bits) <= (BITSET_MAX_ID >> 3) + 1
+
+    def test_unterminated_array(self):
+        """Проверяет ошибку для оборванного массива."""
+        parser = ObjectIDsStreamParser()
+
+        with pytest.raises(ValueError):
+            list(parser.iter_object_ids([b'{"total": 2, "objectIDs": [1, 2']))
+
+
+class TestObjectIdsStats:
+    """Тесты разбора уже прочитанного тела ответа."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64 * 1024])
+    def test_buffered_body(self, chunk_size):
+        """Проверяет разбор тела фрагментами memoryview при любом размере фрагмента."""
+        body = json.dumps({"total": 3, "objectIDs": [7, 8, 9]}).encode()
+
+        stats = object_ids_stats(body, chunk_size=chunk_size)
+
+        assert (stats.total, stats.count, stats.min_id, stats.max_id) == (3, 3, 7, 9)
+        assert stats.is_sorted
+
+    def test_cached_response_not_downloaded_again(self, local_api, make_client):
+        """Проверяет, что статистика считается по закэшированному телу без повторного запроса."""
+        local_api.route(OBJECTS_PATH, body=b'{"total": 2, "objectIDs": [1, 2]}')
+        client = make_client()
+        client.get(local_api.url(OBJECTS_PATH))
+
+        stats = object_ids_stats(client.get(local_api.url(OBJECTS_PATH)).content)
+
+        assert stats.count == 2
+        assert local_api.hits[OBJECTS_PATH] == 1
+
+
+class TestStreamRequest:
+    """Тесты потокового чтения ответа клиентом API."""
+
+    def test_body_read_from_network_in_chunks(self, local_api, make_client):
+        """Проверяет, что тело потокового ответа не читается заранее и не кэшируется."""
+        ids = list(range(1, 20001))
+        local_api.route(OBJECTS_PATH, body=json.dumps({"total": len(ids), "objectIDs": ids}).encode())
+        client = make_client()
+
+        with client.stream(local_api.url(OBJECTS_PATH)) as response:
+            assert not response._content_consumed
+            stats = stream_object_ids_stats(response, chunk_size=4096)
+
+        assert (stats.total, stats.count, stats.max_id) == (20000, 20000, 20000)
+        assert stats.duplicates == 0
+        assert len(client.cache) == 0
@@ -0,0 +1,127 @@
+import json
+
+import pytest
+import requests
+
+from client.telemetry import ConnectTimings, aggregate, build_event, endpoint_of, percentile, telemetry_files
+from config.logger import TelemetryLogger, get_log_writer
+
+
+API = "https://collectionapi.metmuseum.org/public/collection/v1"
+
+
+@pytest.fixture
+def telemetry(tmp_path, monkeypatch):
+    """Канал телеметрии во временной директории без суффикса процесса-исполнителя."""
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    monkeypatch.delenv("METAPI_WORKER_ID", raising=False)
+    return TelemetryLogger(name="unit_telemetry", log_dir=str(tmp_path))
+
+
+def read_events(telemetry: TelemetryLogger) -> list[dict]:
+    """Дожидается записи событий и читает их из файла телеметрии."""
+    get_log_writer().flush()
+    return [json.loads(line) for line in telemetry.path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestEvents:
+    """Тесты формирования событий телеметрии."""
+
+    @pytest.mark.parametrize("url, endpoint", [
+        (f"{API}/objects?departmentIds=1", "/objects"),
+        (f"{API}/objects/436535", "/objects/{id}"),
+        (f"{API}/search?q=1990", "/search"),
+        ("http://127.0.0.1:8080/", "/")
+    ])
+    def test_endpoint_of(self, url, endpoint):
+        """Проверяет группировку URL по эндпоинтам с заменой числовых сегментов."""
+        assert endpoint_of(url) == endpoint
+
+    def test_build_event(self):
+        """Проверяет поля события, перевод времени в мс и признак нового соединения."""
+        event = build_event(f"{API}/search?q=cat&title=", 200, 0.25, ttfb=0.1, size=42,
+                            timings=ConnectTimings(dns=0.001, connect=0.002), wire_size=20)
+
+        assert event["endpoint"] == "/search"
+        assert event["params"] == {"q": "cat", "title": ""}
+        assert (event["status"], event["cache"], event["bytes"], event["wire_bytes"]) == (200, "miss", 42, 20)
+        assert event["new_connection"]
+        assert event["timings_ms"] == {"dns": 1.0, "connect": 2.0, "tls": 0.0, "ttfb": 100.0, "total": 250.0}
+        assert "error" not in event
+
+    def test_build_error_event(self):
+        """Проверяет событие ошибки запроса."""
+        event = build_event(f"{API}/objects", None, 0.5, error="ConnectionError")
+
+        assert event["status"] is None
+        assert event["error"] == "ConnectionError"
+        assert not event["new_connection"]
+        assert "wire_bytes" not in event
+
+
+class TestReport:
+    """Тесты отчета по задержкам."""
+
+    def test_percentile_nearest_rank(self):
+        """Проверяет перцентили методом ближайшего ранга."""
+        values = [float(i) for i in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 0) == 1.0
+        assert percentile([], 50) == 0.0
+
+    def test_aggregate_rotated_files(self, tmp_path):
+        """Проверяет учет ротированных копий, ошибок, ответов из кэша и поврежденных строк."""
+        events = [
+            build_event(f"{API}/objects/1", 200, 0.1, size=10),
+            build_event(f"{API}/objects/2", 200, 0.3, size=30),
+            build_event(f"{API}/objects/3", 502, 0.2),
+            build_event(f"{API}/objects/4", None, 1.0, error="Timeout"),
+            build_event(f"{API}/objects/1", 200, 0.0, size=10, cache="hit")
+        ]
+        (tmp_path / "telemetry.jsonl").write_text(
+            "\n".join(json.dumps(event) for event in events[:3]) + "\n{broken\n", encoding="utf-8"
+        )
+        (tmp_path / "telemetry.jsonl.1").write_text(
+            "\n".join(json.dumps(event) for event in events[3:]), encoding="utf-8"
+        )
+        (tmp_path / "other.jsonl").write_text(json.dumps(events[0]), encoding="utf-8")
+
+        paths = telemetry_files(str(tmp_path / "telemetry.jsonl"))
+        report = aggregate(paths)
+
+        assert [path.name for path in paths] == ["telemetry.jsonl", "telemetry.jsonl.1"]
+        stats = report["/objects/{id}"]
+        assert (stats["count"], stats["errors"], stats["bytes"]) == (3, 2, 40)
+        assert (stats["p50"], stats["p99"]) == (200.0, 300.0)
+        assert aggregate(paths, include_cache_hits=True)["/objects/{id}"]["count"] == 4
+
+
+class TestTelemetryLogger:
+    """Тесты записи телеметрии клиентом API."""
+
+    def test_events_written_as_json_lines(self, telemetry):
+        """Проверяет запись событий строками JSON с сохранением кириллицы."""
+        telemetry.event(url="/search?q=кот", status=200)
+        telemetry.event(url="/objects", status=None)
+
+        assert read_events(telemetry) == [{"url": "/search?q=кот", "status": 200}, {"url": "/objects", "status": None}]
+        assert "кот" in telemetry.path.read_text(encoding="utf-8")
+
+    def test_client_events(self, telemetry, local_api, make_client):
+        """Проверяет события сетевого запроса, ответа из кэша и ошибки соединения."""
+        local_api.route("/public/collection/v1/objects/1", body=b'{"objectID": 1}')
+        client = make_client(telemetry=telemetry)
+        url = local_api.url("/public/collection/v1/objects/1")
+
+        client.get(url)
+        client.get(url)
+        with pytest.raises(requests.ConnectionError):
+            client.get("http://127.0.0.1:9/public/collection/v1/objects/2", timeout=1)
+
+        miss, hit, error = read_events(telemetry)
+        assert (miss["endpoint"], miss["status"], miss["cache"], miss["bytes"]) == ("/objects/{id}", 200, "miss", 15)
+        assert miss["new_connection"]
+        assert (hit["cache"], hit["bytes"]) == ("hit", 15)
+        assert (error["status"], error["error"]) == (None, "ConnectionError")
@@ -0,0 +1,82 @@
+import pytest
+
+from client.urls import build_url, canonical_url, request_key
+from tests.src.API_param_builder import APIBuilder
+
+
+BASE_API = "https://collectionapi.metmuseum.org/public/collection/v1/search"
+
+
+class TestBuildUrl:
+    """Тесты построения канонических URL с query-параметрами."""
+
+    def test_params_sorted_and_encoded(self):
+        """Проверяет порядок параметров, кодирование и запись логических значений и списков."""
+        url = build_url(BASE_API, q="sun flower", isHighlight=True, departmentIds=[3, 9])
+
+        assert url == f"{BASE_API}?departmentIds=3%7C9&isHighlight=true&q=sun%20flower"
+
+    def test_none_params_skipped(self):
+        """Проверяет, что параметры со значением None пропускаются."""
+        assert build_url(BASE_API, q="cat", title=None) == f"{BASE_API}?q=cat"
+        assert build_url(BASE_API, title=None) == BASE_API
+
+    def test_custom_sep_without_query(self):
+        """Проверяет, что для endpoint без query используется переданный разделитель."""
+        assert build_url(f"{BASE_API}?q=cat", "&", title=True) == f"{BASE_API}?q=cat&title=true"
+        assert build_url(BASE_API, ";", q="cat") == f"{BASE_API};q=cat"
+        assert build_url(BASE_API, None, q="cat") == f"{BASE_API}?q=cat"
+
+    @pytest.mark.parametrize("sep", ["?", "&"])
+    def test_existing_query_merged(self, sep):
+        """Проверяет, что query endpoint объединяется с параметрами при любом разделителе."""
+        url = build_url(f"{BASE_API}?q=cat&hasImages=true", sep, isOnView=True)
+
+        assert url == f"{BASE_API}?hasImages=true&isOnView=true&q=cat"
+
+    def test_params_override_existing_query(self):
+        """Проверяет, что переданные параметры заменяют одноименные параметры endpoint."""
+        assert build_url(f"{BASE_API}?q=cat&title=true", q="dog") == f"{BASE_API}?q=dog&title=true"
+
+    def test_equivalent_params_give_same_object(self):
+        """Проверяет, что эквивалентные наборы параметров дают один объект строки."""
+        first = build_url(BASE_API, q="cat", hasImages=True)
+        second = build_url(BASE_API, hasImages=True, q="cat")
+
+        assert first is second
+
+    def test_unhashable_values(self):
+        """Проверяет построение URL с нехешируемыми значениями параметров."""
+        assert build_url(BASE_API, q={"a"}) == f"{BASE_API}?q=%7B%27a%27%7D"
+
+    def test_build_url_with_id_not_quoted(self):
+        """Проверяет, что ID объекта подставляется в путь без изменений."""
+        assert APIBuilder.build_url_with_id(BASE_API, "-10000000") == f"{BASE_API}/-10000000"
+        assert APIBuilder.build_url_with_id(BASE_API, "") == f"{BASE_API}/"
+
+
+class TestRequestKey:
+    """Тесты канонического ключа запроса."""
+
+    @pytest.mark.parametrize("url", [
+        "HTTPS://CollectionAPI.metmuseum.org:443/public/collection/v1/search?q=cat&hasImages=true",
+        "https://collectionapi.metmuseum.org/public/collection/v1/search?hasImages=true&q=cat#top",
+        "https://collectionapi.metmuseum.org/public/collection/v1/search?q=cat&hasImages=true"
+    ])
+    def test_equivalent_urls_share_key(self, url):
+        """Проверяет, что регистр хоста, порт по умолчанию, фрагмент и порядок параметров не влияют на ключ."""
+        assert request_key(url) == f"{BASE_API}?hasImages=true&q=cat"
+
+    def test_encoding_normalized(self):
+        """Проверяет единообразное кодирование пробела и спецсимволов."""
+        assert canonical_url(f"{BASE_API}?q=sun+flower") == canonical_url(f"{BASE_API}?q=sun%20flower")
+
+    def test_non_default_port_kept(self):
+        """Проверяет, что нестандартный порт остается в ключе."""
+        assert request_key("http://127.0.0.1:8080/objects") == "http://127.0.0.1:8080/objects"
+
+    def test_key_without_host(self):
+        """Проверяет ключ без схемы и хоста для ответов с другого хоста."""
+        assert request_key(f"{BASE_API}?q=cat", with_host=False) == "/public/collection/v1/search?q=cat"
+        assert request_key("http://127.0.0.1:8080/public/collection/v1/objects", with_host=False) == \
+            "/public/collection/v1/objects"